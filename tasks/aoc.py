@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Tools around the day solvers:
+
+    aoc.py generate 06 --scale 100 --seed 1 --knob density=0.02 -o /tmp/day_06_x100.txt.gz
+    aoc.py bench --days 01 02 --repetitions 10 --scale 01=1000 -o benchmarks/baseline.json
+    aoc.py bench --days 01 --scale 01=10000 --engine numpy --no-puzzle
+    aoc.py gate --baseline benchmarks/baseline.json
+    aoc.py scaling --days 01 05 --steps 6 --factor 2
+    aoc.py run-all --workers 4
+    aoc.py startup --days 06 07
+    aoc.py sorts --sizes 1000 1000000 --key-max 99999
+    aoc.py daemon &  (then: aoc_client.py 06 < ../inputs/day_06.txt)
+"""
+import argparse
+import ast
+import json
+import sys
+import time
+from typing import Optional
+
+from aoc_runtime import benchmark, daemon, gate, generators, int_sort, orchestrator, scaling, startup
+
+
+def parse_knobs(knobs: list[str]) -> dict:
+    """['density=0.02', 'report_length=(5, 50)'] -> {'density': 0.02, 'report_length': (5, 50)}"""
+    parsed_knobs = {}
+    for knob in knobs:
+        name, _, value = knob.partition("=")
+        try:
+            parsed_knobs[name] = ast.literal_eval(value)
+        except (SyntaxError, ValueError):
+            parsed_knobs[name] = value
+
+    return parsed_knobs
+
+
+def parse_scales(scales: list[str]) -> dict[str, float]:
+    """['01=1000', '6=0.5'] -> {'01': 1000.0, '06': 0.5}"""
+    parsed_scales = {}
+    for scale in scales:
+        day_nr, _, value = scale.partition("=")
+        parsed_scales[f"{int(day_nr):02d}"] = float(value)
+
+    return parsed_scales
+
+
+# COMMANDS
+def cmd_generate(args: argparse.Namespace):
+    knobs = parse_knobs(args.knob)
+    if args.output:
+        generators.write_input(args.output, args.day, args.seed, args.scale, **knobs)
+    else:
+        for line in generators.generate_lines(args.day, args.seed, args.scale, **knobs):
+            sys.stdout.write(f"{line}\n")
+
+
+def cmd_bench(args: argparse.Namespace):
+    days = [f"{int(day_nr):02d}" for day_nr in args.days] if args.days else None
+    scales = {} if args.no_scaled else {**benchmark.default_scales, **parse_scales(args.scale)}
+    startup_budget_ms = None if args.no_startup else args.startup_budget
+    document = benchmark.run_benchmarks(days, scales, not args.no_puzzle, args.repetitions, args.warmup,
+                                        args.time_budget, startup_budget_ms, args.engine)
+    print(benchmark.format_table(document))
+    if args.output:
+        benchmark.save_baseline(document, args.output)
+        print(f"baseline written to: {args.output}")
+    if not all(report["within_budget"] for report in document["startup"].values()):
+        sys.exit(1)
+
+
+def cmd_gate(args: argparse.Namespace):
+    days = [f"{int(day_nr):02d}" for day_nr in args.days] if args.days else None
+    try:
+        baseline = benchmark.load_baseline(args.baseline)
+    except FileNotFoundError:
+        sys.exit(f"gate: no baseline at {args.baseline} - record one first with: aoc.py bench -o {args.baseline}")
+    result = gate.run_gate(baseline, days, args.repetitions, args.warmup, args.time_budget, args.alpha, args.threshold,
+                           progress=sys.stderr)
+    print(result.report())
+    if not result.passed:
+        sys.exit(1)
+
+
+def cmd_scaling(args: argparse.Namespace):
+    days = [f"{int(day_nr):02d}" for day_nr in args.days] if args.days else None
+    scalings = scaling.scale_days(days, start_scale=args.start_scale, steps=args.steps, factor=args.factor,
+                                  repetitions=args.repetitions, tolerance=args.tolerance, progress=sys.stderr)
+    print(scaling.format_report(scalings))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump([step_scaling.as_dict() for step_scaling in scalings], file, indent=1)
+    if any(step_scaling.flagged for step_scaling in scalings):
+        sys.exit(1)
+
+
+def cmd_run_all(args: argparse.Namespace):
+    days = [f"{int(day_nr):02d}" for day_nr in args.days] if args.days else None
+    start = time.perf_counter()
+    day_runs = orchestrator.run_all(days, args.workers, progress=sys.stderr)
+    print(orchestrator.format_report(day_runs, time.perf_counter() - start))
+    if not all(day_run.passed for day_run in day_runs):
+        sys.exit(1)
+
+
+def cmd_startup(args: argparse.Namespace):
+    days = [f"{int(day_nr):02d}" for day_nr in args.days] if args.days else benchmark.discover_days()
+    reports = startup.measure_days(days, args.repetitions, args.top, args.budget, progress=sys.stderr)
+    print(startup.format_report(reports))
+    if startup.over_budget(reports):
+        sys.exit(1)
+
+
+def cmd_sorts(args: argparse.Namespace):
+    rows = int_sort.compare_sorts(args.sizes, (args.key_min, args.key_max), args.repetitions)
+    print(int_sort.format_comparison(rows))
+
+
+def cmd_daemon(args: argparse.Namespace):
+    days = [f"{int(day_nr):02d}" for day_nr in args.days] if args.days else None
+    daemon.serve(args.socket, days)
+
+
+# MAIN
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="write a seeded synthetic input for a day")
+    generate.add_argument("day", help="day number, e.g. 06")
+    generate.add_argument("--seed", type=int, default=generators.default_seed)
+    generate.add_argument("--scale", type=float, default=1, help="1 is about the size of the real puzzle input")
+    generate.add_argument("--knob", action="append", default=[], metavar="NAME=VALUE",
+                          help="generator specific setting (see aoc_runtime/generators.py), can be repeated")
+    generate.add_argument("-o", "--output", help="output file (.gz/.xz/.bz2 get compressed), stdout if not given")
+    generate.set_defaults(func=cmd_generate)
+
+    bench = commands.add_parser("bench", help="time parse, part a and part b on the puzzle and scaled inputs")
+    bench.add_argument("--days", nargs="+", help="day numbers, all the tasks/day_XX.py if not given")
+    bench.add_argument("--repetitions", type=int, default=benchmark.default_repetitions, help="measured runs per case")
+    bench.add_argument("--warmup", type=int, default=benchmark.default_warmup, help="runs done first, not measured")
+    bench.add_argument("--time-budget", type=float, default=benchmark.default_time_budget,
+                       help="seconds per case after which no more runs are started")
+    bench.add_argument("--scale", action="append", default=[], metavar="DAY=SCALE",
+                       help="scale of the generated input for a day, can be repeated")
+    bench.add_argument("--no-scaled", action="store_true", help="the puzzle inputs only")
+    bench.add_argument("--no-puzzle", action="store_true", help="the generated inputs only")
+    bench.add_argument("--startup-budget", type=float, default=startup.default_startup_budget_ms, metavar="MS",
+                       help="fail if importing a day module takes longer (default: %(default)s ms)")
+    bench.add_argument("--no-startup", action="store_true", help="do not measure the start-up")
+    bench.add_argument("--engine", action="append", default=[], metavar="NAME",
+                       help="also run the days' engine of that name (those which have it), next to the default one")
+    bench.add_argument("-o", "--output", nargs="?", const=str(benchmark.default_baseline_path),
+                       help=f"write the JSON baseline (default: {benchmark.default_baseline_path})")
+    bench.set_defaults(func=cmd_bench)
+
+    gate_ = commands.add_parser("gate", help="fail on a wrong answer or a significant slowdown against a baseline")
+    gate_.add_argument("--baseline", default=str(benchmark.default_baseline_path))
+    gate_.add_argument("--days", nargs="+", help="day numbers, all the tasks/day_XX.py if not given")
+    gate_.add_argument("--repetitions", type=int, help="measured runs per case (default: the baseline's)")
+    gate_.add_argument("--warmup", type=int, help="runs done first, not measured (default: the baseline's)")
+    gate_.add_argument("--time-budget", type=float, default=benchmark.default_time_budget,
+                       help="seconds per case after which no more runs are started")
+    gate_.add_argument("--alpha", type=float, default=gate.default_alpha, help="significance level of the slowdown")
+    gate_.add_argument("--threshold", type=float, default=gate.default_threshold,
+                       help="relative median slowdown tolerated, e.g. 0.05 for 5%%")
+    gate_.set_defaults(func=cmd_gate)
+
+    scaling_ = commands.add_parser("scaling", help="fit the growth exponents of time and memory on growing inputs")
+    scaling_.add_argument("--days", nargs="+", help="day numbers, all the tasks/day_XX.py if not given")
+    scaling_.add_argument("--start-scale", type=float, help="scale of the smallest input (default: per day)")
+    scaling_.add_argument("--steps", type=int, default=scaling.default_steps, help="nr of input sizes")
+    scaling_.add_argument("--factor", type=float, default=scaling.default_factor, help="growth from size to size")
+    scaling_.add_argument("--repetitions", type=int, default=scaling.default_repetitions, help="timed runs per size")
+    scaling_.add_argument("--tolerance", type=float, default=scaling.default_tolerance,
+                          help="how far an exponent may exceed the declared one before it is flagged")
+    scaling_.add_argument("-o", "--output", help="write the points and exponents as JSON")
+    scaling_.set_defaults(func=cmd_scaling)
+
+    run_all = commands.add_parser("run-all", help="solve all the days' puzzle inputs in parallel and check the answers")
+    run_all.add_argument("--days", nargs="+", help="day numbers, all the tasks/day_XX.py if not given")
+    run_all.add_argument("--workers", type=int, help="pool size (default: the nr of cores)")
+    run_all.set_defaults(func=cmd_run_all)
+
+    startup_ = commands.add_parser("startup", help="measure the import time of the day modules, per imported module")
+    startup_.add_argument("--days", nargs="+", help="day numbers, all the tasks/day_XX.py if not given")
+    startup_.add_argument("--repetitions", type=int, default=startup.default_repetitions,
+                          help="imports per day, each in a fresh interpreter")
+    startup_.add_argument("--top", type=int, default=startup.default_top_n, help="modules shown per day")
+    startup_.add_argument("--budget", type=float, default=startup.default_startup_budget_ms, metavar="MS",
+                          help="fail if importing a day module takes longer (default: %(default)s ms)")
+    startup_.set_defaults(func=cmd_startup)
+
+    sorts = commands.add_parser("sorts", help="time timsort against counting and radix sort of array('I') IDs")
+    sorts.add_argument("--sizes", nargs="+", type=int, default=[10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6],
+                       help="nr of values to sort")
+    sorts.add_argument("--key-min", type=int, default=10000, help="smallest value (default: %(default)s)")
+    sorts.add_argument("--key-max", type=int, default=99999, help="biggest value (default: %(default)s)")
+    sorts.add_argument("--repetitions", type=int, default=3, help="runs per method and size, the best one counts")
+    sorts.set_defaults(func=cmd_sorts)
+
+    daemon_ = commands.add_parser("daemon", help="preload the days and solve requests of aoc_client.py")
+    daemon_.add_argument("--socket", default=str(daemon.default_socket_path), help="Unix domain socket to listen on")
+    daemon_.add_argument("--days", nargs="+", help="day numbers to preload, all the tasks/day_XX.py if not given")
+    daemon_.set_defaults(func=cmd_daemon)
+
+    return parser
+
+
+def do_main(argv: Optional[list[str]] = None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    # execute only if run as a script
+    do_main()
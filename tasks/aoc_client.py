@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Thin client of the warm worker (aoc_runtime/daemon.py, started by `aoc.py daemon`) - a drop-in for running a day's
+script, the same arguments, input and output:
+
+    python tasks/aoc_client.py 06 --no-cache < inputs/day_06.txt
+    python tasks/day_06.py --no-cache < inputs/day_06.txt
+
+Only the standard library is imported here (not aoc_runtime), so the client starts fast. The wire format is the one
+described in aoc_runtime/daemon.py. If no daemon is listening, the day's script is run instead.
+"""
+import json
+import os
+import socket
+import struct
+import sys
+from pathlib import Path
+from typing import Optional, Union
+
+# GLOBALS
+tasks_dir = Path(__file__).resolve().parent
+default_cache_dir = Path(os.environ.get("AOC_CACHE_DIR", tasks_dir.parent / ".cache"))
+default_socket_path = Path(os.environ.get("AOC_SOCKET", default_cache_dir / "daemon.sock"))
+length_prefix = struct.Struct("<I")
+
+
+def __receive_exactly(sock: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("the daemon closed the connection")
+        data += chunk
+
+    return bytes(data)
+
+
+def connect(socket_path: Union[str, os.PathLike] = default_socket_path) -> socket.socket:
+    """Raises OSError (e.g. ConnectionRefusedError, FileNotFoundError) if no daemon is listening"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        raise
+
+    return sock
+
+
+def request_solve(sock: socket.socket, day_nr: str, argv: list[str], input_data: Optional[bytes] = None) -> dict:
+    """
+    Have the daemon run day_XX.py with the given arguments - on this process' stdin, or on `input_data` if given.
+    The output goes to this process' stdout/stderr, the reply holds the exit code, answers and timings.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    streams = {"stdout": sys.stdout.fileno(), "stderr": sys.stderr.fileno()}
+    if input_data is None:
+        streams["stdin"] = sys.stdin.fileno()
+
+    header = json.dumps({"day_nr": day_nr, "argv": argv, "cwd": os.getcwd(), "fds": list(streams),
+                         "nbytes": len(input_data or b"")}).encode()
+    socket.send_fds(sock, [length_prefix.pack(len(header)) + header], list(streams.values()))
+    if input_data:
+        sock.sendall(input_data)
+
+    reply_length = length_prefix.unpack(__receive_exactly(sock, length_prefix.size))[0]
+    return json.loads(__receive_exactly(sock, reply_length))
+
+
+# MAIN
+def do_main(argv: Optional[list[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print(__doc__)
+        sys.exit(0 if argv else 2)
+
+    day_nr, script_argv = f"{int(argv[0]):02d}", argv[1:]
+    try:
+        sock = connect()
+    except (OSError, AttributeError):
+        # no daemon (or no Unix domain sockets here) - the script itself then
+        script = str(tasks_dir / f"day_{day_nr}.py")
+        os.execv(sys.executable, [sys.executable, script, *script_argv])
+
+    with sock:
+        reply = request_solve(sock, day_nr, script_argv)
+    sys.exit(reply["exit_code"])
+
+
+if __name__ == "__main__":
+    # execute only if run as a script
+    do_main()
@@ -0,0 +1,39 @@
+"""
+Shared runtime for the tasks/day_XX.py solvers.
+
+Every day module exposes a `solver` (see Solver) - a parse -> part_a -> part_b pipeline working on explicit state,
+so one interpreter can solve any number of inputs back to back:
+
+    from aoc_runtime import load_solver, solve_many
+
+    solver = load_solver(1)
+    for result_a, result_b in solve_many(solver, inputs):
+        ...
+
+Inputs are read in bulk into an InputBuffer (see reader.py) - iterating it gives the lines the parsers expect - or,
+for a streaming solver, read chunk by chunk as an InputStream while the parser goes through it.
+Parsed inputs are cached by content (see parse_cache.py), so a repeated input skips the parsing - and with an
+unchanged solver the solving too (see result_store.py).
+Solvers time their own phases with span()/timed() (see timing.py), nested under the runtime's read/parse/part spans,
+and count their hot-path work with counters.count() (see counters.py).
+
+Every day module imports this package, so it only brings what a day module needs to be defined - the runner, the
+caches and the measuring tools are imported from their own modules, when they are used (see startup.py).
+"""
+from aoc_runtime import counters
+from aoc_runtime.codec import ParsedCodec
+from aoc_runtime.reader import (InputBuffer, InputStream, InputTimeoutError, read_path, read_stdin, read_stream,
+                                stream_input, stream_path, stream_stdin)
+from aoc_runtime.solver import Solver, load_solver, solve_many
+from aoc_runtime.timing import Tracer, span, timed
+
+__all__ = ["InputBuffer", "InputStream", "InputTimeoutError", "ParsedCodec", "Solver", "Tracer", "counters",
+           "load_solver", "read_path", "read_stdin", "read_stream", "run_solver", "solve_many", "span", "stream_input",
+           "stream_path", "stream_stdin", "timed"]
+
+
+def run_solver(solver: Solver, *args, **kwargs):
+    """runner.run_solver() - the runner comes in with the run, not with the import of a day module"""
+    from aoc_runtime.runner import run_solver
+
+    return run_solver(solver, *args, **kwargs)
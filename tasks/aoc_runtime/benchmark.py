@@ -0,0 +1,195 @@
+"""
+Benchmark suite: every day's parse, part a and part b, N times, on the real puzzle input and on generated scaled
+inputs. Warm-up runs are done first and thrown away; the rest is summarized as min/median/p95 of wall and CPU time.
+
+Each day's start-up (the import of its module, see startup.py) is measured too, against a budget.
+The alternative engines of a day (see Solver) asked for are benchmarked on the same inputs, as cases of their own.
+
+The result is a JSON document (a baseline, benchmarks/baseline.json by default) - raw samples included, so later
+runs can be compared against it statistically:
+
+    {"meta": {...},
+     "cases": {"01/puzzle": {"day_nr": "01", "input": "puzzle", "answers": [a, b],
+                             "phases": {"parse": {"wall_ns": [...], "cpu_ns": [...],
+                                                  "wall": {"min": .., "median": .., "p95": ..}, "cpu": {...}},
+                                        "part_a": {...}, "part_b": {...}}},
+               "01/x100": {...},
+               "01/x100@numpy": {..., "engine": "numpy"}},
+     "startup": {"01": {"import_ns": [...], "import_ms": .., "budget_ms": .., "within_budget": true, ...}}}
+"""
+import contextlib
+import datetime
+import gc
+import glob
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from aoc_runtime import generators, startup
+from aoc_runtime.reader import InputBuffer, read_path
+from aoc_runtime.result_store import inputs_dir, repo_dir
+from aoc_runtime.solver import Solver, load_solver
+
+# GLOBALS
+benchmarks_dir = repo_dir / "benchmarks"
+default_baseline_path = benchmarks_dir / "baseline.json"
+default_repetitions = 5
+default_warmup = 1
+# Stop repeating a case once it took this long (at least one measured run is always done) - day_06 takes minutes
+default_time_budget = 60.0
+# The scaled input benchmarked per day - big enough to show the growth, small enough to finish
+default_scales = {"01": 1000, "02": 100, "03": 100, "04": 10, "05": 10, "06": 0.25, "07": 1}
+phases = ("parse", "part_a", "part_b")
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Linear interpolation between the closest ranks"""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    return {"min": min(values), "median": statistics.median(values), "p95": percentile(values, 95)}
+
+
+def discover_days() -> list[str]:
+    """Day numbers of all the tasks/day_XX.py modules"""
+    tasks_dir = Path(__file__).resolve().parents[1]
+    return sorted(Path(path).stem.split("_")[1] for path in glob.glob(str(tasks_dir / "day_[0-9][0-9].py")))
+
+
+def puzzle_input(day_nr: str) -> Optional[InputBuffer]:
+    path = inputs_dir / f"day_{day_nr}.txt"
+    return read_path(path) if path.exists() else None
+
+
+def scaled_input(day_nr: str, scale: float, seed: int = generators.default_seed, **knobs) -> InputBuffer:
+    return InputBuffer.from_text(generators.generate_text(day_nr, seed, scale, **knobs))
+
+
+def __run_once(solver: Solver, input_buffer: InputBuffer) -> tuple[dict[str, tuple[int, int]], tuple[Any, Any]]:
+    timings = {}
+    gc.collect()
+
+    wall_start, cpu_start = time.perf_counter_ns(), time.process_time_ns()
+    state = solver.parse(input_buffer)
+    timings["parse"] = (time.perf_counter_ns() - wall_start, time.process_time_ns() - cpu_start)
+
+    answers = []
+    for phase in ("part_a", "part_b"):
+        wall_start, cpu_start = time.perf_counter_ns(), time.process_time_ns()
+        answers.append(getattr(solver, phase)(state))
+        timings[phase] = (time.perf_counter_ns() - wall_start, time.process_time_ns() - cpu_start)
+
+    return timings, tuple(answers)
+
+
+def bench_case(solver: Solver, input_buffer: InputBuffer, repetitions: int = default_repetitions,
+               warmup: int = default_warmup, time_budget: float = default_time_budget) -> dict:
+    """Time one day on one input - the solvers' own printing is silenced meanwhile"""
+    samples = {phase: {"wall_ns": [], "cpu_ns": []} for phase in phases}
+    answers = None
+    started = time.perf_counter()
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for run in range(warmup + repetitions):
+            timings, answers = __run_once(solver, input_buffer)
+            if run >= warmup:
+                for phase, (wall_ns, cpu_ns) in timings.items():
+                    samples[phase]["wall_ns"].append(wall_ns)
+                    samples[phase]["cpu_ns"].append(cpu_ns)
+                if time.perf_counter() - started > time_budget:
+                    break
+
+    for phase_samples in samples.values():
+        phase_samples["wall"] = summarize(phase_samples["wall_ns"])
+        phase_samples["cpu"] = summarize(phase_samples["cpu_ns"])
+
+    return {"day_nr": solver.day_nr, "answers": list(answers), "phases": samples}
+
+
+def benchmark_cases(days: Iterable[str], scales: Optional[dict[str, float]] = None,
+                    include_puzzle: bool = True) -> Iterable[tuple[str, str, InputBuffer]]:
+    """(day_nr, input name, input) of each case - 'puzzle' for inputs/day_XX.txt, 'x<scale>' for the generated ones"""
+    scales = default_scales if scales is None else scales
+    for day_nr in days:
+        if include_puzzle and (input_buffer := puzzle_input(day_nr)) is not None:
+            yield day_nr, "puzzle", input_buffer
+        if day_nr in scales:
+            yield day_nr, f"x{scales[day_nr]:g}", scaled_input(day_nr, scales[day_nr])
+
+
+def case_key(day_nr: str, input_name: str, engine: str = "default") -> str:
+    """'01/x100' - or '01/x100@numpy' for an engine other than the default one"""
+    return f"{day_nr}/{input_name}" if engine == "default" else f"{day_nr}/{input_name}@{engine}"
+
+
+def run_benchmarks(days: Optional[Iterable[str]] = None, scales: Optional[dict[str, float]] = None,
+                   include_puzzle: bool = True, repetitions: int = default_repetitions,
+                   warmup: int = default_warmup, time_budget: float = default_time_budget,
+                   startup_budget_ms: Optional[float] = startup.default_startup_budget_ms,
+                   engines: Iterable[str] = (), progress=sys.stderr) -> dict:
+    """
+    All the cases of the given days - and their start-up, unless startup_budget_ms is None.
+    Each case is run by the default engine, and by those of the given `engines` the day has.
+    """
+    days = list(days) if days else discover_days()
+    document = {"meta": {"created": datetime.datetime.now().isoformat(timespec="seconds"),
+                         "python": platform.python_version(), "implementation": platform.python_implementation(),
+                         "machine": platform.machine(), "system": platform.system(), "cpu_count": os.cpu_count(),
+                         "repetitions": repetitions, "warmup": warmup, "startup_budget_ms": startup_budget_ms},
+                "cases": {}, "startup": {}}
+
+    if startup_budget_ms is not None:
+        for report in startup.measure_days(days, budget_ms=startup_budget_ms, progress=progress):
+            document["startup"][report.day_nr] = report.as_dict()
+
+    for day_nr, input_name, input_buffer in benchmark_cases(days, scales, include_puzzle):
+        solver = load_solver(day_nr)
+        for engine in [solver.engine, *(engine for engine in engines if engine in solver.engines)]:
+            case_name = case_key(day_nr, input_name, engine)
+            if progress:
+                print(f"benchmarking {case_name} ...", file=progress, flush=True)
+            case = bench_case(solver.with_engine(engine), input_buffer, repetitions, warmup, time_budget)
+            case["input"] = input_name
+            if engine != "default":
+                case["engine"] = engine
+            document["cases"][case_name] = case
+
+    return document
+
+
+def format_table(document: dict) -> str:
+    lines = [f"{'case':<20} {'phase':<7} {'runs':>4} {'wall min':>12} {'wall median':>12} {'wall p95':>12} "
+             f"{'cpu median':>12}"]
+    for case_name, case in document["cases"].items():
+        for phase, phase_samples in case["phases"].items():
+            wall, cpu = phase_samples["wall"], phase_samples["cpu"]
+            lines.append(f"{case_name:<20} {phase:<7} {len(phase_samples['wall_ns']):>4} "
+                         f"{wall['min'] / 1e9:>12.6f} {wall['median'] / 1e9:>12.6f} {wall['p95'] / 1e9:>12.6f} "
+                         f"{cpu['median'] / 1e9:>12.6f}")
+
+    for day_nr, report in document.get("startup", {}).items():
+        lines.append(f"day_{day_nr} start-up: {report['import_ms']:.2f} ms (budget: {report['budget_ms']:.0f} ms)"
+                     f"{'' if report['within_budget'] else '  OVER BUDGET'}")
+
+    return "\n".join(lines)
+
+
+def save_baseline(document: dict, path: Union[str, os.PathLike] = default_baseline_path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=1) + "\n")
+
+
+def load_baseline(path: Union[str, os.PathLike] = default_baseline_path) -> dict:
+    return json.loads(Path(path).read_text())
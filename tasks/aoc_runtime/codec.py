@@ -0,0 +1,55 @@
+"""
+The binary forms the days keep their parsed state in (see parse_cache.py) - a ParsedCodec per day, put together from
+the building blocks below. Cheap to import: every day module does.
+"""
+import struct
+from array import array
+from typing import Any, Callable, Iterable, Union
+
+# GLOBALS
+# nr of rows, nr of values - both followed by the respective arrays
+int_rows_header = struct.Struct("<QQ")
+
+
+class ParsedCodec:
+    """
+    How one day stores its parsed state in the cache:
+        dump(state) -> bytes
+        load(buffer) -> state
+    The buffer load() gets is a memoryview over the memory-mapped cache file, unmapped once load() returns - the state
+    must not keep views into it: copy out what you need (arrays included).
+    Bump the version whenever the parser or the format changes - old entries are then simply not found anymore.
+    """
+    def __init__(self, version: Union[int, str], dump: Callable[[Any], bytes], load: Callable[[memoryview], Any]):
+        self.version = version
+        self.dump = dump
+        self.load = load
+
+
+# Building blocks for the codecs
+def dump_int_rows(rows: Iterable[Iterable[int]]) -> bytes:
+    """Rows of ints, each of its own length, as two flat arrays: row offsets (CSR like) and int64 values"""
+    offsets = array("Q", [0])
+    values = array("q")
+    for row in rows:
+        values.extend(row)
+        offsets.append(len(values))
+
+    return int_rows_header.pack(len(offsets) - 1, len(values)) + offsets.tobytes() + values.tobytes()
+
+
+def load_int_rows(buffer: memoryview) -> list[list[int]]:
+    nr_rows, nr_values = int_rows_header.unpack_from(buffer)
+    offsets_end = int_rows_header.size + (nr_rows + 1) * 8
+    offsets = buffer[int_rows_header.size:offsets_end].cast("Q")
+    values = buffer[offsets_end:offsets_end + nr_values * 8].cast("q")
+
+    return [values[offsets[i]:offsets[i + 1]].tolist() for i in range(nr_rows)]
+
+
+def dump_lines(lines: Iterable[str]) -> bytes:
+    return "\n".join(lines).encode()
+
+
+def load_lines(buffer: memoryview) -> list[str]:
+    return str(buffer, "utf-8").split("\n") if len(buffer) else []
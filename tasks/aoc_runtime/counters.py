@@ -0,0 +1,48 @@
+"""
+Hot-path counters - how much work a solver did, not only how long it took.
+
+The solvers count inside `if __debug__:` blocks, via the module attribute (not an imported name):
+
+    if __debug__:
+        counters.count("make_step")
+
+- disabled (the default): `count` is a no-op, so a counter costs one call which returns at once
+- enabled (enable(), e.g. the runners' --counters): every call adds to `counts`
+- `python -O`: the `if __debug__:` blocks are compiled out, the counters cost nothing at all
+"""
+from collections import Counter
+
+# GLOBALS
+enabled = False
+counts: Counter = Counter()
+
+
+def __noop(name: str, n: int = 1):
+    pass
+
+
+def __count(name: str, n: int = 1):
+    counts[name] += n
+
+
+count = __noop
+
+
+def enable():
+    global enabled, count
+    enabled = True
+    count = __count
+
+
+def disable():
+    global enabled, count
+    enabled = False
+    count = __noop
+
+
+def reset():
+    counts.clear()
+
+
+def report(indent: str = "    ") -> str:
+    return "\n".join(f"{indent}{name}: {value}" for name, value in counts.items())
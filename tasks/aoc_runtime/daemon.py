@@ -0,0 +1,172 @@
+"""
+A warm worker: a long-lived process which imports the day modules (and so numpy, more_itertools, ...) once and then
+solves requests coming in over a Unix domain socket - without paying the interpreter start-up and imports each time.
+
+Every request is served in a forked child, which runs exactly what the day's script would (run_solver, with the
+script's arguments) - in the client's working directory, on the client's stdin/stdout/stderr (passed over the socket
+as file descriptors) or on input bytes sent along. The answers and timings go back as the reply:
+
+    request:  4 byte length, JSON header {"day_nr", "argv", "cwd", "fds": ["stdin", "stdout", "stderr"], "nbytes"}
+              (with the file descriptors attached), then `nbytes` of input (only when no stdin is passed)
+    reply:    4 byte length, JSON {"exit_code", "result_a", "result_b", "timings": {span path: stats}}
+
+tasks/aoc_client.py is the thin client; `aoc.py daemon` starts the server.
+"""
+import importlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import struct
+import sys
+import traceback
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable, Optional, Union
+
+from aoc_runtime import benchmark
+from aoc_runtime.parse_cache import default_cache_dir
+from aoc_runtime.reader import input_timeout
+from aoc_runtime.runner import run_solver
+from aoc_runtime.timing import Tracer
+
+# GLOBALS
+default_socket_path = Path(os.environ.get("AOC_SOCKET", default_cache_dir / "daemon.sock"))
+length_prefix = struct.Struct("<I")
+max_fds = 3
+# The solvers import these only when they run (see startup.py) - the daemon has them ready beforehand
+preload_dependencies = ("numpy", "more_itertools")
+
+
+def receive_exactly(stream: io.BufferedIOBase, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ConnectionError(f"connection closed after {len(data)} of {size} bytes")
+    return data
+
+
+def send_message(sock: socket.socket, message: dict, fds: Iterable[int] = (), payload: bytes = b""):
+    header = json.dumps(message).encode()
+    socket.send_fds(sock, [length_prefix.pack(len(header)) + header], list(fds))
+    if payload:
+        sock.sendall(payload)
+
+
+def receive_message(sock: socket.socket) -> tuple[dict, list[int], bytes]:
+    """The header, the attached file descriptors and the payload (header["nbytes"] of it, if any)"""
+    prefix, fds, _, _ = socket.recv_fds(sock, length_prefix.size, max_fds)
+    if len(prefix) != length_prefix.size:
+        raise ConnectionError("connection closed before the message length")
+    with sock.makefile("rb") as stream:
+        message = json.loads(receive_exactly(stream, length_prefix.unpack(prefix)[0]))
+        payload = receive_exactly(stream, message.get("nbytes", 0))
+
+    return message, fds, payload
+
+
+def preload_days(days: Optional[Iterable[str]] = None) -> dict[str, ModuleType]:
+    """Import the day modules and their heavy dependencies up front - which is what the daemon is there for"""
+    for dependency in preload_dependencies:
+        try:
+            importlib.import_module(dependency)
+        except ImportError:
+            pass
+
+    days = list(days) if days else benchmark.discover_days()
+    return {day_nr: importlib.import_module(f"day_{day_nr}") for day_nr in days}
+
+
+class SolveHandler(socketserver.BaseRequestHandler):
+    """One request, in its own forked child: the client's streams become this process' streams, then run_solver"""
+    server: "SolverDaemon"
+
+    def handle(self):
+        message, fds, payload = receive_message(self.request)
+        streams = dict(zip(message.get("fds", []), fds))
+        reply = {"exit_code": 0, "result_a": None, "result_b": None, "timings": {}}
+
+        module = self.server.modules.get(message["day_nr"])
+        if module is None:
+            reply["exit_code"] = 2
+            message["argv"] = []
+        self.__redirect(streams, payload)
+
+        tracer = Tracer()
+        try:
+            if module is None:
+                print(f"day {message['day_nr']} is not loaded in the daemon", file=sys.stderr)
+            else:
+                os.chdir(message["cwd"])
+                result_a, result_b = run_solver(module.solver, getattr(module, "input_timeout", input_timeout),
+                                                message["argv"], tracer)
+                reply["result_a"], reply["result_b"] = str(result_a), str(result_b)
+        except SystemExit as exc:
+            reply["exit_code"] = exc.code if isinstance(exc.code, int) else 1
+        except Exception:
+            traceback.print_exc()
+            reply["exit_code"] = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+        reply["timings"] = {path: stats.as_dict() for path, stats in tracer.stats.items()}
+        send_message(self.request, reply)
+
+    @staticmethod
+    def __redirect(streams: dict[str, int], payload: bytes):
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for name, target_fd in (("stdin", 0), ("stdout", 1), ("stderr", 2)):
+            if name in streams:
+                os.dup2(streams[name], target_fd)
+                os.close(streams[name])
+        if "stdin" not in streams:
+            sys.stdin = io.TextIOWrapper(io.BytesIO(payload))
+
+
+class SolverDaemon(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    def __init__(self, socket_path: Union[str, os.PathLike], modules: dict[str, ModuleType]):
+        self.modules = modules
+        super().__init__(str(socket_path), SolveHandler)
+
+
+def __remove_stale_socket(socket_path: Path):
+    """A socket file left behind by a daemon which is gone - one which still answers is an error"""
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except ConnectionRefusedError:
+            socket_path.unlink()
+            return
+    raise RuntimeError(f"a daemon is already listening on {socket_path}")
+
+
+def serve(socket_path: Union[str, os.PathLike] = default_socket_path, days: Optional[Iterable[str]] = None):
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"):
+        raise RuntimeError("the daemon needs Unix domain sockets and fork()")
+
+    socket_path = Path(socket_path)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    __remove_stale_socket(socket_path)
+
+    modules = preload_days(days)
+    daemon_pid = os.getpid()
+
+    def stop(signal_nr, frame):
+        # the forked children inherit this - only the daemon itself stops serving
+        if os.getpid() == daemon_pid:
+            raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, stop)
+
+    with SolverDaemon(socket_path, modules) as server:
+        print(f"serving days {', '.join(modules)} on {socket_path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
@@ -0,0 +1,131 @@
+"""
+Sorting more integers than fit in memory: they are collected `run_size` at a time, each batch is sorted and written to
+a file of its own (a sorted run), then all the runs are read back in chunks and k-way merged into one sorted stream.
+Memory stays at one batch while writing, and at one chunk per run while merging. No more than `max_fan_in` runs are
+open at once: with more of them, groups of runs are first merged into longer runs, as many passes as it takes.
+
+    with tempfile.TemporaryDirectory() as directory:
+        writer = RunWriter(directory, "left")
+        for value in values:
+            writer.append(value)
+        for value in merge_runs(writer.close()):
+            ...
+"""
+import heapq
+import itertools
+import os
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+# GLOBALS
+# values per sorted run (8 MiB of int64)
+default_run_size = 1 << 20
+# values read from a run at once while merging
+default_chunk_size = 1 << 14
+# runs merged at once - each is an open file and a chunk in memory (and the usual limit is 1024 open files)
+default_max_fan_in = 128
+
+
+class RunWriter:
+    """Collects values, writes every `run_size` of them sorted to a run file of its own"""
+    def __init__(self, directory: Union[str, os.PathLike], name: str, run_size: int = default_run_size,
+                 typecode: str = "q"):
+        self.directory = Path(directory)
+        self.name = name
+        self.run_size = run_size
+        self.typecode = typecode
+        self.paths: list[Path] = []
+        self.count = 0
+        self._buffer: list[int] = []
+
+    def append(self, value: int):
+        self._buffer.append(value)
+        if len(self._buffer) >= self.run_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+
+        self._buffer.sort()
+        path = self.directory / f"{self.name}-{len(self.paths):06d}.run"
+        with open(path, "wb") as file:
+            array(self.typecode, self._buffer).tofile(file)
+        self.paths.append(path)
+        self.count += len(self._buffer)
+        self._buffer = []
+
+    def close(self) -> list[Path]:
+        """The run files, the last partial batch written too"""
+        self.flush()
+        return self.paths
+
+
+def read_run(path: Union[str, os.PathLike], typecode: str = "q", chunk_size: int = default_chunk_size) -> Iterator[int]:
+    """The values of one run file, read `chunk_size` at a time"""
+    chunk_bytes = chunk_size * array(typecode).itemsize
+    with open(path, "rb") as file:
+        while data := file.read(chunk_bytes):
+            yield from array(typecode, data)
+
+
+def write_run(path: Union[str, os.PathLike], values: Iterable[int], typecode: str = "q",
+              chunk_size: int = default_chunk_size):
+    """Write already sorted values as a run file, `chunk_size` at a time"""
+    values = iter(values)
+    with open(path, "wb") as file:
+        while chunk := array(typecode, itertools.islice(values, chunk_size)):
+            chunk.tofile(file)
+
+
+def merge_runs(paths: list[Union[str, os.PathLike]], typecode: str = "q", chunk_size: int = default_chunk_size,
+               max_fan_in: Optional[int] = None) -> Iterator[int]:
+    """
+    All the values of the sorted runs, as one sorted stream.
+    With more than `max_fan_in` runs (default_max_fan_in if not given), groups of them get merged into longer runs
+    first - written to a directory next to the given runs, removed once the stream is done (the given runs are left as
+    they are).
+    """
+    max_fan_in = max_fan_in or default_max_fan_in
+    if max_fan_in < 2:
+        raise ValueError(f"max_fan_in must be at least 2, not {max_fan_in}")
+    if len(paths) <= max_fan_in:
+        return __merge(paths, typecode, chunk_size)
+
+    return __merge_in_passes(paths, typecode, chunk_size, max_fan_in)
+
+
+def __merge(paths: list[Union[str, os.PathLike]], typecode: str, chunk_size: int) -> Iterator[int]:
+    if len(paths) == 1:
+        return read_run(paths[0], typecode, chunk_size)
+
+    return heapq.merge(*(read_run(path, typecode, chunk_size) for path in paths))
+
+
+def __merge_in_passes(paths: list[Union[str, os.PathLike]], typecode: str, chunk_size: int,
+                      max_fan_in: int) -> Iterator[int]:
+    # only the merges with that many runs need it
+    import shutil
+    import tempfile
+
+    directory = Path(tempfile.mkdtemp(prefix="merge-", dir=Path(paths[0]).parent))
+    try:
+        for pass_nr in itertools.count():
+            if len(paths) <= max_fan_in:
+                break
+            merged_paths = []
+            for group_nr, start in enumerate(range(0, len(paths), max_fan_in)):
+                merged_path = directory / f"pass-{pass_nr}-{group_nr:06d}.run"
+                write_run(merged_path, __merge(paths[start:start + max_fan_in], typecode, chunk_size), typecode,
+                          chunk_size)
+                merged_paths.append(merged_path)
+            # the previous pass' runs are merged into these now
+            if pass_nr > 0:
+                for path in paths:
+                    os.remove(path)
+            paths = merged_paths
+
+        yield from __merge(paths, typecode, chunk_size)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
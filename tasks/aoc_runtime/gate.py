@@ -0,0 +1,164 @@
+"""
+Regression gate: re-run the days and fail on a wrong answer or on a significant slowdown against a baseline.
+
+- answers: the puzzle input's against results/day_XX.txt, a generated input's against the baseline's answers
+- start-up: each day's import time against the baseline's start-up budget (see startup.py)
+- timing: per phase, the new wall time samples against the baseline's ones - a slowdown counts if the one-sided
+  Mann-Whitney U test says the new runs are slower (p < alpha) and the median got slower by more than `threshold`
+  (with fewer than `min_samples` runs on either side the test can not tell, so only the answers are gated)
+"""
+import math
+import statistics
+from typing import Iterable, Optional
+
+from aoc_runtime import benchmark, startup
+from aoc_runtime.result_store import read_results_file
+from aoc_runtime.solver import load_solver
+
+# GLOBALS
+default_alpha = 0.05
+default_threshold = 0.05
+min_samples = 3
+
+
+def slower_p_value(baseline: list[float], current: list[float]) -> float:
+    """One-sided Mann-Whitney U test (normal approximation, tie corrected) - small if `current` tends to be bigger"""
+    n_baseline, n_current = len(baseline), len(current)
+    n = n_baseline + n_current
+    ordered = sorted([(value, 0) for value in baseline] + [(value, 1) for value in current])
+
+    rank_sum_current = 0.0
+    tie_correction = 0
+    index = 0
+    while index < n:
+        end = index
+        while end + 1 < n and ordered[end + 1][0] == ordered[index][0]:
+            end += 1
+        tied = end - index + 1
+        average_rank = (index + end) / 2 + 1
+        rank_sum_current += average_rank * sum(side for _, side in ordered[index:end + 1])
+        tie_correction += tied ** 3 - tied
+        index = end + 1
+
+    u_current = rank_sum_current - n_current * (n_current + 1) / 2
+    mean = n_baseline * n_current / 2
+    variance = n_baseline * n_current / 12 * ((n + 1) - tie_correction / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z = (u_current - mean - 0.5) / math.sqrt(variance)
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+class PhaseComparison:
+    """One phase of one case: baseline vs. current median wall time"""
+    def __init__(self, case_name: str, phase: str, baseline_ns: list[int], current_ns: list[int],
+                 alpha: float, threshold: float):
+        self.case_name = case_name
+        self.phase = phase
+        self.baseline_median = statistics.median(baseline_ns)
+        self.current_median = statistics.median(current_ns)
+        self.speedup = self.baseline_median / self.current_median if self.current_median else math.inf
+        self.testable = min(len(baseline_ns), len(current_ns)) >= min_samples
+        self.p_value = slower_p_value(baseline_ns, current_ns) if self.testable else None
+        self.slowdown = (self.testable and self.p_value < alpha
+                         and self.current_median > self.baseline_median * (1 + threshold))
+
+
+class GateResult:
+    def __init__(self):
+        self.comparisons: list[PhaseComparison] = []
+        self.answer_failures: list[str] = []
+        self.checked_cases: list[str] = []
+        self.startup_reports: list[startup.StartupReport] = []
+
+    @property
+    def slowdowns(self) -> list[PhaseComparison]:
+        return [comparison for comparison in self.comparisons if comparison.slowdown]
+
+    @property
+    def passed(self) -> bool:
+        return not self.answer_failures and not self.slowdowns and not startup.over_budget(self.startup_reports)
+
+    def report(self) -> str:
+        lines = [f"{'case':<20} {'phase':<7} {'baseline':>12} {'current':>12} {'speedup':>8} {'p-value':>8}  verdict"]
+        for comparison in self.comparisons:
+            if comparison.slowdown:
+                verdict = "SLOWER"
+            elif not comparison.testable:
+                verdict = "too few runs"
+            else:
+                verdict = "ok"
+            p_value = f"{comparison.p_value:.4f}" if comparison.p_value is not None else "-"
+            lines.append(f"{comparison.case_name:<20} {comparison.phase:<7} "
+                         f"{comparison.baseline_median / 1e9:>12.6f} {comparison.current_median / 1e9:>12.6f} "
+                         f"{comparison.speedup:>7.2f}x {p_value:>8}  {verdict}")
+        lines.append(f"answers checked: {', '.join(self.checked_cases)}")
+        if self.startup_reports:
+            lines.append(startup.format_report(self.startup_reports, show_modules=False))
+        for failure in self.answer_failures:
+            lines.append(f"WRONG ANSWER: {failure}")
+        lines.append("gate: " + ("passed" if self.passed else "FAILED"))
+
+        return "\n".join(lines)
+
+
+def check_answers(case_name: str, day_nr: str, input_name: str, answers: list,
+                  baseline_case: Optional[dict]) -> list[str]:
+    if input_name == "puzzle":
+        expected = read_results_file(day_nr)
+        expected = [expected.get("a"), expected.get("b")] if expected else None
+        source = f"results/day_{day_nr}.txt"
+    else:
+        expected = [str(answer) for answer in baseline_case["answers"]] if baseline_case else None
+        source = "baseline"
+    if expected is None:
+        return []
+
+    return [f"{case_name} result_{part}: {answer} (expected {wanted}, from {source})"
+            for part, answer, wanted in zip("ab", answers, expected) if str(answer) != wanted]
+
+
+def run_gate(baseline: dict, days: Optional[Iterable[str]] = None, repetitions: Optional[int] = None,
+             warmup: Optional[int] = None, time_budget: float = benchmark.default_time_budget,
+             alpha: float = default_alpha, threshold: float = default_threshold, progress=None) -> GateResult:
+    """
+    Re-run the baseline's cases (with its repetitions and warm-up, unless given) - the days the baseline has no cases
+    for get their puzzle input run, for the answers only
+    """
+    days = list(days) if days else benchmark.discover_days()
+    repetitions = repetitions or baseline["meta"]["repetitions"]
+    warmup = baseline["meta"]["warmup"] if warmup is None else warmup
+    baseline_cases = baseline["cases"]
+
+    cases = [(case_name, case["day_nr"], case["input"], case.get("engine"))
+             for case_name, case in baseline_cases.items() if case["day_nr"] in days]
+    cases += [(f"{day_nr}/puzzle", day_nr, "puzzle", None) for day_nr in days
+              if not any(case_day_nr == day_nr for _, case_day_nr, _, _ in cases)]
+
+    result = GateResult()
+    startup_budget_ms = baseline["meta"].get("startup_budget_ms")
+    if startup_budget_ms is not None:
+        result.startup_reports = startup.measure_days(days, budget_ms=startup_budget_ms, progress=progress)
+
+    for case_name, day_nr, input_name, engine in cases:
+        if input_name == "puzzle":
+            input_buffer = benchmark.puzzle_input(day_nr)
+            if input_buffer is None:
+                continue
+        else:
+            input_buffer = benchmark.scaled_input(day_nr, float(input_name[1:]))
+        if progress:
+            print(f"gating {case_name} ...", file=progress, flush=True)
+
+        baseline_case = baseline_cases.get(case_name)
+        case = benchmark.bench_case(load_solver(day_nr, engine), input_buffer, repetitions if baseline_case else 1,
+                                    warmup if baseline_case else 0, time_budget)
+        result.checked_cases.append(case_name)
+        result.answer_failures += check_answers(case_name, day_nr, input_name, case["answers"], baseline_case)
+        if baseline_case:
+            for phase, phase_samples in case["phases"].items():
+                result.comparisons.append(PhaseComparison(case_name, phase, baseline_case["phases"][phase]["wall_ns"],
+                                                          phase_samples["wall_ns"], alpha, threshold))
+
+    return result
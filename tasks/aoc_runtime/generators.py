@@ -0,0 +1,272 @@
+"""
+Seeded synthetic puzzle inputs of any size.
+
+Each generate_day_XX(rng, scale, **knobs) yields the input's lines. With scale=1 the input is about as big as the
+real puzzle input (inputs/day_XX.txt); the size grows linearly with the scale (for the grids - their area does).
+The knobs tune the shape (report length, grid density, rule count, operand count, ...) - see each generator.
+
+    text = generate_text("06", seed=1, scale=100, density=0.02)
+    write_input("/tmp/day_06_x100.txt.gz", "06", seed=1, scale=100)
+"""
+import bz2
+import gzip
+import lzma
+import math
+import os
+import random
+from typing import Callable, Iterator, Optional, Union
+
+# GLOBALS
+default_seed = 2024
+# up, right, down, left - the guard's (day 06) turns to the right
+guard_directions = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def generate_day_01(rng: random.Random, scale: float = 1, id_min: int = 10000, id_max: int = 99999,
+                    overlap: float = 0.25) -> Iterator[str]:
+    """
+    Two columns of location IDs, 1000 rows per scale unit.
+    overlap - the fraction of the right column picked from the left column's IDs (so the similarity is not 0)
+    """
+    rows = max(1, round(1000 * scale))
+    left_column = [rng.randint(id_min, id_max) for _ in range(rows)]
+    for left_id in left_column:
+        right_id = rng.choice(left_column) if rng.random() < overlap else rng.randint(id_min, id_max)
+        yield f"{left_id}   {right_id}"
+
+
+def generate_day_02(rng: random.Random, scale: float = 1, report_length: tuple[int, int] = (5, 8),
+                    safe_ratio: float = 0.3, dampened_ratio: float = 0.2) -> Iterator[str]:
+    """
+    Reports of levels, 1000 per scale unit.
+    report_length - (min, max) nr of levels in a report
+    safe_ratio - the fraction of safe reports, dampened_ratio - of the ones with one bad level, the rest gets several
+    """
+    for _ in range(max(1, round(1000 * scale))):
+        length = rng.randint(*report_length)
+        direction = rng.choice((-1, 1))
+        level = rng.randint(10, 90) if direction > 0 else rng.randint(10 + 3 * length, 90 + 3 * length)
+        report = [level]
+        for _ in range(length - 1):
+            level += direction * rng.randint(1, 3)
+            report.append(level)
+
+        kind = rng.random()
+        if kind >= safe_ratio:
+            nr_bad_levels = 1 if kind < safe_ratio + dampened_ratio else rng.randint(2, max(2, length // 2))
+            for index in rng.sample(range(length), nr_bad_levels):
+                # a too big step, or a repeated level
+                if rng.random() < 0.5:
+                    report[index] += rng.choice((-1, 1)) * rng.randint(4, 9)
+                else:
+                    report[index] = report[index - 1]
+
+        yield " ".join(map(str, report))
+
+
+def generate_day_03(rng: random.Random, scale: float = 1, line_length: int = 3000, mul_density: float = 0.12,
+                    toggle_density: float = 0.01) -> Iterator[str]:
+    """
+    Corrupted memory, 6 lines of about line_length characters per scale unit.
+    mul_density - the chance of a (valid or broken) mul instruction instead of a junk character,
+    toggle_density - of a do()/don't()
+    """
+    junk = "!@#$%^&*()[]{}<>?/\\,;:'+-_ whatwhenwhyhowfromselectwhowhere"
+    broken_muls = ["mul(%d,%d]", "mul[%d,%d)", "mul (%d,%d)", "mul(%d, %d)", "mul(%d,%d!", "mull(%d,%d)"]
+    for _ in range(max(1, round(6 * scale))):
+        parts = []
+        size = 0
+        while size < line_length:
+            roll = rng.random()
+            if roll < mul_density:
+                x, y = rng.randint(1, 999), rng.randint(1, 999)
+                part = f"mul({x},{y})" if rng.random() < 0.7 else rng.choice(broken_muls) % (x, y)
+            elif roll < mul_density + toggle_density:
+                part = rng.choice(("do()", "don't()"))
+            else:
+                part = rng.choice(junk)
+            parts.append(part)
+            size += len(part)
+        yield "".join(parts)
+
+
+def generate_day_04(rng: random.Random, scale: float = 1, size: int = 140, letters: str = "XMAS") -> Iterator[str]:
+    """A square word search grid, size x size for scale 1 (its area grows with the scale)"""
+    side = max(4, round(size * math.sqrt(scale)))
+    for _ in range(side):
+        yield "".join(rng.choices(letters, k=side))
+
+
+def generate_day_05(rng: random.Random, scale: float = 1, pages: int = 49, updates: int = 200,
+                    update_length: tuple[int, int] = (5, 23), correct_ratio: float = 0.5,
+                    rule_ratio: float = 1) -> Iterator[str]:
+    """
+    Page ordering rules, an empty line, the updates.
+    The rules come from a hidden total order of `pages` pages; the number of pages grows with the square root of the
+    scale, the number of updates linearly.
+    update_length - (min, max) nr of pages in an update (made odd - an update has a middle page, at most all pages)
+    correct_ratio - the fraction of updates already in the right order
+    rule_ratio - the fraction of page pairs with a rule (1: every pair, pages * (pages - 1) / 2 rules); the pairs
+    which appear together in an update always get theirs - the solvers need them. With many pages and short updates
+    that is a small part of all the pairs.
+    """
+    nr_pages = max(update_length[1], round(pages * math.sqrt(scale)))
+    max_length = nr_pages if nr_pages % 2 else nr_pages - 1
+    ordered_pages = rng.sample(range(10, 10 + 2 * nr_pages), nr_pages)
+    rank = {page: index for index, page in enumerate(ordered_pages)}
+
+    rules = [(first, second) for index, first in enumerate(ordered_pages) for second in ordered_pages[index + 1:]]
+    rng.shuffle(rules)
+
+    update_list = []
+    for _ in range(max(1, round(updates * scale))):
+        length = min(rng.randint(*update_length) | 1, max_length)
+        update = rng.sample(ordered_pages, length)
+        if rng.random() < correct_ratio:
+            update.sort(key=rank.get)
+        update_list.append(update)
+
+    if rule_ratio < 1:
+        needed_rules = set()
+        for update in update_list:
+            in_order = sorted(update, key=rank.get)
+            needed_rules.update((first, second)
+                                for index, first in enumerate(in_order) for second in in_order[index + 1:])
+        rules = [rule for rule in rules if rule in needed_rules or rng.random() < rule_ratio]
+
+    for first, second in rules:
+        yield f"{first}|{second}"
+
+    yield ""
+
+    for update in update_list:
+        yield ",".join(map(str, update))
+
+
+def __guard_path(grid: list[bytearray], row: int, col: int) -> Optional[set[tuple[int, int]]]:
+    """
+    Walk the guard (up first, turning right at obstacles) - the positions visited if the guard leaves the grid, None
+    on a loop
+    """
+    height, width = len(grid), len(grid[0])
+    direction = 0
+    seen = set()
+    while (row, col, direction) not in seen:
+        seen.add((row, col, direction))
+        next_row, next_col = row + guard_directions[direction][0], col + guard_directions[direction][1]
+        if not (0 <= next_row < height and 0 <= next_col < width):
+            return {(row, col) for row, col, _ in seen}
+        if grid[next_row][next_col] == ord("#"):
+            direction = (direction + 1) % 4
+        else:
+            row, col = next_row, next_col
+
+    return None
+
+
+def __spiral_obstacles(rng: random.Random, side: int, ring_gap: tuple[int, int]) -> tuple[tuple[int, int], list]:
+    """
+    The guard's start near the middle and the obstacles which turn it into a clockwise spiral outwards - each arm
+    longer than the parallel one before it by ring_gap (min, max), until an arm runs off the map
+    """
+    row = side // 2 + rng.randint(-(side // 10), side // 10)
+    col = side // 2 + rng.randint(-(side // 10), side // 10)
+    start = (row, col)
+    lengths = [rng.randint(1, ring_gap[1]), rng.randint(1, ring_gap[1])]
+    obstacles = []
+    direction = 0
+    while True:
+        if len(lengths) <= direction:
+            lengths.append(lengths[-2] + rng.randint(*ring_gap))
+        row_step, col_step = guard_directions[direction % 4]
+        row, col = row + row_step * lengths[direction], col + col_step * lengths[direction]
+        obstacle = (row + row_step, col + col_step)
+        if not (0 <= obstacle[0] < side and 0 <= obstacle[1] < side):
+            # the guard walks off the map along this arm
+            return start, obstacles
+        obstacles.append(obstacle)
+        direction += 1
+
+
+def generate_day_06(rng: random.Random, scale: float = 1, size: int = 130, density: float = 0.048,
+                    ring_gap: tuple[int, int] = (2, 5)) -> Iterator[str]:
+    """
+    A lab map: size x size for scale 1 (its area grows with the scale), the guard '^' near the middle.
+    The obstacles '#' steer the guard in a spiral out of the map - the rings ring_gap (min, max, at least 2) apart, so
+    the guard's path covers a steady part of the area, as in a real puzzle input: the path (part a) grows with the
+    area, not by the luck of the seed. More obstacles with the given density fill the cells the guard does not walk.
+    """
+    if ring_gap[0] < 2:
+        raise ValueError("the spiral's rings must be at least 2 apart - or an arm runs into the last ring's obstacles")
+
+    side = max(5, round(size * math.sqrt(scale)))
+    (row, col), obstacles = __spiral_obstacles(rng, side, ring_gap)
+    grid = [bytearray(b"." * side) for _ in range(side)]
+    for obstacle_row, obstacle_col in obstacles:
+        grid[obstacle_row][obstacle_col] = ord("#")
+    grid[row][col] = ord("^")
+
+    # obstacles off the guard's path do not change it
+    path = __guard_path(grid, row, col)
+    for cell_row in range(side):
+        for cell_col in range(side):
+            if (cell_row, cell_col) not in path and rng.random() < density:
+                grid[cell_row][cell_col] = ord("#")
+
+    for line in grid:
+        yield line.decode()
+
+
+def generate_day_07(rng: random.Random, scale: float = 1, equations: int = 850,
+                    operand_count: tuple[int, int] = (3, 12), operand_max: int = 999,
+                    solvable_ratio: float = 0.5) -> Iterator[str]:
+    """
+    Calibration equations, `equations` per scale unit.
+    operand_count - (min, max) nr of operands (the solvers try 2 or 3 to the power of that minus 1 operator sequences)
+    solvable_ratio - the fraction built from actual operators (+, *, ||), the rest gets a random test value
+    """
+    for _ in range(max(1, round(equations * scale))):
+        operands = [rng.randint(1, operand_max) for _ in range(rng.randint(*operand_count))]
+        if rng.random() < solvable_ratio:
+            test_value = operands[0]
+            for operand in operands[1:]:
+                operator = rng.choice("+*|")
+                if operator == "+":
+                    test_value += operand
+                elif operator == "*":
+                    test_value *= operand
+                else:
+                    test_value = int(f"{test_value}{operand}")
+        else:
+            test_value = rng.randint(1, operand_max ** 2 * len(operands))
+        yield f"{test_value}: {' '.join(map(str, operands))}"
+
+
+generators: dict[str, Callable[..., Iterator[str]]] = {
+    "01": generate_day_01,
+    "02": generate_day_02,
+    "03": generate_day_03,
+    "04": generate_day_04,
+    "05": generate_day_05,
+    "06": generate_day_06,
+    "07": generate_day_07,
+}
+
+
+def generate_lines(day_nr: Union[str, int], seed: int = default_seed, scale: float = 1, **knobs) -> Iterator[str]:
+    return generators[f"{int(day_nr):02d}"](random.Random(seed), scale, **knobs)
+
+
+def generate_text(day_nr: Union[str, int], seed: int = default_seed, scale: float = 1, **knobs) -> str:
+    return "\n".join(generate_lines(day_nr, seed, scale, **knobs)) + "\n"
+
+
+def write_input(path: Union[str, os.PathLike], day_nr: Union[str, int], seed: int = default_seed, scale: float = 1,
+                **knobs):
+    """Write the input line by line - compressed, if the path ends with .gz, .xz or .bz2"""
+    openers = {".gz": gzip.open, ".xz": lzma.open, ".bz2": bz2.open}
+    opener = openers.get(os.path.splitext(path)[1], open)
+    with opener(path, "wt") as file:
+        for line in generate_lines(day_nr, seed, scale, **knobs):
+            file.write(line)
+            file.write("\n")
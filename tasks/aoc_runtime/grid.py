@@ -0,0 +1,204 @@
+"""
+A character grid - the puzzles' maps and word searches - as one contiguous (height, width) uint8 NumPy array, a byte
+per cell. Rows, columns and diagonals are views into it (no copies), finding and counting cells is vectorized.
+
+    grid = Grid.from_lines(["MMMS", "MSAM", "AMXS"])
+    grid.find_first("^>v<")                  -> (row, col) or None
+    grid.count_word("XMAS")                  -> occurrences in all 8 directions
+    grid.step(position, turn_right(UP))      -> the position to the right
+
+NumPy comes with this module - import it where the solver runs, not at the top of a day module (see startup.py).
+"""
+import struct
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+# GLOBALS
+# (row, col) offsets - the orthogonal ones clockwise, starting up
+UP, RIGHT, DOWN, LEFT = (-1, 0), (0, 1), (1, 0), (0, -1)
+UP_RIGHT, DOWN_RIGHT, DOWN_LEFT, UP_LEFT = (-1, 1), (1, 1), (1, -1), (-1, -1)
+orthogonal_directions = (UP, RIGHT, DOWN, LEFT)
+diagonal_directions = (UP_RIGHT, DOWN_RIGHT, DOWN_LEFT, UP_LEFT)
+all_directions = (UP, UP_RIGHT, RIGHT, DOWN_RIGHT, DOWN, DOWN_LEFT, LEFT, UP_LEFT)
+# height, width - followed by the cells
+grid_header = struct.Struct("<QQ")
+
+
+def turn_right(direction: tuple[int, int]) -> tuple[int, int]:
+    return direction[1], -direction[0]
+
+
+def turn_left(direction: tuple[int, int]) -> tuple[int, int]:
+    return -direction[1], direction[0]
+
+
+def cell_codes(values: Union[str, bytes, int]) -> np.ndarray:
+    """'^>v<' / b'#O' / ord('#') -> the cell bytes to look for"""
+    if isinstance(values, int):
+        values = bytes([values])
+    elif isinstance(values, str):
+        values = values.encode()
+
+    return np.frombuffer(values, dtype=np.uint8)
+
+
+class Grid:
+    """
+    `cells[row, col]` is the byte of the character at that position. Positions are (row, col) tuples, directions
+    (row, col) offsets (see UP, RIGHT, ... above).
+    """
+    def __init__(self, cells: np.ndarray):
+        self.cells = np.ascontiguousarray(cells, dtype=np.uint8)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[Union[str, bytes]]) -> "Grid":
+        """All the lines must be of the same length"""
+        rows = [line.encode() if isinstance(line, str) else bytes(line) for line in lines]
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("the grid's lines differ in length")
+
+        # a bytearray, so the cells are writable
+        return cls(np.frombuffer(bytearray(b"".join(rows)), dtype=np.uint8).reshape(len(rows), width))
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.cells.shape
+
+    def __getitem__(self, key):
+        return self.cells[key]
+
+    def __setitem__(self, key, value: Union[int, str]):
+        self.cells[key] = ord(value) if isinstance(value, str) else value
+
+    def copy(self) -> "Grid":
+        return Grid(self.cells.copy())
+
+    def char(self, position: tuple[int, int]) -> str:
+        return chr(self.cells[position])
+
+    # Views - no copies, a change to a view is a change to the grid
+    def row(self, index: int) -> np.ndarray:
+        return self.cells[index]
+
+    def column(self, index: int) -> np.ndarray:
+        return self.cells[:, index]
+
+    def diagonal(self, offset: int = 0) -> np.ndarray:
+        """Top left to bottom right; offset > 0 starts that many columns right of (0, 0), < 0 rows below (read-only)"""
+        return self.cells.diagonal(offset)
+
+    def anti_diagonal(self, offset: int = 0) -> np.ndarray:
+        """Top right to bottom left; offset > 0 starts that many columns left of (0, width - 1) (read-only)"""
+        return self.cells[:, ::-1].diagonal(offset)
+
+    def rows(self) -> Iterator[np.ndarray]:
+        return iter(self.cells)
+
+    def columns(self) -> Iterator[np.ndarray]:
+        return iter(self.cells.T)
+
+    def diagonals(self, min_length: int = 1) -> Iterator[np.ndarray]:
+        for offset in range(-(self.height - min_length), self.width - min_length + 1):
+            yield self.diagonal(offset)
+
+    def anti_diagonals(self, min_length: int = 1) -> Iterator[np.ndarray]:
+        for offset in range(-(self.height - min_length), self.width - min_length + 1):
+            yield self.anti_diagonal(offset)
+
+    # Positions and directions
+    def in_bounds(self, position: tuple[int, int]) -> bool:
+        return 0 <= position[0] < self.cells.shape[0] and 0 <= position[1] < self.cells.shape[1]
+
+    @staticmethod
+    def step(position: tuple[int, int], direction: tuple[int, int]) -> tuple[int, int]:
+        return position[0] + direction[0], position[1] + direction[1]
+
+    def neighbours(self, position: tuple[int, int],
+                   directions: Iterable[tuple[int, int]] = orthogonal_directions) -> Iterator[tuple[int, int]]:
+        """The positions next to the given one (in the given directions) which are inside the grid"""
+        for direction in directions:
+            neighbour = (position[0] + direction[0], position[1] + direction[1])
+            if self.in_bounds(neighbour):
+                yield neighbour
+
+    # Searching - vectorized
+    def mask(self, values: Union[str, bytes, int]) -> np.ndarray:
+        """Boolean (height, width) array - True where the cell is one of the values"""
+        codes = cell_codes(values)
+        if len(codes) == 1:
+            return self.cells == codes[0]
+        return np.isin(self.cells, codes)
+
+    def find_first(self, values: Union[str, bytes, int]) -> Optional[tuple[int, int]]:
+        """The first position (row by row) holding one of the values"""
+        mask = self.mask(values)
+        index = int(mask.argmax())
+        if not mask.flat[index]:
+            return None
+
+        return divmod(index, self.width)
+
+    def find_all(self, values: Union[str, bytes, int]) -> list[tuple[int, int]]:
+        return [(int(row), int(col)) for row, col in np.argwhere(self.mask(values))]
+
+    def count(self, values: Union[str, bytes, int]) -> int:
+        return int(np.count_nonzero(self.mask(values)))
+
+    def match_word(self, word: Union[str, bytes], direction: tuple[int, int] = RIGHT) -> np.ndarray:
+        """Boolean (height, width) array - True where the word starts, written in the given direction"""
+        codes = cell_codes(word)
+        row_step, col_step = direction
+        span = len(codes) - 1
+        height, width = self.shape
+        # the start positions from which the whole word stays inside the grid
+        row_start, row_end = max(0, -row_step * span), height - max(0, row_step * span)
+        col_start, col_end = max(0, -col_step * span), width - max(0, col_step * span)
+
+        matches = np.zeros(self.shape, dtype=bool)
+        if row_start >= row_end or col_start >= col_end:
+            return matches
+
+        window = matches[row_start:row_end, col_start:col_end]
+        window[...] = True
+        for index, code in enumerate(codes):
+            row_offset, col_offset = index * row_step, index * col_step
+            window &= self.cells[row_start + row_offset:row_end + row_offset,
+                                 col_start + col_offset:col_end + col_offset] == code
+
+        return matches
+
+    def count_word(self, word: Union[str, bytes], directions: Iterable[tuple[int, int]] = all_directions) -> int:
+        return sum(int(np.count_nonzero(self.match_word(word, direction))) for direction in directions)
+
+    # Text
+    def lines(self) -> list[str]:
+        return [row.tobytes().decode() for row in self.cells]
+
+    def __str__(self):
+        return "\n".join(self.lines())
+
+    def __repr__(self):
+        return f"Grid(height={self.height}, width={self.width})"
+
+
+# ParsedCodec building blocks
+def dump_grid(grid: Grid) -> bytes:
+    return grid_header.pack(*grid.shape) + grid.cells.tobytes()
+
+
+def load_grid(buffer: memoryview) -> Grid:
+    height, width = grid_header.unpack_from(buffer)
+    # the solvers write into their grid
+    cells = np.frombuffer(buffer, dtype=np.uint8, count=height * width, offset=grid_header.size).copy()
+
+    return Grid(cells.reshape(height, width))
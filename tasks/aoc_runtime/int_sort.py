@@ -0,0 +1,114 @@
+"""
+Sorting non-negative integers below 2**32 held in compact array('I') buffers (4 bytes per value, instead of a list of
+int objects): a counting sort when the key range is dense, an LSD radix sort otherwise - or plain timsort (sorted())
+for small inputs, where it wins. `compare_sorts` measures where the crossover lies:
+
+    sort_uints(array("I", values))                    -> the sorted array, the method picked by the data
+    sort_uints(values, method="radix")                -> that method, regardless
+    format_comparison(compare_sorts([10**3, 10**6]))  -> wall time of each method per input size
+"""
+import random
+import time
+from array import array
+from collections import Counter
+from itertools import repeat
+from typing import Iterable
+
+# GLOBALS
+methods = ("timsort", "counting", "radix")
+# Below this many values timsort is faster than both (the Python level passes do not pay off) - see compare_sorts()
+min_size = 3 << 18
+# A counting sort walks the whole key range - done when the range is no bigger than this many times the nr of values
+counting_density = 1
+radix_bits = 11
+
+
+def timsort(values: array) -> array:
+    return array(values.typecode, sorted(values))
+
+
+def counting_sort(values: array) -> array:
+    """Counting the values (C level) and writing each distinct one out as many times - O(n + key range)"""
+    if not values:
+        return array(values.typecode)
+
+    counts = Counter(values)
+    sorted_values = array(values.typecode)
+    for value in range(min(values), max(values) + 1):
+        if count := counts.get(value):
+            sorted_values.extend(repeat(value, count))
+
+    return sorted_values
+
+
+def radix_sort(values: array, bits: int = radix_bits) -> array:
+    """LSD radix sort, `bits` of the key (value - min) per pass - O(n * key bits / bits)"""
+    if not values:
+        return array(values.typecode)
+
+    low = min(values)
+    key_bits = (max(values) - low).bit_length()
+    mask = (1 << bits) - 1
+    for shift in range(0, max(key_bits, 1), bits):
+        buckets = [array(values.typecode) for _ in range(1 << bits)]
+        appends = [bucket.append for bucket in buckets]
+        for value in values:
+            appends[((value - low) >> shift) & mask](value)
+
+        values = array(values.typecode)
+        for bucket in buckets:
+            values.extend(bucket)
+
+    return values
+
+
+def pick_method(values: array) -> str:
+    """The fastest method for the data, as compare_sorts() found it"""
+    if len(values) < min_size:
+        return "timsort"
+    if max(values) - min(values) <= counting_density * len(values):
+        return "counting"
+    return "radix"
+
+
+def sort_uints(values: array, method: str = "auto") -> array:
+    """A sorted copy of the values (an array('I') - or any integer array of non-negative values)"""
+    method = pick_method(values) if method == "auto" else method
+    if method == "timsort":
+        return timsort(values)
+    if method == "counting":
+        return counting_sort(values)
+    if method == "radix":
+        return radix_sort(values)
+
+    raise ValueError(f"unknown sort method: {method!r} (methods: auto, {', '.join(methods)})")
+
+
+def compare_sorts(sizes: Iterable[int], key_range: tuple[int, int] = (10000, 99999), repetitions: int = 3,
+                  seed: int = 2024) -> list[dict]:
+    """Best wall time (ns) of each method per input size, on random values from the key range (the 5 digit IDs)"""
+    rng = random.Random(seed)
+    rows = []
+    for size in sizes:
+        values = array("I", (rng.randint(*key_range) for _ in range(size)))
+        row = {"size": size, "key_range": key_range, "auto": pick_method(values)}
+        for method in methods:
+            timings = []
+            for _ in range(repetitions):
+                start_ns = time.perf_counter_ns()
+                sort_uints(values, method)
+                timings.append(time.perf_counter_ns() - start_ns)
+            row[method] = min(timings)
+        rows.append(row)
+
+    return rows
+
+
+def format_comparison(rows: list[dict]) -> str:
+    lines = [f"{'size':>10} {'timsort':>12} {'counting':>12} {'radix':>12}  fastest   auto"]
+    for row in rows:
+        fastest = min(methods, key=lambda method: row[method])
+        lines.append(f"{row['size']:>10} " + " ".join(f"{row[method] / 1e9:>12.6f}" for method in methods)
+                     + f"  {fastest:<9} {row['auto']}")
+
+    return "\n".join(lines)
@@ -0,0 +1,121 @@
+import contextlib
+import fnmatch
+import linecache
+import os
+import tracemalloc
+from typing import Optional
+
+from aoc_runtime import timing
+
+# GLOBALS
+default_top_n = 5
+# frames kept per allocation - 1 is enough to name the allocating line
+traceback_limit = 1
+# the measuring itself is not of interest - nor the runner and the context managers it wraps the phases in
+measuring_filters = [tracemalloc.Filter(False, tracemalloc.__file__),
+                     tracemalloc.Filter(False, __file__),
+                     tracemalloc.Filter(False, timing.__file__),
+                     tracemalloc.Filter(False, os.path.join(os.path.dirname(__file__), "runner.py")),
+                     tracemalloc.Filter(False, contextlib.__file__)]
+
+
+class PhaseMemory:
+    """Memory of one phase, in bytes, relative to what was allocated when the phase started"""
+    def __init__(self, name: str, net: int, peak: int, top_sites: list[tracemalloc.StatisticDiff]):
+        # top_sites - the lines which hold the most of the memory allocated during the phase, at its end
+        self.name = name
+        self.net = net
+        self.peak = peak
+        self.top_sites = top_sites
+
+    def as_dict(self) -> dict:
+        return {"name": self.name, "net": self.net, "peak": self.peak,
+                "top_sites": [{"site": str(site.traceback), "size_diff": site.size_diff, "count_diff": site.count_diff}
+                              for site in self.top_sites]}
+
+
+class MemoryTracker:
+    """
+    Peak and net allocated memory per phase (read, parse, part a, part b), via tracemalloc:
+
+        with MemoryTracker() as tracker:
+            with tracker.phase("parse"):
+                ...
+        print(tracker.report())
+
+    Only the Python allocations are seen - e.g. a memory-mapped input is not, and NumPy buffers are (NumPy reports
+    them to tracemalloc).
+    """
+    def __init__(self, top_n: int = default_top_n):
+        self.top_n = top_n
+        self.phases: list[PhaseMemory] = []
+        self.started_tracing = False
+
+    def __enter__(self) -> "MemoryTracker":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        """Trace from now on - once for all the phases, so a phase sees the frees of what the previous ones allocated"""
+        if not tracemalloc.is_tracing():
+            # the filters compile their patterns on first use - better before the tracing than in the first phase
+            for trace_filter in measuring_filters:
+                fnmatch.fnmatch("", trace_filter.filename_pattern)
+            tracemalloc.start(traceback_limit)
+            self.started_tracing = True
+
+    def stop(self):
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    def phase(self, name: str) -> "_Phase":
+        return _Phase(self, name)
+
+    def report(self) -> str:
+        lines = []
+        for phase in self.phases:
+            lines.append(f"{phase.name:<12} peak: {format_size(phase.peak):>10}  net: {format_size(phase.net):>10}")
+            for site in phase.top_sites:
+                frame = site.traceback[0]
+                source_line = linecache.getline(frame.filename, frame.lineno).strip()
+                lines.append(f"    {format_size(site.size_diff):>10} in {site.count_diff:>+8} blocks  "
+                             f"{frame.filename}:{frame.lineno}  {source_line}")
+
+        return "\n".join(lines)
+
+
+class _Phase:
+    def __init__(self, tracker: MemoryTracker, name: str):
+        self.tracker = tracker
+        self.name = name
+        self.start_current = 0
+        self.start_snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def __enter__(self):
+        self.tracker.start()
+        self.start_snapshot = tracemalloc.take_snapshot().filter_traces(measuring_filters)
+        tracemalloc.reset_peak()
+        self.start_current = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        current, peak = tracemalloc.get_traced_memory()
+        end_snapshot = tracemalloc.take_snapshot().filter_traces(measuring_filters)
+        top_sites = [site for site in end_snapshot.compare_to(self.start_snapshot, "lineno")
+                     if site.size_diff > 0][:self.tracker.top_n]
+        self.tracker.phases.append(PhaseMemory(self.name, current - self.start_current, peak - self.start_current,
+                                               top_sites))
+        self.start_snapshot = None
+
+
+def format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} {unit}"
+        size /= 1024
+
+    return f"{size:.1f} GiB"
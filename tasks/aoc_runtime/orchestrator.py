@@ -0,0 +1,107 @@
+"""
+Run all the days at once: every tasks/day_XX.py on its inputs/day_XX.txt in a process pool sized to the core count,
+the answers checked against results/day_XX.txt and gathered, with the timings, into one report - so a full
+verification takes about as long as the slowest day instead of the sum of them all.
+"""
+import contextlib
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Optional
+
+from aoc_runtime import benchmark
+from aoc_runtime.result_store import inputs_dir, read_results_file
+from aoc_runtime.solver import load_solver
+
+
+class DayRun:
+    """Outcome of one day: its answers (or the error), the expected ones and the wall time of each step"""
+    def __init__(self, day_nr: str, answers: Optional[tuple] = None, timings: Optional[dict[str, float]] = None,
+                 error: Optional[str] = None):
+        self.day_nr = day_nr
+        self.answers = answers
+        self.timings = timings or {}
+        self.error = error
+        results = read_results_file(day_nr)
+        self.expected = (results.get("a"), results.get("b")) if results else None
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.timings.values())
+
+    @property
+    def verdict(self) -> str:
+        if self.error:
+            return "ERROR"
+        if self.expected is None:
+            return "no results file"
+
+        return "ok" if tuple(map(str, self.answers)) == self.expected else "WRONG ANSWER"
+
+    @property
+    def passed(self) -> bool:
+        return self.verdict in ("ok", "no results file")
+
+
+def run_day(day_nr: str) -> DayRun:
+    """Solve one day on its puzzle input - runs in a pool worker, the solver's own printing is silenced"""
+    timings = {}
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            solver = load_solver(day_nr)
+
+            start = time.perf_counter()
+            input_buffer = benchmark.puzzle_input(day_nr)
+            timings["read"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            state = solver.parse(input_buffer)
+            timings["parse"] = time.perf_counter() - start
+
+            answers = []
+            for phase in ("part_a", "part_b"):
+                start = time.perf_counter()
+                answers.append(getattr(solver, phase)(state))
+                timings[phase] = time.perf_counter() - start
+    except Exception:
+        return DayRun(day_nr, timings=timings, error=traceback.format_exc())
+
+    return DayRun(day_nr, tuple(answers), timings)
+
+
+def run_all(days: Optional[Iterable[str]] = None, workers: Optional[int] = None, progress=None) -> list[DayRun]:
+    """The days which have an input file, in parallel - the results in day order"""
+    days = list(days) if days else benchmark.discover_days()
+    days = [day_nr for day_nr in days if (inputs_dir / f"day_{day_nr}.txt").exists()]
+
+    day_runs = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [executor.submit(run_day, day_nr) for day_nr in days]
+        for future in as_completed(futures):
+            day_run = future.result()
+            if progress:
+                print(f"day {day_run.day_nr}: {day_run.verdict} ({day_run.total_time:.3f} sec.)", file=progress,
+                      flush=True)
+            day_runs.append(day_run)
+
+    return sorted(day_runs, key=lambda day_run: day_run.day_nr)
+
+
+def format_report(day_runs: list[DayRun], elapsed: float) -> str:
+    lines = [f"{'day':<4} {'result_a':>18} {'result_b':>18} {'parse':>9} {'part_a':>9} {'part_b':>9} {'total':>9}"
+             f"  verdict"]
+    for day_run in day_runs:
+        result_a, result_b = day_run.answers if day_run.answers else ("-", "-")
+        step_times = " ".join(f"{day_run.timings.get(phase, 0):>9.3f}" for phase in benchmark.phases)
+        lines.append(f"{day_run.day_nr:<4} {result_a!s:>18} {result_b!s:>18} {step_times} "
+                     f"{day_run.total_time:>9.3f}  {day_run.verdict}")
+        if day_run.verdict == "WRONG ANSWER":
+            lines.append(f"     expected: {day_run.expected[0]} / {day_run.expected[1]}")
+        if day_run.error:
+            lines.extend(f"     {line}" for line in day_run.error.rstrip().splitlines())
+
+    sum_of_days = sum(day_run.total_time for day_run in day_runs)
+    lines.append(f"elapsed: {elapsed:.3f} sec. (the days one after another: {sum_of_days:.3f} sec.)")
+
+    return "\n".join(lines)
@@ -0,0 +1,94 @@
+import hashlib
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from aoc_runtime.reader import InputBuffer
+
+# GLOBALS
+default_cache_dir = Path(os.environ.get("AOC_CACHE_DIR", Path(__file__).resolve().parents[2] / ".cache"))
+# Least recently used entries get evicted once the cache grows beyond this size
+default_max_bytes = 256 * 1024 * 1024
+
+
+class ParseCache:
+    """
+    Parsed inputs, keyed by the SHA-256 of the input bytes plus the day and its parser version.
+
+    A hit memory-maps the stored binary form and hands it to the solver's codec, skipping the text parsing altogether,
+    and refreshes the entry's mtime, which is what the LRU eviction goes by.
+    """
+    def __init__(self, cache_dir: Union[str, os.PathLike] = default_cache_dir / "parsed",
+                 max_bytes: int = default_max_bytes):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def entry_path(self, solver, input_hash: str) -> Path:
+        # the engines of a day parse into different states
+        engine = getattr(solver, "engine", "default")
+        name = f"day_{solver.day_nr}" if engine == "default" else f"day_{solver.day_nr}-{engine}"
+        return self.cache_dir / f"{name}-v{solver.parsed_codec.version}-{input_hash}.bin"
+
+    def get(self, solver, input_hash: str) -> Optional[Any]:
+        path = self.entry_path(solver, input_hash)
+        try:
+            with open(path, "rb") as file:
+                os.utime(file.fileno())
+                if os.fstat(file.fileno()).st_size == 0:
+                    return solver.parsed_codec.load(memoryview(b""))
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as buffer:
+                        return solver.parsed_codec.load(buffer)
+        except FileNotFoundError:
+            return None
+
+    def put(self, solver, input_hash: str, state: Any):
+        try:
+            data = solver.parsed_codec.dump(state)
+        except OverflowError:
+            # does not fit the binary format (e.g. beyond int64) - just don't cache it
+            return
+
+        path = self.entry_path(solver, input_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+        evict_lru(self.cache_dir, "day_*.bin", self.max_bytes)
+
+    def parse(self, solver, lines: Iterable[str], input_hash: Optional[str] = None) -> Any:
+        """solver.parse(lines), from the cache if that exact input was parsed before"""
+        if solver.parsed_codec is None or not isinstance(lines, InputBuffer):
+            return solver.parse(lines)
+
+        input_hash = input_hash or input_digest(lines)
+        state = self.get(solver, input_hash)
+        if state is None:
+            state = solver.parse(lines)
+            # store it right away - the parts may alter the state
+            self.put(solver, input_hash, state)
+
+        return state
+
+
+def evict_lru(directory: Path, pattern: str, max_bytes: int):
+    """Drop the least recently used (oldest mtime) files matching the pattern until they fit in max_bytes"""
+    entries = []
+    for path in directory.glob(pattern):
+        try:
+            entries.append((path.stat(), path))
+        except FileNotFoundError:
+            pass
+
+    total_size = sum(stat.st_size for stat, _ in entries)
+    for stat, path in sorted(entries, key=lambda entry: entry[0].st_mtime):
+        if total_size <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total_size -= stat.st_size
+
+
+def input_digest(input_buffer: InputBuffer) -> str:
+    return hashlib.sha256(input_buffer.view).hexdigest()
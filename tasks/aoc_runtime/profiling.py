@@ -0,0 +1,41 @@
+import io
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc_runtime.result_store import repo_dir
+
+# GLOBALS
+profiles_dir = repo_dir / "profiles"
+default_top_n = 20
+
+
+def profile_path(day_nr: str, part: str) -> Path:
+    """profiles/day_XX_part_a.pstats - open it with pstats, snakeviz, etc."""
+    return profiles_dir / f"day_{day_nr}_{part}.pstats"
+
+
+def profile_call(func: Callable[[Any], Any], state: Any, path: Path) -> Any:
+    """func(state) under cProfile, the stats dumped to the given path"""
+    # only --profile needs these, a plain run should not pay for importing them
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, state)
+    finally:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(path)
+
+
+def format_profile(path: Path, top_n: int = default_top_n) -> str:
+    """The top N functions, by cumulative and by total (own) time"""
+    import pstats
+
+    output = io.StringIO()
+    stats = pstats.Stats(str(path), stream=output)
+    stats.strip_dirs()
+    for sort_key, label in ((pstats.SortKey.CUMULATIVE, "cumulative"), (pstats.SortKey.TIME, "total")):
+        output.write(f"--- {path.name}, top {top_n} by {label} time ---\n")
+        stats.sort_stats(sort_key).print_stats(top_n)
+
+    return output.getvalue()
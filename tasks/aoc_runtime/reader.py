@@ -0,0 +1,343 @@
+import itertools
+import mmap
+import os
+import select
+import stat
+import sys
+import time
+import zlib
+from array import array
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, Union
+
+# GLOBALS
+# Base time allowed to get the input, on top of it every byte gets its share (see input_deadline())
+input_timeout = 5
+# Slowest acceptable input throughput, in bytes per second
+min_throughput = 50 * 1024 * 1024
+read_chunk_size = 1024 * 1024
+
+# Compressed inputs are recognized by their first bytes, not by file name (stdin has none)
+compression_magic = {
+    b"\x1f\x8b": "gzip",
+    b"\xfd7zXZ\x00": "xz",
+    b"BZh": "bz2",
+}
+
+
+class InputTimeoutError(TimeoutError):
+    """The input did not arrive within its (size-aware) time limit"""
+    def __init__(self, timeout: float):
+        super().__init__(f"Timeout limit ({timeout:.1f} sec.) reached")
+        self.timeout = timeout
+
+
+class InputBuffer:
+    """
+    The whole input as one bytes-like buffer (bytes or a read-only mmap) - read once, never copied.
+
+    Solvers can work on the raw `data`/`view`, or just iterate the buffer to get the decoded lines (without the line
+    break) - the line index is built on first use only.
+    """
+    def __init__(self, data: Union[bytes, bytearray, mmap.mmap], encoding: str = "utf-8"):
+        self.data = data
+        self.view = memoryview(data)
+        self.encoding = encoding
+        self._line_starts: Optional[array] = None
+
+    @classmethod
+    def from_text(cls, text: str) -> "InputBuffer":
+        return cls(text.encode())
+
+    def __len__(self):
+        return len(self.line_starts) - 1
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self.line(index).decode(self.encoding)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.view)
+
+    @property
+    def line_starts(self) -> array:
+        """Offsets of each line's first byte, plus a closing offset one past the end of the data"""
+        if self._line_starts is None:
+            data = self.data
+            size = len(data)
+            line_starts = array("Q", [0])
+            pos = data.find(b"\n")
+            while pos != -1:
+                line_starts.append(pos + 1)
+                pos = data.find(b"\n", pos + 1)
+            if line_starts[-1] != size:
+                # last line without a trailing line break
+                line_starts.append(size)
+            self._line_starts = line_starts
+
+        return self._line_starts
+
+    def stream_lines(self) -> Iterator[str]:
+        """
+        The lines as iterating gives them, but scanned straight off the data - no line index is built (and kept), so
+        a memory-mapped input of any size is read in bounded memory
+        """
+        data, encoding = self.data, self.encoding
+        start, size = 0, len(data)
+        while start < size:
+            end = data.find(b"\n", start)
+            if end == -1:
+                # last line without a trailing line break - kept as is, as line() does
+                yield data[start:size].decode(encoding)
+                break
+            line = data[start:end]
+            yield (line[:-1] if line.endswith(b"\r") else line).decode(encoding)
+            start = end + 1
+
+    def line(self, index: int) -> bytes:
+        """Raw bytes of a single line, without the line break"""
+        start, end = self.line_starts[index], self.line_starts[index + 1]
+        line = self.data[start:end]
+        if line.endswith(b"\n"):
+            line = line[:-2] if line.endswith(b"\r\n") else line[:-1]
+
+        return line
+
+    def text(self) -> str:
+        return str(self.view, self.encoding)
+
+    def close(self):
+        self.view.release()
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+
+def input_deadline(start: float, nbytes: int, timeout: float = input_timeout) -> float:
+    """The later of the base timeout and the time the given bytes need at `min_throughput`"""
+    return start + timeout + nbytes / min_throughput
+
+
+def detect_compression(head: bytes) -> Optional[str]:
+    """'gzip', 'xz' or 'bz2' if the data starts with the respective magic bytes, None for plain data"""
+    for magic, codec in compression_magic.items():
+        if head.startswith(magic):
+            return codec
+
+    return None
+
+
+def __new_decompressor(codec: str):
+    # lzma and bz2 are imported only for such an input - most inputs are plain
+    if codec == "gzip":
+        return zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    elif codec == "xz":
+        import lzma
+        return lzma.LZMADecompressor()
+    elif codec == "bz2":
+        import bz2
+        return bz2.BZ2Decompressor()
+    else:
+        raise ValueError(f"Unknown compression: {codec}")
+
+
+def iter_decompressed(chunks: Iterable[bytes], codec: str) -> Iterator[bytes]:
+    """
+    Decompress chunk by chunk as they come - concatenated streams (e.g. `cat a.gz b.gz`) included.
+    A stream cut off before its end-of-stream marker raises an EOFError (as gzip.open() does), once all is read.
+    """
+    decompressor = __new_decompressor(codec)
+    in_stream = False
+    for chunk in chunks:
+        while chunk:
+            in_stream = True
+            yield decompressor.decompress(chunk)
+            if not decompressor.eof:
+                break
+            # end of one stream - whatever is left belongs to the next one
+            chunk = decompressor.unused_data
+            decompressor = __new_decompressor(codec)
+            in_stream = False
+
+    if in_stream:
+        raise EOFError(f"{codec} compressed input ended before the end-of-stream marker was reached")
+
+
+def decompress_chunks(chunks: Iterable[bytes], codec: str) -> bytearray:
+    decompressed = bytearray()
+    for data in iter_decompressed(chunks, codec):
+        decompressed += data
+
+    return decompressed
+
+
+def __map_file(fileno: int) -> Union[bytes, mmap.mmap]:
+    if os.fstat(fileno).st_size == 0:
+        # an empty file can not be mapped
+        return b""
+
+    return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+
+def __mapped_input(fileno: int) -> InputBuffer:
+    data = __map_file(fileno)
+    codec = detect_compression(data[:8])
+    if codec is None:
+        return InputBuffer(data)
+
+    try:
+        # bytes slices, not memoryview ones - an error raised while decompressing would keep those (and so the map)
+        # alive in its traceback
+        chunks = (data[offset:offset + read_chunk_size] for offset in range(0, len(data), read_chunk_size))
+        return InputBuffer(decompress_chunks(chunks, codec))
+    finally:
+        data.close()
+
+
+def __is_regular_file(stream: BinaryIO) -> bool:
+    try:
+        return stat.S_ISREG(os.fstat(stream.fileno()).st_mode)
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def __read_chunks(fileno: int, timeout: float) -> Iterator[bytes]:
+    # only the time spent waiting for the input counts - a streamed input is worked on between the chunks
+    waited = 0.0
+    received = 0
+    while True:
+        allowed = input_deadline(0, received, timeout)
+        remaining = allowed - waited
+        wait_start = time.monotonic()
+        if remaining <= 0 or not select.select([fileno], [], [], remaining)[0]:
+            raise InputTimeoutError(allowed)
+        waited += time.monotonic() - wait_start
+        chunk = os.read(fileno, read_chunk_size)
+        if not chunk:
+            break
+        received += len(chunk)
+        yield chunk
+
+
+def read_stream(stream: BinaryIO, timeout: float = input_timeout) -> InputBuffer:
+    """
+    Read a whole binary stream in as few calls as possible.
+
+    A regular file (e.g. stdin redirected with '<') is mapped, no read at all.
+    A pipe is drained in big chunks, waiting with select() no longer than the deadline - which moves forward with every
+    byte received, so big inputs are not cut just because they are big.
+    Gzip, xz and bz2 compressed data is decompressed on the fly, chunk by chunk.
+    """
+    if __is_regular_file(stream):
+        return __mapped_input(stream.fileno())
+
+    start = time.monotonic()
+    try:
+        fileno = stream.fileno()
+        select.select([fileno], [], [], 0)
+    except (AttributeError, OSError, ValueError):
+        # no select() for this kind of stream (e.g. pipes on Windows) - just read it
+        data = stream.read()
+        if time.monotonic() > (deadline := input_deadline(start, len(data), timeout)):
+            raise InputTimeoutError(deadline - start)
+        codec = detect_compression(data[:8])
+        return InputBuffer(decompress_chunks([data], codec) if codec else data)
+
+    chunks = __read_chunks(fileno, timeout)
+    first_chunk = next(chunks, b"")
+    codec = detect_compression(first_chunk)
+    if codec:
+        return InputBuffer(decompress_chunks(itertools.chain([first_chunk], chunks), codec))
+
+    data = bytearray(first_chunk)
+    for chunk in chunks:
+        data += chunk
+
+    return InputBuffer(data)
+
+
+def read_stdin(timeout: float = input_timeout) -> InputBuffer:
+    return read_stream(sys.stdin.buffer, timeout)
+
+
+def read_path(path: Union[str, os.PathLike]) -> InputBuffer:
+    """Memory-map an input file (decompress it, if compressed)"""
+    with open(path, "rb") as file:
+        return __mapped_input(file.fileno())
+
+
+# Streamed inputs - never held whole
+class InputStream:
+    """
+    The input read (and decompressed) a chunk at a time while it is iterated - for the solvers which go through their
+    input once and keep less than all of it (see Solver.streaming). Iterating gives the lines as an InputBuffer does;
+    it can be done once only. `nbytes` counts the (decompressed) bytes read so far.
+    """
+    def __init__(self, chunks: Iterator[bytes], encoding: str = "utf-8", close: Optional[Callable[[], None]] = None):
+        self.chunks = chunks
+        self.encoding = encoding
+        self.nbytes = 0
+        self._close = close
+
+    def __iter__(self) -> Iterator[str]:
+        rest = b""
+        for chunk in self.chunks:
+            self.nbytes += len(chunk)
+            lines = (rest + chunk).split(b"\n") if rest else chunk.split(b"\n")
+            rest = lines.pop()
+            for line in lines:
+                yield (line[:-1] if line.endswith(b"\r") else line).decode(self.encoding)
+        if rest:
+            # last line without a trailing line break
+            yield rest.decode(self.encoding)
+
+        self.close()
+
+    def stream_lines(self) -> Iterator[str]:
+        return iter(self)
+
+    def close(self):
+        if self._close:
+            self._close()
+            self._close = None
+
+
+def __plain_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """The chunks decompressed, if the first one starts compressed"""
+    first_chunk = next(chunks, b"")
+    codec = detect_compression(first_chunk)
+    chunks = itertools.chain([first_chunk], chunks)
+
+    return iter_decompressed(chunks, codec) if codec else chunks
+
+
+def __file_chunks(file: BinaryIO) -> Iterator[bytes]:
+    while chunk := file.read(read_chunk_size):
+        yield chunk
+
+
+def stream_input(stream: BinaryIO, timeout: float = input_timeout) -> InputStream:
+    """
+    A binary stream as an InputStream: a regular file is read chunk by chunk, a pipe the way read_stream() drains it -
+    each chunk only when the previous one is used up
+    """
+    if __is_regular_file(stream):
+        return InputStream(__plain_chunks(__file_chunks(stream)))
+
+    try:
+        fileno = stream.fileno()
+        select.select([fileno], [], [], 0)
+    except (AttributeError, OSError, ValueError):
+        # no select() for this kind of stream - no deadline either
+        return InputStream(__plain_chunks(__file_chunks(stream)))
+
+    return InputStream(__plain_chunks(__read_chunks(fileno, timeout)))
+
+
+def stream_stdin(timeout: float = input_timeout) -> InputStream:
+    return stream_input(sys.stdin.buffer, timeout)
+
+
+def stream_path(path: Union[str, os.PathLike]) -> InputStream:
+    """An input file as an InputStream (decompressed, if compressed) - the file is closed once it is read through"""
+    file = open(path, "rb")
+    return InputStream(__plain_chunks(__file_chunks(file)), close=file.close)
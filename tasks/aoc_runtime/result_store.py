@@ -0,0 +1,129 @@
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from aoc_runtime.parse_cache import default_cache_dir, evict_lru
+
+# GLOBALS
+repo_dir = Path(__file__).resolve().parents[2]
+inputs_dir = repo_dir / "inputs"
+results_dir = repo_dir / "results"
+# Least recently used entries get evicted once the store grows beyond this size
+default_max_bytes = 16 * 1024 * 1024
+
+# compiled on first use (re caches it), not at import
+result_line_pattern = r"^result_([ab]): (.*)$"
+
+
+@functools.cache
+def runtime_source_digest() -> bytes:
+    """
+    SHA-256 of the source of every aoc_runtime module - the solvers use them (grid.py, int_sort.py, the reader, ...),
+    many imported only where used, so no telling which ones a solver's answers depend on before it ran
+    """
+    digest = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+
+    return digest.digest()
+
+
+def solver_source_digest(solver) -> str:
+    """
+    SHA-256 of the source of the module(s) defining the solver's functions, and of the runtime they build on.
+    The whole module is taken, not just the functions - a change in a helper (e.g. is_safe()) changes the answers too,
+    and so does a change in a runtime module (e.g. Grid.count_word()).
+    An engine other than the default one is part of the digest - each engine's answers are its own.
+    """
+    digest = hashlib.sha256(runtime_source_digest())
+    if getattr(solver, "engine", "default") != "default":
+        digest.update(f"engine:{solver.engine}".encode())
+    for module_name in sorted({func.__module__ for func in (solver.parse, solver.part_a, solver.part_b)}):
+        digest.update(Path(sys.modules[module_name].__file__).read_bytes())
+
+    return digest.hexdigest()
+
+
+class ResultStore:
+    """
+    Answers of already solved inputs, keyed by (input hash, solver source hash) - one small JSON file per entry.
+    A hit refreshes the entry's mtime, which is what the LRU eviction goes by.
+    """
+    def __init__(self, store_dir: Union[str, os.PathLike] = default_cache_dir / "results",
+                 max_bytes: int = default_max_bytes):
+        self.store_dir = Path(store_dir)
+        self.max_bytes = max_bytes
+
+    def entry_path(self, day_nr: str, input_hash: str, source_hash: str) -> Path:
+        return self.store_dir / f"day_{day_nr}-{input_hash}-{source_hash}.json"
+
+    def get(self, day_nr: str, input_hash: str, source_hash: str) -> Optional[tuple[Any, Any]]:
+        path = self.entry_path(day_nr, input_hash, source_hash)
+        try:
+            entry = json.loads(path.read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+        os.utime(path)
+
+        return entry["result_a"], entry["result_b"]
+
+    def put(self, day_nr: str, input_hash: str, source_hash: str, result_a: Any, result_b: Any):
+        path = self.entry_path(day_nr, input_hash, source_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"day_nr": day_nr, "result_a": result_a, "result_b": result_b}))
+        os.replace(tmp_path, path)
+
+        self.evict()
+
+    def evict(self):
+        """Drop the least recently used entries until the store fits in max_bytes"""
+        evict_lru(self.store_dir, "day_*.json", self.max_bytes)
+
+
+# results/day_XX.txt
+def read_results_file(day_nr: str) -> dict[str, str]:
+    """The recorded answers as {"a": ..., "b": ...} (as text), empty if there's no results file"""
+    try:
+        text = (results_dir / f"day_{day_nr}.txt").read_text()
+    except FileNotFoundError:
+        return {}
+
+    return dict(re.findall(result_line_pattern, text, re.MULTILINE))
+
+
+def is_puzzle_input(day_nr: str, input_hash: str) -> bool:
+    try:
+        return hashlib.sha256((inputs_dir / f"day_{day_nr}.txt").read_bytes()).hexdigest() == input_hash
+    except FileNotFoundError:
+        return False
+
+
+def results_file_mismatches(day_nr: str, result_a: Any, result_b: Any) -> list[str]:
+    """The answers which differ from the ones in results/day_XX.txt, e.g. ["result_a: 2604 (recorded: 2603)"]"""
+    recorded = read_results_file(day_nr)
+
+    return [f"result_{part}: {result} (recorded: {recorded[part]})"
+            for part, result in (("a", result_a), ("b", result_b))
+            if part in recorded and recorded[part] != str(result)]
+
+
+def write_results_file(day_nr: str, result_a: Any, result_b: Any) -> bool:
+    """
+    Record the answers in results/day_XX.txt if there is none yet. True if the file was created.
+    An existing one is never rewritten - it is the reference the gate and run-all check the answers against.
+    """
+    results_dir.mkdir(exist_ok=True)
+    try:
+        with open(results_dir / f"day_{day_nr}.txt", "x") as file:
+            file.write(f"day_nr: {day_nr}\nresult_a: {result_a}\nresult_b: {result_b}\n")
+    except FileExistsError:
+        return False
+
+    return True
@@ -0,0 +1,256 @@
+import argparse
+import contextlib
+import os
+import pickle
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from aoc_runtime import counters
+from aoc_runtime.parse_cache import ParseCache, input_digest
+from aoc_runtime.profiling import default_top_n, format_profile, profile_call, profile_path
+from aoc_runtime.reader import (InputBuffer, InputStream, InputTimeoutError, input_timeout, read_path, read_stdin,
+                                stream_path, stream_stdin)
+from aoc_runtime.result_store import (ResultStore, is_puzzle_input, results_file_mismatches, solver_source_digest,
+                                      write_results_file)
+from aoc_runtime.solver import Solver
+from aoc_runtime.timing import Tracer
+
+if TYPE_CHECKING:
+    from aoc_runtime.memory import MemoryTracker
+
+# GLOBALS
+# --parts auto runs the parts in parallel from this input size on - below it, starting the worker process and handing it
+# the parsed state takes longer than part b itself (and most inputs are small)
+parallel_min_bytes = 1024 * 1024
+
+
+# MISC
+
+def show_span(tracer: Tracer, path: str):
+    """
+    E.g. '[0.0123456] part_a took: 0.0012345 sec. (cpu: 0.0012000 sec.)' - wall time since the tracer started first,
+    followed by the counters counted meanwhile (if enabled)
+    """
+    stats = tracer.stats[path]
+    elapsed_ns = time.perf_counter_ns() - tracer.origin_ns
+    print(f"[{elapsed_ns / 1e9:.7f}] {path} took: {stats.wall_ns / 1e9:.7f} sec. (cpu: {stats.cpu_ns / 1e9:.7f} sec.)")
+    if counters.counts:
+        print(counters.report())
+        counters.reset()
+
+
+# READ INPUT
+def controlled_input_read(input_path: Optional[str] = None, timeout: float = input_timeout,
+                          streaming: bool = False) -> Union[InputBuffer, InputStream]:
+    """The input file if given (memory-mapped), stdin otherwise - or either of them as a stream, read while parsed"""
+    try:
+        if streaming:
+            return stream_path(input_path) if input_path else stream_stdin(timeout)
+        return read_path(input_path) if input_path else read_stdin(timeout)
+    except InputTimeoutError as exc:
+        __exit_on_timeout(exc)
+
+
+def __exit_on_timeout(exc: InputTimeoutError):
+    print(f"Timeout limit ({exc.timeout:.1f} sec.) reached - exiting")
+    sys.exit(1)
+
+
+def parse_args(solver: Solver, argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=f"Solve day {solver.day_nr}, both parts")
+    parser.add_argument("input", nargs="?", help="input file (read stdin if not given)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always parse and solve, use neither the parse cache nor the result store")
+    parser.add_argument("--timings", metavar="FILE", help="write the collected spans as JSON")
+    parser.add_argument("--trace", metavar="FILE", help="write the collected spans in Chrome's trace event format")
+    parser.add_argument("--profile", action="store_true",
+                        help="run part a and part b under cProfile, dump profiles/day_XX_part_?.pstats, show the top")
+    parser.add_argument("--profile-top", metavar="N", type=int, default=default_top_n,
+                        help=f"number of functions to show per profile (default: {default_top_n})")
+    parser.add_argument("--counters", action="store_true",
+                        help="count the solvers' hot-path work (steps, checks, ...) and show it per phase")
+    parser.add_argument("--memory", action="store_true",
+                        help="track peak and net allocated memory per phase, with the top allocation sites")
+    parser.add_argument("--parts", choices=("auto", "parallel", "sequential"), default="auto",
+                        help="run part b in a worker process while part a runs - if the solver declares them "
+                             f"independent; auto: for inputs of {parallel_min_bytes / 2 ** 20:g} MiB and more, "
+                             "when there is more than one core (default: auto). "
+                             "--profile/--counters/--memory always run them one after the other")
+    parser.add_argument("--engine", choices=solver.engine_names, default=solver.engine,
+                        help=f"the implementation to solve with (default: {solver.engine})")
+
+    return parser.parse_args(argv)
+
+
+# MAIN
+def run_solver(solver: Solver, timeout: float = input_timeout, argv: Optional[list[str]] = None,
+               tracer: Optional[Tracer] = None):
+    """
+    What every tasks/day_XX.py does when executed as a script: read the input, solve both parts, show the results.
+    The spans go to the given tracer (e.g. to hand the timings on, as the daemon does), a new one otherwise.
+    """
+    args = parse_args(solver, argv)
+    solver = solver.with_engine(args.engine)
+    print(f"day_nr: {solver.day_nr}")
+    if solver.engine != "default":
+        print(f"engine: {solver.engine}")
+
+    memory_tracker = None
+    if args.memory:
+        # tracemalloc and the rest of the measuring come in with their flags only
+        from aoc_runtime.memory import MemoryTracker
+        memory_tracker = MemoryTracker()
+    if args.counters:
+        counters.reset()
+        counters.enable()
+    try:
+        with (tracer or Tracer()).activate() as tracer, memory_tracker or contextlib.nullcontext():
+            result_a, result_b = __timed_run(solver, tracer, memory_tracker, args, timeout)
+    finally:
+        counters.disable()
+
+    # The whole tree, if the solver has spans of its own
+    if any("/" in path for path in tracer.stats):
+        print(tracer.report())
+    if memory_tracker:
+        print(memory_tracker.report())
+    if args.timings:
+        tracer.dump_json(args.timings)
+    if args.trace:
+        tracer.dump_chrome_trace(args.trace)
+
+    return result_a, result_b
+
+
+def __phase(tracer: Tracer, memory_tracker: Optional["MemoryTracker"], name: str):
+    phase = tracer.span(name)
+    if memory_tracker is None:
+        return phase
+
+    # the memory tracking goes outside, its snapshots should not count as the phase's time
+    stack = contextlib.ExitStack()
+    stack.enter_context(memory_tracker.phase(name))
+    stack.enter_context(phase)
+    return stack
+
+
+def __timed_run(solver: Solver, tracer: Tracer, memory_tracker: Optional["MemoryTracker"], args: argparse.Namespace,
+                timeout: float):
+    with __phase(tracer, memory_tracker, "read"):
+        input_data = controlled_input_read(args.input, timeout, solver.streaming)
+    show_span(tracer, "read")
+
+    # a streamed input is read while parsed - there is no hash of it beforehand to look anything up by
+    use_caches = not (args.no_cache or solver.streaming)
+    # the measuring modes want to see the actual work - neither a stored answer nor a cached parse
+    measuring = args.profile or args.counters or args.memory
+    if use_caches:
+        with tracer.span("result_store"):
+            input_hash, source_hash = input_digest(input_data), solver_source_digest(solver)
+            cached_results = ResultStore().get(solver.day_nr, input_hash, source_hash)
+        if cached_results and not measuring:
+            result_a, result_b = cached_results
+            print(f"result_a: {result_a}")
+            print(f"result_b: {result_b}")
+            show_span(tracer, "result_store")
+            __check_results_file(solver.day_nr, input_hash, result_a, result_b)
+            return result_a, result_b
+
+    with __phase(tracer, memory_tracker, "parse"):
+        if not use_caches or measuring:
+            try:
+                state = solver.parse(input_data)
+            except InputTimeoutError as exc:
+                # a streamed input arrives while parsed
+                __exit_on_timeout(exc)
+        else:
+            state = ParseCache().parse(solver, input_data, input_hash)
+    show_span(tracer, "parse")
+
+    parallel = __parts_in_parallel(solver, args, input_data.nbytes)
+    if parallel:
+        result_a, result_b = __run_parts_in_parallel(solver, state, tracer)
+    else:
+        with __phase(tracer, memory_tracker, "part_a"):
+            result_a = __run_part(solver, "part_a", state, args)
+    print(f"result_a: {result_a}")
+    show_span(tracer, "part_a")
+
+    if not parallel:
+        with __phase(tracer, memory_tracker, "part_b"):
+            result_b = __run_part(solver, "part_b", state, args)
+    print(f"result_b: {result_b}")
+    show_span(tracer, "part_b")
+
+    if use_caches:
+        ResultStore().put(solver.day_nr, input_hash, source_hash, result_a, result_b)
+        __check_results_file(solver.day_nr, input_hash, result_a, result_b)
+
+    return result_a, result_b
+
+
+def __check_results_file(day_nr: str, input_hash: str, result_a, result_b):
+    """The puzzle input's answers against results/day_XX.txt - recorded if there is none yet, never overwritten"""
+    if not is_puzzle_input(day_nr, input_hash):
+        return
+    if write_results_file(day_nr, result_a, result_b):
+        print(f"results/day_{day_nr}.txt created")
+        return
+    for mismatch in results_file_mismatches(day_nr, result_a, result_b):
+        print(f"warning: {mismatch} - results/day_{day_nr}.txt left as it is", file=sys.stderr)
+
+
+def __run_part(solver: Solver, part: str, state, args: argparse.Namespace):
+    if not args.profile:
+        return getattr(solver, part)(state)
+
+    path = profile_path(solver.day_nr, part)
+    result = profile_call(getattr(solver, part), state, path)
+    print(format_profile(path, args.profile_top))
+
+    return result
+
+
+def __parts_in_parallel(solver: Solver, args: argparse.Namespace, input_nbytes: int) -> bool:
+    # the measuring modes need both parts in this process
+    if not solver.independent_parts or args.parts == "sequential" or args.profile or args.counters or args.memory:
+        return False
+
+    return args.parts == "parallel" or (input_nbytes >= parallel_min_bytes and (os.cpu_count() or 1) > 1)
+
+
+def __timed_call(func: Callable[[Any], Any], state) -> tuple[Any, int, int, int]:
+    """func(state) and its start (perf_counter_ns), wall and CPU time - what a worker process hands back"""
+    cpu_start_ns = time.process_time_ns()
+    start_ns = time.perf_counter_ns()
+    result = func(state)
+    wall_ns = time.perf_counter_ns() - start_ns
+
+    return result, start_ns, wall_ns, time.process_time_ns() - cpu_start_ns
+
+
+def __timed_call_pickled(func: Callable[[Any], Any], pickled_state: bytes) -> tuple[Any, int, int, int]:
+    """__timed_call on the state as pickled by the parent process (the unpickling is not part of the timing)"""
+    return __timed_call(func, pickle.loads(pickled_state))
+
+
+def __run_parts_in_parallel(solver: Solver, state, tracer: Tracer) -> tuple[Any, Any]:
+    """Part b in a worker process (it gets a copy of the state), part a here meanwhile"""
+    # a sequential run (the usual one) should not pay for importing these
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        # The copy is taken here, before part a starts: submit() only queues the state, the executor's feeder thread
+        # pickles it later on - while part a may be sorting it in place (numpy releases the GIL while it sorts)
+        pickled_state = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        future_b = executor.submit(__timed_call_pickled, solver.part_b, pickled_state)
+        with tracer.span("part_a"):
+            result_a = solver.part_a(state)
+        result_b, start_ns, wall_ns, cpu_ns = future_b.result()
+
+    tracer.add_measured("part_b", start_ns, wall_ns, cpu_ns)
+
+    return result_a, result_b
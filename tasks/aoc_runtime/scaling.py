@@ -0,0 +1,123 @@
+"""
+Empirical complexity: run a solver on generated inputs of geometrically growing size and fit the growth exponent k
+of time ~ size^k and peak memory ~ size^k (least squares on the log-log points) for parse, part a and part b.
+
+The size is the input's length in bytes, so a grid day's exponent is in its area. A step whose exponent exceeds its
+Solver's declared `complexity` (plus a tolerance, for the noise) is flagged.
+"""
+import contextlib
+import math
+import os
+from typing import Iterable, Optional
+
+from aoc_runtime import benchmark
+from aoc_runtime.memory import MemoryTracker
+from aoc_runtime.reader import InputBuffer
+from aoc_runtime.solver import Solver, load_solver
+
+# GLOBALS
+default_repetitions = 3
+default_steps = 5
+default_factor = 2.0
+default_tolerance = 0.25
+# The smallest scale per day - the slow days start small, so the biggest input still finishes
+start_scales = {"01": 0.5, "02": 1, "03": 1, "04": 0.5, "05": 0.25, "06": 0.05, "07": 0.25}
+# Generator knobs per day - the size grows with the scale, these keep the shape affordable (day 07's cost is
+# exponential in the operand count, which is a different axis than the nr of equations)
+scaling_knobs = {"07": {"operand_count": (3, 7)}}
+# Peaks below this are allocator noise, not a trend
+min_fitted_memory = 4096
+
+
+def fit_exponent(sizes: list[float], values: list[float]) -> Optional[float]:
+    """Slope of log(value) over log(size) - None if there are not two distinct sizes with positive values"""
+    points = [(math.log(size), math.log(value)) for size, value in zip(sizes, values) if size > 0 and value > 0]
+    if len({x for x, _ in points}) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+
+    return covariance / variance
+
+
+def measure_memory(solver: Solver, input_buffer: InputBuffer) -> dict[str, int]:
+    """Peak allocated memory of each step, in a separate run (tracemalloc would slow down the timed ones)"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), MemoryTracker(top_n=0) as tracker:
+        with tracker.phase("parse"):
+            state = solver.parse(input_buffer)
+        with tracker.phase("part_a"):
+            solver.part_a(state)
+        with tracker.phase("part_b"):
+            solver.part_b(state)
+
+    return {phase.name: phase.peak for phase in tracker.phases}
+
+
+class StepScaling:
+    """One step (parse, part_a, part_b) of one day: its points and fitted exponents against the declared target"""
+    def __init__(self, day_nr: str, phase: str, sizes: list[int], times_ns: list[int], peaks: list[int],
+                 target: Optional[float], tolerance: float):
+        self.day_nr = day_nr
+        self.phase = phase
+        self.sizes = sizes
+        self.times_ns = times_ns
+        self.peaks = peaks
+        self.target = target
+        self.time_exponent = fit_exponent(sizes, times_ns)
+        fitted_peaks = [(size, peak) for size, peak in zip(sizes, peaks) if peak >= min_fitted_memory]
+        self.memory_exponent = fit_exponent(*zip(*fitted_peaks)) if len(fitted_peaks) >= 2 else None
+        self.flagged = target is not None and any(exponent is not None and exponent > target + tolerance
+                                                  for exponent in (self.time_exponent, self.memory_exponent))
+
+    def as_dict(self) -> dict:
+        return {"day_nr": self.day_nr, "phase": self.phase, "sizes": self.sizes, "times_ns": self.times_ns,
+                "peaks": self.peaks, "target": self.target, "time_exponent": self.time_exponent,
+                "memory_exponent": self.memory_exponent, "flagged": self.flagged}
+
+
+def scale_day(day_nr: str, start_scale: Optional[float] = None, steps: int = default_steps,
+              factor: float = default_factor, repetitions: int = default_repetitions,
+              tolerance: float = default_tolerance, progress=None) -> list[StepScaling]:
+    solver = load_solver(day_nr)
+    start_scale = start_scales.get(day_nr, 1) if start_scale is None else start_scale
+
+    sizes = []
+    times_ns = {phase: [] for phase in benchmark.phases}
+    peaks = {phase: [] for phase in benchmark.phases}
+    for step in range(steps):
+        scale = start_scale * factor ** step
+        input_buffer = benchmark.scaled_input(day_nr, scale, **scaling_knobs.get(day_nr, {}))
+        if progress:
+            print(f"scaling {day_nr}: x{scale:g} ({input_buffer.nbytes} bytes) ...", file=progress, flush=True)
+
+        sizes.append(input_buffer.nbytes)
+        case = benchmark.bench_case(solver, input_buffer, repetitions, warmup=1, time_budget=math.inf)
+        for phase, peak in measure_memory(solver, input_buffer).items():
+            # the minimum is the least disturbed run
+            times_ns[phase].append(case["phases"][phase]["wall"]["min"])
+            peaks[phase].append(peak)
+
+    return [StepScaling(day_nr, phase, sizes, times_ns[phase], peaks[phase], solver.complexity.get(phase), tolerance)
+            for phase in benchmark.phases]
+
+
+def scale_days(days: Optional[Iterable[str]] = None, **kwargs) -> list[StepScaling]:
+    days = list(days) if days else benchmark.discover_days()
+    return [step_scaling for day_nr in days for step_scaling in scale_day(day_nr, **kwargs)]
+
+
+def format_report(scalings: list[StepScaling]) -> str:
+    def exponent(value: Optional[float]) -> str:
+        return f"{value:.2f}" if value is not None else "-"
+
+    lines = [f"{'day':<4} {'phase':<7} {'sizes (bytes)':<24} {'time k':>7} {'memory k':>9} {'target':>7}  verdict"]
+    for scaling in scalings:
+        sizes = f"{scaling.sizes[0]}..{scaling.sizes[-1]}"
+        verdict = "WORSE THAN TARGET" if scaling.flagged else ("ok" if scaling.target is not None else "no target")
+        lines.append(f"{scaling.day_nr:<4} {scaling.phase:<7} {sizes:<24} {exponent(scaling.time_exponent):>7} "
+                     f"{exponent(scaling.memory_exponent):>9} {exponent(scaling.target):>7}  {verdict}")
+
+    return "\n".join(lines)
@@ -0,0 +1,79 @@
+import importlib
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from aoc_runtime.codec import ParsedCodec
+
+
+class Solver:
+    """
+    One day's puzzle split into three steps which share nothing but the state passed between them:
+        parse(lines) -> state
+        part_a(state) -> result_a
+        part_b(state) -> result_b
+
+    No module level globals are involved, so the same Solver can be fed any number of inputs in a single process.
+    With a `parsed_codec` the parsed state can be kept in the ParseCache.
+    `complexity` declares the growth exponent each step should stay within, e.g. {"part_b": 1} for linear in the
+    input size - checked for time and memory by the scaling report (aoc_runtime/scaling.py).
+    `independent_parts` declares that part_b needs nothing part_a did to the state (e.g. sorted it, or stored
+    something in it), so the runner may run the two parts at the same time, in separate processes.
+    `streaming` declares that parse() reads its input once, front to back, and keeps less than all of it - the runner
+    then hands it an InputStream (read chunk by chunk as the lines are used, pipes and compressed inputs included)
+    instead of reading the whole input first. Nothing is hashed up front, so the parse cache and result store are not
+    used.
+    `engines` are alternative Solvers of the same day (same answers, different data structures or algorithms), each
+    with its own `engine` name - picked with the runner's --engine, benchmarked side by side by the bench suite.
+    """
+    def __init__(self, day_nr: str, parse: Callable[[Iterable[str]], Any],
+                 part_a: Callable[[Any], Any], part_b: Callable[[Any], Any],
+                 parsed_codec: Optional[ParsedCodec] = None, complexity: Optional[dict[str, float]] = None,
+                 independent_parts: bool = False, streaming: bool = False, engine: str = "default",
+                 engines: Iterable["Solver"] = ()):
+        self.day_nr = day_nr
+        self.parse = parse
+        self.part_a = part_a
+        self.part_b = part_b
+        self.parsed_codec = parsed_codec
+        self.complexity = complexity or {}
+        self.independent_parts = independent_parts
+        self.streaming = streaming
+        self.engine = engine
+        self.engines = {solver.engine: solver for solver in engines}
+
+    def __repr__(self):
+        if self.engine != "default":
+            return f"Solver(day_nr={self.day_nr!r}, engine={self.engine!r})"
+        return f"Solver(day_nr={self.day_nr!r})"
+
+    @property
+    def engine_names(self) -> list[str]:
+        return [self.engine, *self.engines]
+
+    def with_engine(self, name: Optional[str]) -> "Solver":
+        """This solver, or its alternative engine of that name (None - this one)"""
+        if name is None or name == self.engine:
+            return self
+        try:
+            return self.engines[name]
+        except KeyError:
+            raise ValueError(f"day {self.day_nr} has no engine {name!r} (engines: {', '.join(self.engine_names)})") \
+                from None
+
+    def solve(self, lines: Iterable[str]) -> tuple[Any, Any]:
+        state = self.parse(lines)
+        result_a = self.part_a(state)
+        result_b = self.part_b(state)
+
+        return result_a, result_b
+
+
+def load_solver(day_nr: str | int, engine: Optional[str] = None) -> Solver:
+    """Import tasks/day_XX.py and return its module level `solver` (or its engine of that name)"""
+    module = importlib.import_module(f"day_{int(day_nr):02d}")
+    return module.solver.with_engine(engine)
+
+
+def solve_many(solver: Solver, inputs: Iterable[Iterable[str]]) -> Iterator[tuple[Any, Any]]:
+    """Solve the inputs back to back, without re-importing or re-launching anything"""
+    for lines in inputs:
+        yield solver.solve(lines)
@@ -0,0 +1,106 @@
+"""
+Start-up cost of the day modules: what importing tasks/day_XX.py takes in a fresh interpreter, and which modules that
+time goes to (`python -X importtime`). A short run is dominated by it, so the benchmark suite holds it to a budget.
+
+The heavy dependencies (numpy - also behind the Grid, more_itertools) are imported by the solvers where they are used,
+not at the top of the day modules: importing numpy takes longer than solving a small input, and importing a day should
+cost only what every day needs.
+"""
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterable, Optional
+
+# GLOBALS
+tasks_dir = Path(__file__).resolve().parents[1]
+default_repetitions = 5
+default_top_n = 10
+# Import time of a day module (the runtime included) not to exceed, in milliseconds - about twice what the days take
+# without numpy, which alone takes more
+default_startup_budget_ms = 40.0
+measure_import_code = ("import time; start = time.perf_counter_ns(); import {module}; "
+                       "print(time.perf_counter_ns() - start)")
+
+
+def __run_python(args: list[str]) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=tasks_dir, capture_output=True, text=True, check=True)
+
+
+def measure_import(module: str, repetitions: int = default_repetitions) -> list[int]:
+    """Import times (ns) of the module, each in a fresh interpreter"""
+    return [int(__run_python(["-c", measure_import_code.format(module=module)]).stdout.split()[-1])
+            for _ in range(repetitions)]
+
+
+def import_profile(module: str) -> list[tuple[str, int, int]]:
+    """(module, self us, cumulative us) of everything importing the module imports, as -X importtime reports it"""
+    stderr = __run_python(["-X", "importtime", "-c", f"import {module}"]).stderr
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    return entries
+
+
+class StartupReport:
+    """Import time of one day module, and the modules which take the most of it"""
+    def __init__(self, day_nr: str, import_ns: list[int], top_modules: list[tuple[str, int, int]],
+                 budget_ms: float = default_startup_budget_ms):
+        self.day_nr = day_nr
+        self.import_ns = import_ns
+        self.top_modules = top_modules
+        self.budget_ms = budget_ms
+
+    @property
+    def import_ms(self) -> float:
+        """The fastest of the imports - the least disturbed one"""
+        return min(self.import_ns) / 1e6
+
+    @property
+    def within_budget(self) -> bool:
+        return self.import_ms <= self.budget_ms
+
+    def as_dict(self) -> dict:
+        return {"day_nr": self.day_nr, "import_ns": self.import_ns, "import_ms": self.import_ms,
+                "budget_ms": self.budget_ms, "within_budget": self.within_budget,
+                "top_modules": [{"module": name, "self_us": self_us, "cumulative_us": cumulative_us}
+                                for name, self_us, cumulative_us in self.top_modules]}
+
+
+def measure_startup(day_nr: str, repetitions: int = default_repetitions, top_n: int = default_top_n,
+                    budget_ms: float = default_startup_budget_ms) -> StartupReport:
+    module = f"day_{day_nr}"
+    top_modules = sorted(import_profile(module), key=lambda entry: entry[1], reverse=True)[:top_n]
+
+    return StartupReport(day_nr, measure_import(module, repetitions), top_modules, budget_ms)
+
+
+def measure_days(days: Iterable[str], repetitions: int = default_repetitions, top_n: int = default_top_n,
+                 budget_ms: float = default_startup_budget_ms, progress=None) -> list[StartupReport]:
+    reports = []
+    for day_nr in days:
+        if progress:
+            print(f"measuring the start-up of day {day_nr} ...", file=progress, flush=True)
+        reports.append(measure_startup(day_nr, repetitions, top_n, budget_ms))
+
+    return reports
+
+
+def format_report(reports: list[StartupReport], show_modules: bool = True) -> str:
+    lines = []
+    for report in reports:
+        verdict = "ok" if report.within_budget else "OVER BUDGET"
+        lines.append(f"day_{report.day_nr}  import: {report.import_ms:7.2f} ms  "
+                     f"(budget: {report.budget_ms:.0f} ms)  {verdict}")
+        if show_modules:
+            for name, self_us, cumulative_us in report.top_modules:
+                lines.append(f"    {self_us / 1000:7.2f} ms self  {cumulative_us / 1000:7.2f} ms cumulative  {name}")
+
+    return "\n".join(lines)
+
+
+def over_budget(reports: Optional[list[StartupReport]]) -> list[StartupReport]:
+    return [report for report in reports or [] if not report.within_budget]
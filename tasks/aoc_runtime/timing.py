@@ -0,0 +1,193 @@
+import functools
+import json
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+# GLOBALS
+# Every span is aggregated, but only this many are kept one by one (for the trace) - hot loops can have millions
+default_max_events = 100_000
+
+
+def _children_cpu_ns() -> int:
+    times = os.times()
+    return int((times.children_user + times.children_system) * 1e9)
+
+
+class SpanStats:
+    """Aggregation of all the calls of one span (same name, same parents)"""
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self.wall_ns = 0
+        self.cpu_ns = 0
+        self.children_cpu_ns = 0
+        self.min_wall_ns: Optional[int] = None
+        self.max_wall_ns = 0
+
+    def add(self, wall_ns: int, cpu_ns: int, children_cpu_ns: int):
+        self.count += 1
+        self.wall_ns += wall_ns
+        self.cpu_ns += cpu_ns
+        self.children_cpu_ns += children_cpu_ns
+        self.min_wall_ns = wall_ns if self.min_wall_ns is None else min(self.min_wall_ns, wall_ns)
+        self.max_wall_ns = max(self.max_wall_ns, wall_ns)
+
+    def as_dict(self) -> dict:
+        return {"path": self.path, "count": self.count, "wall_ns": self.wall_ns, "cpu_ns": self.cpu_ns,
+                "children_cpu_ns": self.children_cpu_ns, "min_wall_ns": self.min_wall_ns,
+                "max_wall_ns": self.max_wall_ns}
+
+
+class Span:
+    """One timed block - see Tracer.span()"""
+    __slots__ = ("tracer", "name", "path", "start_ns", "cpu_start_ns", "children_cpu_start_ns")
+
+    def __init__(self, tracer: "Tracer", name: str):
+        self.tracer = tracer
+        self.name = name
+        self.path = name
+        self.start_ns = 0
+        self.cpu_start_ns = 0
+        self.children_cpu_start_ns = 0
+
+    def __enter__(self) -> "Span":
+        stack = self.tracer.stack
+        if stack:
+            self.path = f"{stack[-1].path}/{self.name}"
+        stack.append(self)
+        if self.path not in self.tracer.stats:
+            # registered on entry, so parents get listed before their children
+            self.tracer.stats[self.path] = SpanStats(self.path)
+        self.children_cpu_start_ns = _children_cpu_ns()
+        self.cpu_start_ns = time.process_time_ns()
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        end_ns = time.perf_counter_ns()
+        cpu_ns = time.process_time_ns() - self.cpu_start_ns
+        children_cpu_ns = _children_cpu_ns() - self.children_cpu_start_ns
+        self.tracer.stack.pop()
+        self.tracer.record(self, end_ns - self.start_ns, cpu_ns, children_cpu_ns)
+
+
+class Tracer:
+    """
+    Collects nested spans: wall time (perf_counter_ns, so I/O waits included), CPU time of this process and CPU time
+    of its finished child processes.
+
+        with tracer.span("parse"):
+            ...
+
+    Spans opened inside others are aggregated under their parent's path (e.g. "part_b/candidate/simulate"), so
+    a span entered a thousand times shows up once, with its call count. Export with to_json() / to_chrome_trace().
+    """
+    def __init__(self, max_events: int = default_max_events):
+        self.max_events = max_events
+        self.origin_ns = time.perf_counter_ns()
+        self.stack: list[Span] = []
+        self.stats: dict[str, SpanStats] = {}
+        # (name, path, start_ns, wall_ns, cpu_ns)
+        self.events: list[tuple[str, str, int, int, int]] = []
+        self.dropped_events = 0
+
+    def span(self, name: str) -> Span:
+        return Span(self, name)
+
+    def add_measured(self, name: str, start_ns: int, wall_ns: int, cpu_ns: int):
+        """
+        A span measured elsewhere (e.g. in a worker process), as if it had been entered here, under the current one.
+        start_ns is a perf_counter_ns() value - the same clock in every process of the machine.
+        """
+        span = Span(self, name)
+        if self.stack:
+            span.path = f"{self.stack[-1].path}/{name}"
+        if span.path not in self.stats:
+            self.stats[span.path] = SpanStats(span.path)
+        span.start_ns = start_ns
+        self.record(span, wall_ns, cpu_ns, 0)
+
+    def record(self, span: Span, wall_ns: int, cpu_ns: int, children_cpu_ns: int):
+        self.stats[span.path].add(wall_ns, cpu_ns, children_cpu_ns)
+
+        if len(self.events) < self.max_events:
+            self.events.append((span.name, span.path, span.start_ns - self.origin_ns, wall_ns, cpu_ns))
+        else:
+            self.dropped_events += 1
+
+    def activate(self) -> "_Activation":
+        """Make this the tracer the module level span()/timed() report to, until the with block ends"""
+        return _Activation(self)
+
+    def report(self) -> str:
+        lines = []
+        for path, stats in self.stats.items():
+            depth = path.count("/")
+            name = "  " * depth + path.rsplit("/", 1)[-1]
+            lines.append(f"{name:<30} calls: {stats.count:>8}  wall: {stats.wall_ns / 1e9:.7f} sec.  "
+                         f"cpu: {stats.cpu_ns / 1e9:.7f} sec.")
+
+        return "\n".join(lines)
+
+    def to_json(self) -> dict:
+        return {"spans": [stats.as_dict() for stats in self.stats.values()],
+                "events": [{"name": name, "path": path, "start_ns": start_ns, "wall_ns": wall_ns, "cpu_ns": cpu_ns}
+                           for name, path, start_ns, wall_ns, cpu_ns in self.events],
+                "dropped_events": self.dropped_events}
+
+    def to_chrome_trace(self) -> dict:
+        """Trace event format (complete events) - load it in chrome://tracing or Perfetto"""
+        pid = os.getpid()
+        tid = threading.get_ident()
+        return {"traceEvents": [{"name": name, "cat": path, "ph": "X", "ts": start_ns / 1000, "dur": wall_ns / 1000,
+                                 "pid": pid, "tid": tid, "args": {"cpu_us": cpu_ns / 1000}}
+                                for name, path, start_ns, wall_ns, cpu_ns in self.events],
+                "displayTimeUnit": "ns"}
+
+    def dump_json(self, path: str):
+        with open(path, "w") as file:
+            json.dump(self.to_json(), file, indent=1)
+
+    def dump_chrome_trace(self, path: str):
+        with open(path, "w") as file:
+            json.dump(self.to_chrome_trace(), file)
+
+
+class _Activation:
+    def __init__(self, tracer: Tracer):
+        self.tracer = tracer
+        self.previous: Optional[Tracer] = None
+
+    def __enter__(self) -> Tracer:
+        global active_tracer
+        self.previous, active_tracer = active_tracer, self.tracer
+        return self.tracer
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global active_tracer
+        active_tracer = self.previous
+
+
+active_tracer = Tracer()
+
+
+def span(name: str) -> Span:
+    """A span on the active tracer, for the solvers: `with span("simulate"): ...`"""
+    return active_tracer.span(name)
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    """Decorator - every call of the function is a span (named after the function by default)"""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with active_tracer.span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,86 +1,348 @@
 #!/usr/bin/env python3
+import itertools
+import math
+import operator
 import os
-import re
-import sys
-import time
+import struct
+from array import array
 from collections import Counter
-from threading import Thread
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from aoc_runtime import InputBuffer, InputStream, ParsedCodec, Solver, run_solver
+from aoc_runtime.codec import dump_int_rows, load_int_rows
+from aoc_runtime.int_sort import sort_uints
+
+if TYPE_CHECKING:
+    import tempfile
+    from pathlib import Path
+
+    import numpy as np
 
 # GLOBALS
-input_data = []
-prev_time = time.process_time()
-input_timeout = 5
+# Day 01 specific
+class LocationLists:
+    """The two columns of location IDs - the state shared between part 'a' and part 'b'"""
+    def __init__(self):
+        self.left_list: list[int] = []
+        self.right_list: list[int] = []
 
 
-# Day 01 specific globals
-left_list = list()
-right_list = list()
+class LocationArrays:
+    """The two columns as int64 NumPy arrays - the state of the numpy engine"""
+    def __init__(self, left_array: "np.ndarray", right_array: "np.ndarray"):
+        self.left_array = left_array
+        self.right_array = right_array
 
 
-# global exec
-filename = os.path.basename(__file__)
-day_token = re.search(r"\d+", filename)
-day_nr = day_token.group() if day_token else "unknown"
-print(f"day_nr: {day_nr}")
+class LocationIDArrays:
+    """The two columns as compact array('I') buffers - 4 bytes per ID - the state of the radix engine"""
+    def __init__(self, left_ids: array, right_ids: array):
+        self.left_ids = left_ids
+        self.right_ids = right_ids
 
 
-# MISC
+class LocationRuns:
+    """
+    The two columns as sorted runs on disk - the state of the stream engine.
+    The runs live in a temporary directory, removed together with the state.
+    Both answers come out of the same merge pass over the runs - kept here by whichever part runs it first.
+    """
+    def __init__(self, directory: "tempfile.TemporaryDirectory", left_runs: list["Path"], right_runs: list["Path"]):
+        self.directory = directory
+        self.left_runs = left_runs
+        self.right_runs = right_runs
+        self.answers: Optional[tuple[int, int]] = None
 
-def show_elapsed_time(operation: Optional[str] = None):
-    global prev_time
-    cur_time = time.process_time()
-    diff = cur_time - prev_time
-    prev_time = cur_time
-    print(" ".join(elem for elem in [f"[{cur_time}]", operation, f"took: {diff:.7f} sec."] if elem))
 
+class LocationIndex:
+    """
+    The two columns kept up to date as pairs come and go - both answers at hand after every update, no re-sorting:
 
-# READ INPUT
-def read_input():
-    global input_data
+    similarity - sum(v * left_counts[v] * right_counts[v]): an ID added to (removed from) one column adds (removes)
+                 v * its count in the other column - O(1)
+    distance   - for sorted columns of equal length, sum(|left_i - right_i|) = sum(|D(x)|) over the IDs x, with
+                 D(x) = (nr of left IDs <= x) - (nr of right IDs <= x). A pair (l, r) adds +1 to D on [l, r), or -1 on
+                 [r, l). D is kept in blocks of sqrt(ID range) IDs, each with a pending add for the whole block and a
+                 histogram of its values, so such a range add costs O(sqrt(ID range)) - whatever the nr of pairs.
+
+    The IDs must lie within id_range (half-open); the default one takes the puzzle's 5 digit IDs. The tables hold an
+    entry per ID of the range, so it can be no wider than max_id_range - for wider ones there are the other engines.
+    """
+    max_id_range = 1 << 22
+
+    def __init__(self, id_range: tuple[int, int] = (0, 100000)):
+        self.id_min, self.id_max = id_range
+        if self.id_max <= self.id_min:
+            raise ValueError(f"empty ID range: {id_range}")
+        if self.id_max - self.id_min > self.max_id_range:
+            raise ValueError(f"ID range {id_range} wider than {self.max_id_range} IDs - too wide to index")
+        size = self.id_max - self.id_min
+        self.block_size = max(1, math.isqrt(size))
+        nr_blocks = -(-size // self.block_size)
+
+        self.left_counts: Counter[int] = Counter()
+        self.right_counts: Counter[int] = Counter()
+        self.nr_pairs = 0
+        self.total_distance = 0
+        self.similarity_score = 0
+        # D(x) per ID, without the pending add of its block
+        self._values = [0] * size
+        self._pending = [0] * nr_blocks
+        self._histograms = [Counter({0: self._block_length(block)}) for block in range(nr_blocks)]
+        # nr of the block's IDs with D(x) >= 0 - pending add included
+        self._non_negative = [self._block_length(block) for block in range(nr_blocks)]
+
+    @classmethod
+    def from_pairs(cls, left_list: list[int], right_list: list[int],
+                   id_range: Optional[tuple[int, int]] = None) -> "LocationIndex":
+        """
+        Built at once - O(n + ID range); the ID range defaults to the 5 digit one, widened to the IDs given (up to
+        max_id_range)
+        """
+        if id_range is None:
+            id_range = (min(0, min(left_list, default=0), min(right_list, default=0)),
+                        max(100000, max(left_list, default=0) + 1, max(right_list, default=0) + 1))
+        location_index = cls(id_range)
+        if len(left_list) != len(right_list):
+            raise ValueError("the columns differ in length")
+        for value in (*left_list, *right_list):
+            location_index._check_id(value)
+
+        location_index.left_counts.update(left_list)
+        location_index.right_counts.update(right_list)
+        location_index.nr_pairs = len(left_list)
+        location_index.similarity_score = sum(value * count * location_index.right_counts[value]
+                                              for value, count in location_index.left_counts.items())
+
+        # D as a running sum of the counts' difference
+        values = location_index._values
+        difference = 0
+        for position in range(len(values)):
+            value = position + location_index.id_min
+            difference += location_index.left_counts.get(value, 0) - location_index.right_counts.get(value, 0)
+            values[position] = difference
+        location_index.total_distance = sum(map(abs, values))
+
+        block_size = location_index.block_size
+        for block in range(len(location_index._pending)):
+            block_values = values[block * block_size:(block + 1) * block_size]
+            location_index._histograms[block] = Counter(block_values)
+            location_index._non_negative[block] = sum(value >= 0 for value in block_values)
+
+        return location_index
+
+    def insert(self, left_elem: int, right_elem: int):
+        self._check_id(left_elem)
+        self._check_id(right_elem)
+
+        self.similarity_score += left_elem * self.right_counts[left_elem]
+        self.left_counts[left_elem] += 1
+        self.similarity_score += right_elem * self.left_counts[right_elem]
+        self.right_counts[right_elem] += 1
+        self.nr_pairs += 1
+
+        if left_elem < right_elem:
+            self._add(left_elem - self.id_min, right_elem - self.id_min, 1)
+        elif right_elem < left_elem:
+            self._add(right_elem - self.id_min, left_elem - self.id_min, -1)
+
+    def delete(self, left_elem: int, right_elem: int):
+        """Remove a pair - the IDs must be in their columns (they need not have been inserted as a pair)"""
+        if self.left_counts[left_elem] == 0 or self.right_counts[right_elem] == 0:
+            raise KeyError(f"no pair ({left_elem}, {right_elem}) to delete")
+
+        self.right_counts[right_elem] -= 1
+        self.similarity_score -= right_elem * self.left_counts[right_elem]
+        self.left_counts[left_elem] -= 1
+        self.similarity_score -= left_elem * self.right_counts[left_elem]
+        self.nr_pairs -= 1
+
+        if left_elem < right_elem:
+            self._add(left_elem - self.id_min, right_elem - self.id_min, -1)
+        elif right_elem < left_elem:
+            self._add(right_elem - self.id_min, left_elem - self.id_min, 1)
+
+    def _check_id(self, value: int):
+        if not self.id_min <= value < self.id_max:
+            raise ValueError(f"location ID {value} out of the index' range [{self.id_min}, {self.id_max})")
+
+    def _block_length(self, block: int) -> int:
+        return min(self.block_size, len(self._values) - block * self.block_size)
+
+    def _add(self, start: int, end: int, delta: int):
+        """D(x) += delta (+1 / -1) for the positions [start, end)"""
+        block_size = self.block_size
+        first_block, last_block = start // block_size, (end - 1) // block_size
+        if first_block == last_block:
+            self._add_positions(start, end, delta)
+            return
+
+        self._add_positions(start, (first_block + 1) * block_size, delta)
+        for block in range(first_block + 1, last_block):
+            self._add_block(block, delta)
+        self._add_positions(last_block * block_size, end, delta)
+
+    def _add_positions(self, start: int, end: int, delta: int):
+        """Position by position, within one block"""
+        block = start // self.block_size
+        pending = self._pending[block]
+        histogram = self._histograms[block]
+        values = self._values
+        for position in range(start, end):
+            value = values[position]
+            current = value + pending
+            self.total_distance += abs(current + delta) - abs(current)
+            if (current >= 0) != (current + delta >= 0):
+                self._non_negative[block] += delta
+            histogram[value] -= 1
+            histogram[value + delta] += 1
+            values[position] = value + delta
+
+    def _add_block(self, block: int, delta: int):
+        """The whole block at once - only its pending add changes"""
+        length = self._block_length(block)
+        non_negative = self._non_negative[block]
+        pending = self._pending[block]
+        if delta > 0:
+            # |D| grows where D >= 0 and shrinks where D < 0; the -1s become 0s
+            self.total_distance += non_negative - (length - non_negative)
+            self._non_negative[block] += self._histograms[block].get(-1 - pending, 0)
+        else:
+            # |D| grows where D <= 0 and shrinks where D > 0; the 0s become -1s
+            zeros = self._histograms[block].get(-pending, 0)
+            self.total_distance += (length - non_negative + zeros) - (non_negative - zeros)
+            self._non_negative[block] -= zeros
+        self._pending[block] = pending + delta
 
-    # print("reading input... START")
 
-    cnt = 0
-    for line in sys.stdin:
-        cnt += 1
-        # print(f"[{cnt}] '{line}'")
+# global exec
+day_nr = os.path.splitext(os.path.basename(__file__))[0].removeprefix("day_")
+# the nr of pairs - followed by the left, then the right column
+arrays_header = struct.Struct("<Q")
+# location IDs per sorted run of the stream engine - what it holds in memory while parsing, per column
+stream_run_size = 1 << 18
+
 
+# READ INPUT
+def parse_input(lines: Iterable[str]) -> LocationLists:
+    location_lists = LocationLists()
+
+    # split the columns to two lists
+    for line in lines:
         val = line.strip().split()
         if len(val) > 0:
-            input_data.append(val)
+            left_elem, right_elem = val
+            location_lists.left_list.append(int(left_elem))
+            location_lists.right_list.append(int(right_elem))
+
+    return location_lists
+
+
+def dump_parsed(location_lists: LocationLists) -> bytes:
+    return dump_int_rows([location_lists.left_list, location_lists.right_list])
+
+
+def load_parsed(buffer: memoryview) -> LocationLists:
+    location_lists = LocationLists()
+    location_lists.left_list, location_lists.right_list = load_int_rows(buffer)
+
+    return location_lists
+
+
+def parse_input_numpy(lines: Iterable[str]) -> LocationArrays:
+    """Both columns at once, straight from the text - no per-line split() and int()"""
+    import numpy as np
+
+    text = lines.text() if isinstance(lines, InputBuffer) else "\n".join(lines)
+    if not text.strip():
+        # fromstring() would make a [0] of it
+        return LocationArrays(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+    pairs = np.fromstring(text, dtype=np.int64, sep=" ").reshape(-1, 2)
+
+    return LocationArrays(np.ascontiguousarray(pairs[:, 0]), np.ascontiguousarray(pairs[:, 1]))
 
-    # print("reading input... END")
 
+def dump_parsed_numpy(location_arrays: LocationArrays) -> bytes:
+    return (arrays_header.pack(len(location_arrays.left_array)) + location_arrays.left_array.tobytes()
+            + location_arrays.right_array.tobytes())
 
-def controlled_input_read():
-    read_input_thread = Thread(target=read_input, daemon=True, )
-    read_input_thread.start()
-    read_input_thread.join(timeout=input_timeout)
-    if read_input_thread.is_alive():
-        print(f"Timeout limit ({input_timeout} sec.) reached - exiting")
-        sys.exit(1)
+
+def load_parsed_numpy(buffer: memoryview) -> LocationArrays:
+    import numpy as np
+
+    (nr_pairs,) = arrays_header.unpack_from(buffer)
+    # part 'a' sorts the columns in place
+    columns = np.frombuffer(buffer, dtype=np.int64, count=2 * nr_pairs, offset=arrays_header.size).copy()
+
+    return LocationArrays(columns[:nr_pairs], columns[nr_pairs:])
+
+
+def parse_input_radix(lines: Iterable[str]) -> LocationIDArrays:
+    """All the IDs into one array('I'), the columns sliced out of it (the IDs are non-negative, below 2**32)"""
+    text = lines.text() if isinstance(lines, InputBuffer) else "\n".join(lines)
+    ids = array("I", map(int, text.split()))
+
+    return LocationIDArrays(ids[::2], ids[1::2])
+
+
+def dump_parsed_radix(location_ids: LocationIDArrays) -> bytes:
+    return arrays_header.pack(len(location_ids.left_ids)) + location_ids.left_ids.tobytes() \
+        + location_ids.right_ids.tobytes()
+
+
+def load_parsed_radix(buffer: memoryview) -> LocationIDArrays:
+    (nr_pairs,) = arrays_header.unpack_from(buffer)
+    left_ids, right_ids = array("I"), array("I")
+    column_bytes = nr_pairs * left_ids.itemsize
+    left_start = arrays_header.size
+    left_ids.frombytes(buffer[left_start:left_start + column_bytes])
+    right_ids.frombytes(buffer[left_start + column_bytes:left_start + 2 * column_bytes])
+
+    return LocationIDArrays(left_ids, right_ids)
+
+
+def parse_input_incremental(lines: Iterable[str]) -> LocationIndex:
+    location_lists = parse_input(lines)
+
+    return LocationIndex.from_pairs(location_lists.left_list, location_lists.right_list)
+
+
+def parse_input_stream(lines: Iterable[str]) -> LocationRuns:
+    """
+    The columns sorted externally: every stream_run_size pairs the collected IDs go sorted to a run file per column.
+    The input is scanned line by line - streamed by the runner (see Solver.streaming), a pipe or a compressed input
+    included, or a memory-mapped InputBuffer's lines. Nothing of the size of the input is kept in memory.
+    """
+    # only the stream engine needs these - tempfile alone takes longer to import than a small input to solve
+    import tempfile
+
+    from aoc_runtime.external_sort import RunWriter
+
+    directory = tempfile.TemporaryDirectory(prefix=f"day_{day_nr}-")
+    left_writer = RunWriter(directory.name, "left", stream_run_size)
+    right_writer = RunWriter(directory.name, "right", stream_run_size)
+
+    for line in lines.stream_lines() if isinstance(lines, (InputBuffer, InputStream)) else lines:
+        val = line.split()
+        if len(val) > 0:
+            left_elem, right_elem = val
+            left_writer.append(int(left_elem))
+            right_writer.append(int(right_elem))
+
+    return LocationRuns(directory, left_writer.close(), right_writer.close())
 
 
 # SOLUTIONS
-def find_solution_a():
+def find_solution_a(location_lists: LocationLists):
     """
     Pair up the smallest number in the left list with the smallest number in the right list,
      then the second-smallest left number with the second-smallest right number, and so on.
     To find the total distance between the left list and the right list, add up the distances between all the pairs you found.
     What is the total distance between your lists?
     """
-    global input_data, left_list, right_list
-
-    # split the columns to two lists
-    for elem in input_data:
-        left_elem, right_elem = elem
-        # print(f"{left_elem}, {right_elem}")
+    left_list, right_list = location_lists.left_list, location_lists.right_list
 
-        left_list.append(int(left_elem))
-        right_list.append(int(right_elem))
-
-    # Now sort them
+    # Sort them (in place - part 'b' gets the sorted lists)
     left_list.sort()
     right_list.sort()
 
@@ -95,43 +357,177 @@ def find_solution_a():
     return result
 
 
-def find_solution_b():
+def find_solution_b(location_lists: LocationLists):
     """
     Calculate a total similarity score by adding up each number in the left list after multiplying it by the number of
      times that number appears in the right list.
     What is the similarity score?
     """
-    global left_list, right_list
+    left_list, right_list = location_lists.left_list, location_lists.right_list
 
+    # A hash join of the two columns on the value: count both once, then a lookup per distinct left value -
+    # linear, instead of a right_list.count() scan per value. It does not depend on part 'a' having sorted them.
     left_counter = Counter(left_list)
+    right_counter = Counter(right_list)
 
     similarity_score = 0
     for value, count in left_counter.items():
-        similarity_score += count * value * right_list.count(value)
+        similarity_score += count * value * right_counter[value]
 
     result = similarity_score
 
     return result
 
 
-# MAIN
-def do_main():
-    show_elapsed_time("Initialization")
+def find_solution_a_numpy(location_arrays: LocationArrays):
+    """Part 'a' as vector operations - sort both columns, one reduction over the distances"""
+    import numpy as np
+
+    location_arrays.left_array.sort()
+    location_arrays.right_array.sort()
+
+    result = int(np.abs(location_arrays.left_array - location_arrays.right_array).sum())
+
+    return result
+
+
+def find_solution_b_numpy(location_arrays: LocationArrays):
+    """Part 'b' as vector operations - each left value's count in the right column looked up by binary search"""
+    import numpy as np
+
+    left_array = location_arrays.left_array
+    right_values, right_counts = np.unique(location_arrays.right_array, return_counts=True)
+    if len(right_values) == 0:
+        return 0
+
+    # where each left value is (or would be) among the distinct right values
+    indexes = np.searchsorted(right_values, left_array).clip(max=len(right_values) - 1)
+    found = right_values[indexes] == left_array
+
+    result = int((left_array[found] * right_counts[indexes[found]]).sum())
+
+    return result
+
+
+def __value_groups(values: Iterable[int]) -> Iterator[tuple[int, int]]:
+    """(value, count) of each run of equal values"""
+    for value, group in itertools.groupby(values):
+        yield value, sum(1 for _ in group)
+
+
+def __merge_pass(location_runs: LocationRuns) -> tuple[int, int]:
+    """
+    Both answers in one pass over the two columns, each k-way merged from its runs and read as (value, count) groups -
+    one group per column at a time, whatever the IDs:
+    distance   - sum(|D(x)|) over the IDs x, with D(x) = (nr of left IDs <= x) - (nr of right IDs <= x) (see
+                 LocationIndex): D only changes at the values of the columns, so each gap between two successive values
+                 adds |D| times its width
+    similarity - a merge join of the groups on the value
+    """
+    if location_runs.answers is not None:
+        return location_runs.answers
+
+    from aoc_runtime.external_sort import merge_runs
+
+    left_groups = __value_groups(merge_runs(location_runs.left_runs))
+    right_groups = __value_groups(merge_runs(location_runs.right_runs))
+    # an exhausted column sorts after every value
+    left_value, left_count = next(left_groups, (math.inf, 0))
+    right_value, right_count = next(right_groups, (math.inf, 0))
+
+    total_distance = similarity_score = 0
+    balance = 0
+    previous_value = None
+    while (value := min(left_value, right_value)) != math.inf:
+        if previous_value is not None:
+            total_distance += abs(balance) * (value - previous_value)
+        if left_value == right_value:
+            similarity_score += value * left_count * right_count
+        if left_value == value:
+            balance += left_count
+            left_value, left_count = next(left_groups, (math.inf, 0))
+        if right_value == value:
+            balance -= right_count
+            right_value, right_count = next(right_groups, (math.inf, 0))
+        previous_value = value
+
+    location_runs.answers = total_distance, similarity_score
+
+    return location_runs.answers
+
+
+def find_solution_a_stream(location_runs: LocationRuns):
+    """Part 'a' from the merge pass over the runs - which part 'b' then needs not repeat"""
+    result = __merge_pass(location_runs)[0]
+
+    return result
+
+
+def find_solution_b_stream(location_runs: LocationRuns):
+    """Part 'b' from the merge pass over the runs - done by part 'a' already, unless run on its own"""
+    result = __merge_pass(location_runs)[1]
+
+    return result
+
 
-    # print("read input")
-    controlled_input_read()
-    # show_elapsed_time()
+def find_solution_a_radix(location_ids: LocationIDArrays):
+    """
+    Part 'a' with the columns sorted by counting / radix sort (timsort for small ones - see aoc_runtime/int_sort.py)
+    and the distances summed at C level
+    """
+    location_ids.left_ids = sort_uints(location_ids.left_ids)
+    location_ids.right_ids = sort_uints(location_ids.right_ids)
+
+    result = sum(map(abs, map(operator.sub, location_ids.left_ids, location_ids.right_ids)))
+
+    return result
 
-    # print("len input_data:", len(input_data))
-    # print("input_data", input_data)
 
-    result_a = find_solution_a()
-    print(f"result_a: {result_a}")
-    show_elapsed_time()
+def find_solution_b_radix(location_ids: LocationIDArrays):
+    """find_solution_b()'s hash join - it takes the arrays as they are"""
+    location_lists = LocationLists()
+    location_lists.left_list, location_lists.right_list = location_ids.left_ids, location_ids.right_ids
+
+    return find_solution_b(location_lists)
+
+
+def find_solution_a_incremental(location_index: LocationIndex):
+    """The index has the answer at hand, as it does after every insert() / delete()"""
+    result = location_index.total_distance
+
+    return result
+
 
-    result_b = find_solution_b()
-    print(f"result_b: {result_b}")
-    show_elapsed_time()
+def find_solution_b_incremental(location_index: LocationIndex):
+    result = location_index.similarity_score
+
+    return result
+
+
+numpy_solver = Solver(day_nr, parse_input_numpy, find_solution_a_numpy, find_solution_b_numpy,
+                      ParsedCodec(1, dump_parsed_numpy, load_parsed_numpy),
+                      complexity={"parse": 1, "part_a": 1, "part_b": 1}, independent_parts=True, engine="numpy")
+
+radix_solver = Solver(day_nr, parse_input_radix, find_solution_a_radix, find_solution_b_radix,
+                      ParsedCodec(1, dump_parsed_radix, load_parsed_radix),
+                      complexity={"parse": 1, "part_a": 1, "part_b": 1}, independent_parts=True, engine="radix")
+
+incremental_solver = Solver(day_nr, parse_input_incremental, find_solution_a_incremental, find_solution_b_incremental,
+                            complexity={"parse": 1, "part_a": 1, "part_b": 1}, independent_parts=True,
+                            engine="incremental")
+
+# no parse cache - the state is the runs on disk. Not independent_parts: part 'b' takes its answer from part 'a's pass
+stream_solver = Solver(day_nr, parse_input_stream, find_solution_a_stream, find_solution_b_stream,
+                       complexity={"parse": 1, "part_a": 1, "part_b": 1}, streaming=True, engine="stream")
+
+solver = Solver(day_nr, parse_input, find_solution_a, find_solution_b, ParsedCodec(1, dump_parsed, load_parsed),
+                complexity={"parse": 1, "part_a": 1, "part_b": 1}, independent_parts=True,
+                engines=[numpy_solver, radix_solver, stream_solver, incremental_solver])
+
+
+# MAIN
+def do_main():
+    run_solver(solver)
 
 
 if __name__ == "__main__":
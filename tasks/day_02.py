@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 import os
-import re
-import sys
-import time
-from collections import Counter
-from threading import Thread
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable
+
+from aoc_runtime import InputBuffer, ParsedCodec, Solver, counters, run_solver
+from aoc_runtime.codec import dump_int_rows, int_rows_header, load_int_rows
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # GLOBALS
-input_data = []
-prev_time = time.process_time()
 input_timeout = 50
 
 
@@ -17,25 +16,22 @@ input_timeout = 50
 # for debug purposes (when want to run with PyCharm Debugger):
 # sys.stdin = open('../stp_cut.txt', 'r')
 
-# global exec
-filename = os.path.basename(__file__)
-day_token = re.search(r"\d+", filename)
-day_nr = day_token.group() if day_token else "unknown"
-print(f"day_nr: {day_nr}")
-
+class LevelRows:
+    """
+    All the reports at once, CSR like - the state of the numpy engine: the levels of report r are
+    levels[offsets[r]:offsets[r + 1]]
+    """
+    def __init__(self, offsets: "np.ndarray", levels: "np.ndarray"):
+        self.offsets = offsets
+        self.levels = levels
 
-# MISC
 
-def show_elapsed_time(operation: Optional[str] = None):
-    global prev_time
-    cur_time = time.process_time()
-    diff = cur_time - prev_time
-    prev_time = cur_time
-    print(" ".join(elem for elem in [f"[{cur_time}]", operation, f"took: {diff:.7f} sec."] if elem))
+# global exec
+day_nr = os.path.splitext(os.path.basename(__file__))[0].removeprefix("day_")
 
 
 # READ INPUT
-def read_input():
+def parse_input(lines: Iterable[str]) -> list[list[int]]:
     """
     The unusual data (your puzzle input) consists of many reports, one report per line. Each report is a list of numbers called levels that are separated by spaces. For example:
 
@@ -47,30 +43,46 @@ def read_input():
     1 3 6 7 9
     This example data contains six reports each containing five levels.
     """
-    global input_data
-
-    # print("reading input... START")
-
-    cnt = 0
-    for line in sys.stdin:
-        cnt += 1
-        # print(f"[{cnt}] '{line}'")
+    reports = []
 
+    for line in lines:
         str_line_list = line.strip().split()
         int_line_list = [int(elem) for elem in str_line_list]
         if len(int_line_list) > 0:
-            input_data.append(int_line_list)
+            reports.append(int_line_list)
+
+    return reports
+
+
+def parse_input_numpy(lines: Iterable[str]) -> LevelRows:
+    """The levels of all the reports in one flat int64 array, straight from the text, plus the reports' offsets"""
+    import numpy as np
+
+    text = lines.text() if isinstance(lines, InputBuffer) else "\n".join(lines)
+    lengths = [length for line in text.splitlines() if (length := len(line.split()))]
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    if not lengths:
+        # fromstring() would make a [0] of it
+        return LevelRows(offsets, np.empty(0, dtype=np.int64))
 
-    # print("reading input... END")
+    return LevelRows(offsets, np.fromstring(text, dtype=np.int64, sep=" "))
 
 
-def controlled_input_read():
-    read_input_thread = Thread(target=read_input, daemon=True, )
-    read_input_thread.start()
-    read_input_thread.join(timeout=input_timeout)
-    if read_input_thread.is_alive():
-        print(f"Timeout limit ({input_timeout} sec.) reached - exiting")
-        sys.exit(1)
+def dump_parsed_numpy(level_rows: LevelRows) -> bytes:
+    """The layout of dump_int_rows()"""
+    return (int_rows_header.pack(len(level_rows.offsets) - 1, len(level_rows.levels))
+            + level_rows.offsets.astype("<u8").tobytes() + level_rows.levels.astype("<i8").tobytes())
+
+
+def load_parsed_numpy(buffer: memoryview) -> LevelRows:
+    import numpy as np
+
+    nr_rows, nr_values = int_rows_header.unpack_from(buffer)
+    offsets = np.frombuffer(buffer, dtype="<u8", count=nr_rows + 1, offset=int_rows_header.size)
+    levels = np.frombuffer(buffer, dtype="<i8", count=nr_values, offset=int_rows_header.size + offsets.nbytes)
+
+    return LevelRows(offsets.astype(np.int64), levels.astype(np.int64))
 
 
 # SOLUTIONS
@@ -98,7 +110,7 @@ def is_safe(report: list[int]) -> bool:
     return True
 
 
-def find_solution_a():
+def find_solution_a(reports: list[list[int]]):
     """
     The engineers are trying to figure out which reports are safe. The Red-Nosed reactor safety systems can only
      tolerate levels that are either gradually increasing or gradually decreasing.
@@ -108,10 +120,8 @@ def find_solution_a():
 
     Analyze the unusual data from the engineers. How many reports are safe?
     """
-    global input_data
-
     result = 0
-    for report in input_data:
+    for report in reports:
         if is_safe(report):
             result += 1
             # print(f"report: {report} IS SAFE")
@@ -122,24 +132,44 @@ def find_solution_a():
     return result
 
 
-def is_safe_with_dampener(report: list[int]) -> bool:
-    # We need to check all variations of the list with length-1
-    # If at least one is safe - consider the original one is safe as well!
+def __first_bad_step(report: list[int], direction: int, skip: int = -1) -> int:
+    """
+    Index of the level where the first step (to the next level) is not 1..3 in the given direction (1: increasing,
+    -1: decreasing), the level at `skip` left out - or -1 if all the steps are fine
+    """
+    previous_index = -1
+    for index, elem in enumerate(report):
+        if index == skip:
+            continue
+        if previous_index >= 0 and not 1 <= (elem - report[previous_index]) * direction <= 3:
+            return previous_index
+        previous_index = index
+
+    return -1
 
-    # print(f"Original report: {report}")
-    for i in range(0, len(report)):
-        local_result = is_safe(report[:i] + report[i + 1:])
 
-        if local_result:
-            # print(f"\t Sub-report: {report[:i] + report[i + 1:]} IS SAFE")
+def is_safe_with_dampener(report: list[int]) -> bool:
+    # Is there a level which - left out - makes the report safe?
+    # For a direction, let the step from level k to the next one be the first bad one. Leaving out any level other
+    # than these two keeps them next to each other - so only k and its successor are worth a try.
+    # That is at most 3 passes per direction, and no shortened copies of the report - O(n).
+    for direction in (1, -1):
+        first_bad = __first_bad_step(report, direction)
+        if first_bad == -1:
             return True
-        else:
-            # print(f"\t Sub-report: {report[:i] + report[i + 1:]} NOT SAFE")
-            pass
+
+        # leave out level k, then its successor
+        for skip in (first_bad, first_bad + 1):
+            if __debug__:
+                counters.count("sub_reports")
+
+            if __first_bad_step(report, direction, skip) == -1:
+                # print(f"\t Report without level {skip}: IS SAFE")
+                return True
 
     return False
 
-def find_solution_b():
+def find_solution_b(reports: list[list[int]]):
     """
     The engineers are trying to figure out which reports are safe. The Red-Nosed reactor safety systems can only
      tolerate levels that are either gradually increasing or gradually decreasing.
@@ -152,10 +182,8 @@ def find_solution_b():
 
     Analyze the unusual data from the engineers. How many reports are safe?
     """
-    global input_data
-
     result = 0
-    for report in input_data:
+    for report in reports:
         if is_safe(report):
             result += 1
             # print(f"report: {report} IS SAFE")
@@ -169,24 +197,87 @@ def find_solution_b():
     return result
 
 
-# MAIN
-def do_main():
-    show_elapsed_time("Initialization")
+def __bad_steps_before(level_rows: LevelRows, direction: int) -> "np.ndarray":
+    """
+    bad_before[k] - the nr of bad steps (not 1..3 in the direction) among the steps from level j to level j + 1,
+    for all j < k - over the flat levels; a step from one report's last level to the next report is never counted
+    by the reports' ranges below
+    """
+    import numpy as np
 
-    # print("read input")
-    controlled_input_read()
-    # show_elapsed_time()
+    steps = np.diff(level_rows.levels) * direction
+    bad_before = np.zeros(len(level_rows.levels), dtype=np.int64)
+    np.cumsum((steps < 1) | (steps > 3), out=bad_before[1:])
 
-    # print("len input_data:", len(input_data))
-    # print("input_data", input_data)
+    return bad_before
 
-    result_a = find_solution_a()
-    print(f"result_a: {result_a}")
-    show_elapsed_time()
 
-    result_b = find_solution_b()
-    print(f"result_b: {result_b}")
-    show_elapsed_time()
+def find_solution_a_numpy(level_rows: LevelRows):
+    """Part 'a' for all the reports at once: a report is safe if it has no bad step in one of the directions"""
+    import numpy as np
+
+    starts, ends = level_rows.offsets[:-1], level_rows.offsets[1:] - 1
+    nonempty = ends >= starts
+    starts, ends = starts[nonempty], ends[nonempty]
+
+    safe = np.zeros(len(starts), dtype=bool)
+    for direction in (1, -1):
+        bad_before = __bad_steps_before(level_rows, direction)
+        # the steps of a report: from its first level up to (not from) its last one
+        safe |= bad_before[ends] == bad_before[starts]
+
+    result = int(np.count_nonzero(safe))
+
+    return result
+
+
+def find_solution_b_numpy(level_rows: LevelRows):
+    """
+    Part 'b' for all the reports at once: leaving out level p of a report is safe if, in one of the directions,
+    the steps before p - 1 and after p + 1 are all fine (prefix counts of the bad steps) and so is the step bridging
+    p - 1 to p + 1 - checked for every level of every report as vector operations; a report is safe if any is
+    """
+    import numpy as np
+
+    levels, offsets = level_rows.levels, level_rows.offsets
+    nr_reports = len(offsets) - 1
+    if len(levels) == 0:
+        return 0
+
+    lengths = np.diff(offsets)
+    report_of_level = np.repeat(np.arange(nr_reports), lengths)
+    positions = np.arange(len(levels))
+    starts = offsets[:-1][report_of_level]
+    ends = offsets[1:][report_of_level] - 1
+    interior = (positions > starts) & (positions < ends)
+    previous_levels = levels[np.maximum(positions - 1, 0)]
+    next_levels = levels[np.minimum(positions + 1, len(levels) - 1)]
+
+    safe_without = np.zeros(len(levels), dtype=bool)
+    for direction in (1, -1):
+        bad_before = __bad_steps_before(level_rows, direction)
+        bad_prefix = bad_before[np.maximum(positions - 1, starts)] - bad_before[starts]
+        bad_suffix = bad_before[ends] - bad_before[np.minimum(positions + 1, ends)]
+        bridge = (next_levels - previous_levels) * direction
+        bridge_fine = ~interior | ((bridge >= 1) & (bridge <= 3))
+        safe_without |= (bad_prefix == 0) & (bad_suffix == 0) & bridge_fine
+
+    result = int(np.count_nonzero(np.bincount(report_of_level, weights=safe_without, minlength=nr_reports)))
+
+    return result
+
+
+numpy_solver = Solver(day_nr, parse_input_numpy, find_solution_a_numpy, find_solution_b_numpy,
+                      ParsedCodec(1, dump_parsed_numpy, load_parsed_numpy),
+                      complexity={"parse": 1, "part_a": 1, "part_b": 1}, independent_parts=True, engine="numpy")
+
+solver = Solver(day_nr, parse_input, find_solution_a, find_solution_b, ParsedCodec(1, dump_int_rows, load_int_rows),
+                complexity={"parse": 1, "part_a": 1, "part_b": 1}, independent_parts=True, engines=[numpy_solver])
+
+
+# MAIN
+def do_main():
+    run_solver(solver, timeout=input_timeout)
 
 
 if __name__ == "__main__":
@@ -2,66 +2,25 @@
 
 import os
 import re
-import sys
-import time
-from threading import Thread
-from typing import Optional
-
-# GLOBALS
-input_data = []
-prev_time = time.process_time()
-input_timeout = 5
-
-filename = os.path.basename(__file__)
-day_token = re.search(r"\d+", filename)
-day_nr = day_token.group() if day_token else "unknown"
-print(f"day_nr: {day_nr}")
+from typing import Iterable
 
+from aoc_runtime import ParsedCodec, Solver, run_solver
+from aoc_runtime.codec import dump_lines, load_lines
 
-# MISC
-
-def show_elapsed_time(operation: Optional[str] = None):
-    global prev_time
-    cur_time = time.process_time()
-    diff = cur_time - prev_time
-    prev_time = cur_time
-    print(" ".join(elem for elem in [f"[{cur_time}]", operation, f"took: {diff:.7f} sec."] if elem))
+# GLOBALS
+day_nr = os.path.splitext(os.path.basename(__file__))[0].removeprefix("day_")
 
 
 # READ INPUT
-def read_input():
-    global input_data
-
-    # print("reading input... START")
-
-    cnt = 0
-    for line in sys.stdin:
-        cnt += 1
-        # print(f"[{cnt}] {line}")
-
-        # val = line.strip()
-        # if len(val) > 0:
-        input_data.append(line.strip())
-
-    # print("reading input... END")
-
-
-def controlled_input_read():
-    read_input_thread = Thread(target=read_input, daemon=True, )
-    read_input_thread.start()
-    read_input_thread.join(timeout=input_timeout)
-    if read_input_thread.is_alive():
-        print(f"Timeout limit ({input_timeout} sec.) reached - exiting")
-        sys.exit(1)
+def parse_input(lines: Iterable[str]) -> list[str]:
+    return [line.strip() for line in lines]
 
 
 # SOLUTIONS
-def find_solution_a():
+def find_solution_a(input_data: list[str]):
     """
     Scan the corrupted memory for uncorrupted mul instructions. What do you get if you add up all the results of the multiplications?
     """
-    global input_data
-
     # It does that with instructions like mul(X,Y), where X and Y are each 1-3 digit numbers.
     mul_pattern = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)")
     # print(f"re.findall(mul_pattern, input_data): {re.findall(mul_pattern, input_data[0])}")
@@ -77,7 +36,7 @@ def find_solution_a():
     return result
 
 
-def find_solution_b():
+def find_solution_b(input_data: list[str]):
     """
     There are two new instructions you'll need to handle:
 
@@ -85,8 +44,6 @@ def find_solution_b():
     The don't() instruction disables future mul instructions.
     Only the most recent do() or don't() instruction applies. At the beginning of the program, mul instructions are enabled.
     """
-    global input_data
-
     # It does that with instructions like mul(X,Y), where X and Y are each 1-3 digit numbers.
     mul_pattern = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)")
     # print(f"re.findall(mul_pattern, input_data): {re.findall(mul_pattern, input_data[0])}")
@@ -105,24 +62,13 @@ def find_solution_b():
     return result
 
 
-# MAIN
-def do_main():
-    show_elapsed_time()
+solver = Solver(day_nr, parse_input, find_solution_a, find_solution_b, ParsedCodec(1, dump_lines, load_lines),
+                complexity={"parse": 1, "part_a": 1, "part_b": 1}, independent_parts=True)
 
-    # print("read input")
-    controlled_input_read()
 
-    show_elapsed_time()
-    # print("len input_data:", len(input_data))
-    # print("input_data", input_data)
-
-    result_a = find_solution_a()
-    print(f"result_a: {result_a}")
-    show_elapsed_time()
-
-    result_b = find_solution_b()
-    print(f"result_b: {result_b}")
-    show_elapsed_time()
+# MAIN
+def do_main():
+    run_solver(solver)
 
 
 if __name__ == "__main__":
@@ -1,66 +1,52 @@
 #!/usr/bin/env python3
 
 import os
-import re
-import sys
-import time
-from threading import Thread
-from typing import Optional
+from typing import Iterable
 
-# GLOBALS
-input_data = []
-prev_time = time.process_time()
-input_timeout = 5
+from aoc_runtime import ParsedCodec, Solver, counters, run_solver
+from aoc_runtime.codec import dump_int_rows, load_int_rows
 
-filename = os.path.basename(__file__)
-day_token = re.search(r"\d+", filename)
-day_nr = day_token.group() if day_token else "unknown"
-print(f"day_nr: {day_nr}")
+# GLOBALS
+day_nr = os.path.splitext(os.path.basename(__file__))[0].removeprefix("day_")
 
 
 # Day 05 specific
-rules_list_raw: list[str] = [] # will hold raw input in form of "X|Y"
-rules_list_ordered: list[int] = [] # will hold the constructed ordered list of rules
-incorrect_updates: list[list[int]] = []
-
-# MISC
-
-def show_elapsed_time(operation: Optional[str] = None):
-    global prev_time
-    cur_time = time.process_time()
-    diff = cur_time - prev_time
-    prev_time = cur_time
-    print(" ".join(elem for elem in [f"[{cur_time}]", operation, f"took: {diff:.7f} sec."] if elem))
+class PrintQueue:
+    """Page ordering rules plus the updates - the state shared between part 'a' and part 'b'"""
+    def __init__(self):
+        self.rules_list_raw: list[str] = [] # will hold raw input in form of "X|Y"
+        self.rules_list_ordered: list[int] = [] # will hold the constructed ordered list of rules
+        self.updates: list[list[int]] = []
+        self.incorrect_updates: list[list[int]] = []
 
 
 # READ INPUT
-def read_input():
-    global input_data
-
-    # print("reading input... START")
-
-    cnt = 0
-    for line in sys.stdin:
-        cnt += 1
-        # print(f"[{cnt}] {line}")
+def parse_input(lines: Iterable[str]) -> PrintQueue:
+    print_queue = PrintQueue()
 
+    for line in lines:
         val = line.strip()
         if len(val) > 0:
             if "|" in line:
-                rules_list_raw.append(val)
+                print_queue.rules_list_raw.append(val)
             else:
-                input_data.append([int(elem) for elem in val.split(",")])
+                print_queue.updates.append([int(elem) for elem in val.split(",")])
+
+    return print_queue
+
 
-    # print("reading input... END")
+def dump_parsed(print_queue: PrintQueue) -> bytes:
+    # 1st row - all the rules "X|Y" flattened to X, Y, ..., then the updates
+    rules_row = [int(page) for rule in print_queue.rules_list_raw for page in rule.split("|")]
+    return dump_int_rows([rules_row] + print_queue.updates)
 
 
-def controlled_input_read():
-    read_input_thread = Thread(target=read_input, daemon=True, )
-    read_input_thread.start()
-    read_input_thread.join(timeout=input_timeout)
-    if read_input_thread.is_alive():
-        print(f"Timeout limit ({input_timeout} sec.) reached - exiting")
-        sys.exit(1)
+def load_parsed(buffer: memoryview) -> PrintQueue:
+    print_queue = PrintQueue()
+    rules_row, *print_queue.updates = load_int_rows(buffer)
+    print_queue.rules_list_raw = [f"{first}|{second}" for first, second in zip(rules_row[::2], rules_row[1::2])]
+
+    return print_queue
 
 
 # SOLUTIONS
@@ -68,9 +54,7 @@ def __get_middle_elem(input_list: list[int]):
     return input_list[len(input_list) // 2]
 
 
-def __check_list_in_order(input_list: list[int]) -> bool:
-    global rules_list_ordered
-
+def __check_list_in_order(input_list: list[int], rules_list_ordered: list[int]) -> bool:
     input_list_indexes_in_ordered_rules = []
     for elem in input_list:
         input_list_indexes_in_ordered_rules.append(rules_list_ordered.index(elem))
@@ -87,9 +71,12 @@ def __check_list_in_order(input_list: list[int]) -> bool:
     return result
 
 
-def __is_update_correct(input_list):
+def __is_update_correct(input_list, rules_list_raw: list[str]):
     is_there_broken_rule = False
     for first, second in zip(input_list, input_list[1:]):
+        if __debug__:
+            counters.count("rule_lookups")
+
         str_to_check = f"{first}|{second}"
         if str_to_check not in rules_list_raw:
             is_there_broken_rule = True
@@ -99,18 +86,16 @@ def __is_update_correct(input_list):
     return not is_there_broken_rule
 
 
-def find_solution_a():
+def find_solution_a(print_queue: PrintQueue):
     """
     What do you get if you add up the middle page number from those correctly-ordered updates?
     """
-    global incorrect_updates
-
     # K, I got the rules, I got the data
     # Let's check if the lists are correct according to the rules...
 
     middle_elems_list = []
 
-    for input_list in input_data:
+    for input_list in print_queue.updates:
     #     if __check_list_in_order(input_list):
     #         middle_elems_list.append(__get_middle_elem(input_list))
     #         # print(f"GUT -> {input_list}")
@@ -119,18 +104,18 @@ def find_solution_a():
 
     # New approach - compare each pair N|N+1 with the set of raw rules, if there's a rule for this pair - we're good.
     # If all pairs are good - pronounce the update as GOOD.
-        if __is_update_correct(input_list):
+        if __is_update_correct(input_list, print_queue.rules_list_raw):
             middle_elems_list.append(__get_middle_elem(input_list))
         else:
             # Keep the incorrect updates for part 'b'
-            incorrect_updates.append(input_list)
+            print_queue.incorrect_updates.append(input_list)
 
     result = sum(middle_elems_list)
 
     return result
 
 
-def __check_and_swap_last_pair_if_need(fixed_update):
+def __check_and_swap_last_pair_if_need(fixed_update, rules_list_raw: list[str]):
     """Return True if the object have been altered"""
     if len(fixed_update) < 2:
         return False
@@ -149,11 +134,14 @@ def __check_and_swap_last_pair_if_need(fixed_update):
             raise Exception("Triple fok")
 
 
-def find_solution_b():
+def find_solution_b(print_queue: PrintQueue):
     """
     Find the updates which are not in the correct order.
     What do you get if you add up the middle page numbers after correctly ordering just those updates?
     """
+    rules_list_raw = print_queue.rules_list_raw
+    # Work on a copy - the not yet fixed updates get re-queued at its end
+    incorrect_updates = list(print_queue.incorrect_updates)
     fixed_updates = []
 
     for incorrect_update in incorrect_updates:
@@ -183,7 +171,7 @@ def find_solution_b():
 
             # print(f"\t ... update: {fixed_update}")
             # but newly constructed last pair may be incorrect - check and alter if needed
-            if __check_and_swap_last_pair_if_need(fixed_update):
+            if __check_and_swap_last_pair_if_need(fixed_update, rules_list_raw):
                 # print(f"\t altered update: {fixed_update}")
                 pass
 
@@ -193,7 +181,7 @@ def find_solution_b():
             fixed_update.append(first)
 
         # print(f"FIXED update: {fixed_update}")
-        if __is_update_correct(fixed_update):
+        if __is_update_correct(fixed_update, rules_list_raw):
             fixed_updates.append(fixed_update)
         else:
             # print(f"Still incorrect: {incorrect_update} -> {fixed_update}")
@@ -215,8 +203,8 @@ def __local_debug_conditional(message: str, condition: bool):
         print(message)
 
 
-def __construct_ordered_rules_list():
-    global rules_list_raw, rules_list_ordered
+def __construct_ordered_rules_list(print_queue: PrintQueue):
+    rules_list_raw, rules_list_ordered = print_queue.rules_list_raw, print_queue.rules_list_ordered
 
     # Example data:
     # 47|53
@@ -276,22 +264,20 @@ def __construct_ordered_rules_list():
         # __local_debug_conditional(f"Resulting rules_list_ordered: {rules_list_ordered}", _local_debug_cond_var)
 
     __local_debug_conditional("-----------------------------", _local_debug_cond_var)
-    # Now the global rules_list_ordered should be set properly ;)
+    # Now the print_queue.rules_list_ordered should be set properly ;)
 
-# MAIN
-def do_main():
-    show_elapsed_time()
+solver = Solver(day_nr, parse_input, find_solution_a, find_solution_b, ParsedCodec(1, dump_parsed, load_parsed),
+                complexity={"parse": 1, "part_a": 1, "part_b": 1})
 
-    # print("read input")
-    controlled_input_read()
 
-    show_elapsed_time()
+# MAIN
+def do_main():
     # print(f"input_data [{len(input_data)}]: {input_data}")
     #
     # print(f"rules_list_raw [{len(rules_list_raw)}]: {rules_list_raw}")
 
     # Construct the ordered rules list...
-    # __construct_ordered_rules_list()
+    # __construct_ordered_rules_list(print_queue)
     # print(f"rules_list_ordered [{len(rules_list_ordered)}]: {rules_list_ordered}")
 
     # Hm... why not parsing the rules until the result is stable?!?
@@ -299,22 +285,14 @@ def do_main():
     # while True:
     #     cnt += 1
     #     prev_rules_list = rules_list_ordered.copy()
-    #     __construct_ordered_rules_list()
+    #     __construct_ordered_rules_list(print_queue)
     #     print(f"{cnt} time, rules_list_ordered [{len(rules_list_ordered)}]: {rules_list_ordered}")
     #
     #     if prev_rules_list == rules_list_ordered or cnt > 5:
     #         break
 
     # K, new approach - use the raw rules list...
-
-
-    result_a = find_solution_a()
-    print(f"result_a: {result_a}")
-    show_elapsed_time()
-
-    result_b = find_solution_b()
-    print(f"result_b: {result_b}")
-    show_elapsed_time()
+    run_solver(solver)
 
 
 if __name__ == "__main__":
@@ -1,24 +1,17 @@
 #!/usr/bin/env python3
 from enum import Enum
 
-import numpy as np
 import os
-import re
-import sys
-import time
-from threading import Thread
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
+from aoc_runtime import ParsedCodec, Solver, counters, run_solver, span, timed
+
+if TYPE_CHECKING:
+    from aoc_runtime.grid import Grid
 
-# GLOBALS
-input_data = []
-prev_time = time.process_time()
-input_timeout = 5
 
-filename = os.path.basename(__file__)
-day_token = re.search(r"\d+", filename)
-day_nr = day_token.group() if day_token else "unknown"
-print(f"day_nr: {day_nr}")
+# GLOBALS
+day_nr = os.path.splitext(os.path.basename(__file__))[0].removeprefix("day_")
 
 
 # Day 06 specific
@@ -58,87 +51,49 @@ class FieldType(Enum):
     def __repr__(self):
         return str(self.value)
 
-class Field:
-    def __init__(self, value: Optional[FieldType] = FieldType.EMPTY):
-        self.value = value
-
-    def __str__(self):
-        return str(self.value.value)
-
-    def __repr__(self):
-        return str(self.value.value)
-
-class Map:
-    # The mapped area itself - 2d array of Field objects
-    def __init__(self, data: Optional[list[list[Field]]] = None):
-        """
-        Numpy's array can be traversed using nditer:
-            a = np.arange(6).reshape(2,3)
-            it = np.nditer(a, flags=['multi_index'])
-            for x in it:
-                print("%d <%s>" % (x, it.multi_index), end=' ')
-
-            # 0 <(0, 0)> 1 <(0, 1)> 2 <(0, 2)> 3 <(1, 0)> 4 <(1, 1)> 5 <(1, 2)>
-
-        Numpy's ndenumerate can be used as well:
-            a = np.array([[1, 2], [3, 4]])
-            for index, x in np.ndenumerate(a):
-                print(index, x)
-
-            # (0, 0) 1
-            # (0, 1) 2
-            # (1, 0) 3
-            # (1, 1) 4
-        """
-        self.map: np.array = np.array(data, dtype=Field) if data else np.zeros(0)
 
-    def find_first(self, values: list[FieldType]) -> Optional[tuple]:
-        # print(f"Looking for {values}")
-        for index, elem in np.ndenumerate(self.map):
-            # print(f"\tChecking, index: {index}, elem: {elem}, elem.value: {elem.value}, type: {type(elem)}")
-            if elem.value in values:
-                return index
+# The room is a Grid of the fields' bytes - only the single character fields are ever put on the map.
+# The guard facing up, right, down, left - clockwise, in the order of the Grid's orthogonal_directions
+guard_codes = tuple(ord(field.value) for field in (FieldType.GUARD_UP, FieldType.GUARD_RIGHT,
+                                                   FieldType.GUARD_DOWN, FieldType.GUARD_LEFT))
+obstacle_codes = (ord(FieldType.OBSTACLE.value), ord(FieldType.ARTIFICIAL_OBSTACLE.value))
+artificial_obstacle_code = ord(FieldType.ARTIFICIAL_OBSTACLE.value)
 
-        return None
 
-    def find_all(self, values: list[FieldType]) -> list[tuple]:
-        return [index for index, elem in np.ndenumerate(self.map) if elem.value in values]
+class Room:
+    # The mapped area itself - a Grid (2d uint8 array) of the fields' characters
+    def __init__(self, grid: Optional["Grid"] = None):
+        from aoc_runtime.grid import orthogonal_directions
 
-
-class Room(Map):
-    def __init__(self, data: Optional[list[list[Field]]] = None):
-        super().__init__(data)
-        # other attributes will go here later...
+        self.map: Optional["Grid"] = grid
+        self.directions: tuple[tuple[int, int], ...] = orthogonal_directions
         self.current_position: Optional[tuple[int, int]] = None
         self.guards_path_till_exit: list[tuple[int, int]] = []
         self.possible_artificial_obstacles: list[tuple[int, int]] = []
+        # the map as read, to be able to re-create the vanilla room
+        self.vanilla_map: Optional["Grid"] = grid.copy() if grid is not None else None
 
     def get_current_position(self):
         if self.current_position:
             return self.current_position
         else:
             # Initially, we need to find the starting position...
-            starting_position = self.find_first([FieldType.GUARD_UP, FieldType.GUARD_DOWN, FieldType.GUARD_LEFT, FieldType.GUARD_RIGHT])
+            starting_position = self.map.find_first(bytes(guard_codes))
             if not starting_position:
                 raise ValueError("No starting position found!")
             self.current_position = starting_position
-            print(f"Starting position: {starting_position}[{self.map[starting_position]}]")
+            print(f"Starting position: {starting_position}[{self.map.char(starting_position)}]")
             return starting_position
 
     def is_valid_position(self, position: tuple[int, int]) -> bool:
-        row_index, col_index = position
-        if 0 <= row_index < self.map.shape[0] and 0 <= col_index < self.map.shape[1]:
-            return True
-        else:
-            # print(f"Invalid position: {position}, current position: {self.current_position}[{self.map[self.current_position] if self.current_position != position else 'OUT'}]")
-            return False
+        return self.map.in_bounds(position)
 
     def move_possible(self, source: tuple[int, int], target: tuple[int, int]):
         if not self.is_valid_position(target):
             return True
 
-        if self.map[target].value not in [FieldType.OBSTACLE, FieldType.ARTIFICIAL_OBSTACLE]:
-            # print(f"Move possible from {source} to {target} [{self.map[target].value}]")
+        if self.map[target] not in obstacle_codes:
+            # print(f"Move possible from {source} to {target} [{self.map.char(target)}]")
             return True
 
         return False
@@ -147,104 +102,58 @@ class Room(Map):
         """Try to perform a step and return new occupied/current field's coordinates if possible. Else return None
         :returns (next_x, next_y) or None
         """
-        curr_idx_row, curr_idx_col = self.get_current_position()
-        # print(f"Current element: {self.map[curr_idx_row, curr_idx_col]} ({curr_idx_row}, {curr_idx_col})")
-
-        curr_direction = self.map[curr_idx_row, curr_idx_col].value
-        # If a move is not possible (obstacle) try to rotate 90 degrees right and perform it...
-        if curr_direction == FieldType.GUARD_UP:
-            # try go up
-            if self.move_possible((curr_idx_row, curr_idx_col), (curr_idx_row - 1, curr_idx_col)):
-                new_idx_row, new_idx_col = (curr_idx_row - 1, curr_idx_col)
-                new_guard_position = Field(FieldType.GUARD_UP)
-            else: # only rotate, don't advance
-                new_idx_row, new_idx_col = (curr_idx_row, curr_idx_col)
-                new_guard_position = Field(FieldType.GUARD_RIGHT)
-        elif curr_direction == FieldType.GUARD_RIGHT:
-            # try go right
-            if self.move_possible((curr_idx_row, curr_idx_col), (curr_idx_row, curr_idx_col + 1)):
-                new_idx_row, new_idx_col = (curr_idx_row, curr_idx_col + 1)
-                new_guard_position = Field(FieldType.GUARD_RIGHT)
-            else: # only rotate, don't advance
-                new_idx_row, new_idx_col = (curr_idx_row, curr_idx_col)
-                new_guard_position = Field(FieldType.GUARD_DOWN)
-        elif curr_direction == FieldType.GUARD_DOWN:
-            # try go down
-            if self.move_possible((curr_idx_row, curr_idx_col), (curr_idx_row + 1, curr_idx_col)):
-                new_idx_row, new_idx_col = (curr_idx_row + 1, curr_idx_col)
-                new_guard_position = Field(FieldType.GUARD_DOWN)
-            else: # only rotate, don't advance
-                new_idx_row, new_idx_col = (curr_idx_row, curr_idx_col)
-                new_guard_position = Field(FieldType.GUARD_LEFT)
-        elif curr_direction == FieldType.GUARD_LEFT:
-            # try go left
-            if self.move_possible((curr_idx_row, curr_idx_col), (curr_idx_row, curr_idx_col - 1)):
-                new_idx_row, new_idx_col = (curr_idx_row, curr_idx_col - 1)
-                new_guard_position = Field(FieldType.GUARD_LEFT)
-            else: # only rotate, don't advance
-                new_idx_row, new_idx_col = (curr_idx_row, curr_idx_col)
-                new_guard_position = Field(FieldType.GUARD_UP)
-        else:
-            raise ValueError(f"Unexpected guard position: {self.map[curr_idx_row, curr_idx_col]}")
+        if __debug__:
+            counters.count("make_step")
+
+        current_position = self.get_current_position()
+        # print(f"Current element: {self.map.char(current_position)} {current_position}")
+
+        try:
+            facing = guard_codes.index(self.map[current_position])
+        except ValueError:
+            raise ValueError(f"Unexpected guard position: {self.map.char(current_position)}") from None
 
+        new_position = self.map.step(current_position, self.directions[facing])
+        # If a move is not possible (obstacle) only rotate 90 degrees right, don't advance
+        if not self.move_possible(current_position, new_position):
+            new_position, facing = current_position, (facing + 1) % len(guard_codes)
 
         # Check if the new position is valid (is within the map)...
         # If not, return None
-        if not self.is_valid_position((new_idx_row, new_idx_col)):
+        if not self.is_valid_position(new_position):
             return None
         # If yes, set the new position
         else:
-            self.map[new_idx_row, new_idx_col] = new_guard_position
-            self.current_position = (new_idx_row, new_idx_col)
+            self.map[new_position] = guard_codes[facing]
+            self.current_position = new_position
 
-        # if (new_idx_row, new_idx_col) not in self.guards_path_till_exit:
-        #     self.guards_path_till_exit.append((new_idx_row, new_idx_col))
+        # Don't double two consecutive ones (a rotation stays on the same field)...
+        if new_position not in self.guards_path_till_exit[-1:]:
+            self.guards_path_till_exit.append(new_position)
 
-        # Keep it unconditional or maybe don't double two consecutive ones...
-        # self.guards_path_till_exit.append((new_idx_row, new_idx_col))
+        return new_position
 
-        # Yeah, try only not duplicating consecutive ones...
-        if (new_idx_row, new_idx_col) not in self.guards_path_till_exit[-1:]:
-            self.guards_path_till_exit.append((new_idx_row, new_idx_col))
 
-        return new_idx_row, new_idx_col
-
-
-# MISC
-
-def show_elapsed_time(operation: Optional[str] = None):
-    global prev_time
-    cur_time = time.process_time()
-    diff = cur_time - prev_time
-    prev_time = cur_time
-    print(" ".join(elem for elem in [f"[{cur_time}]", operation, f"took: {diff:.7f} sec."] if elem))
+# READ INPUT
+def parse_input(lines: Iterable[str]) -> Room:
+    from aoc_runtime.grid import Grid
 
+    my_room = Room(Grid.from_lines(line.strip() for line in lines))
+    print(f"Initial room:\n{my_room.map}")
 
-# READ INPUT
-def read_input():
-    global input_data
+    return my_room
 
-    # print("reading input... START")
 
-    cnt = 0
-    for line in sys.stdin:
-        cnt += 1
-        # print(f"[{cnt}] {line}")
+def dump_parsed(a_room: Room) -> bytes:
+    from aoc_runtime.grid import dump_grid
 
-        # val = line.strip()
-        # if len(val) > 0:
-        input_data.append(line.strip())
+    return dump_grid(a_room.vanilla_map)
 
-    # print("reading input...
 
+def load_parsed(buffer: memoryview) -> Room:
+    from aoc_runtime.grid import load_grid
 
-def controlled_input_read():
-    read_input_thread = Thread(target=read_input, daemon=True, )
-    read_input_thread.start()
-    read_input_thread.join(timeout=input_timeout)
-    if read_input_thread.is_alive():
-        print(f"Timeout limit ({input_timeout} sec.) reached - exiting")
-        sys.exit(1)
+    return Room(load_grid(buffer))
 
 
 # SOLUTIONS
@@ -265,46 +174,40 @@ def find_solution_a(a_room:Room):
     """
     Predict the path of the guard. How many distinct positions will the guard visit before leaving the mapped area?
     """
-
     # K, we have the Room (with map)
     # We should now simulate the guards walking (path), probably marking the visited fields and update the room's counter...
-    __simulate_guards_path_till_exit(a_room)
+    with span("simulate"):
+        __simulate_guards_path_till_exit(a_room)
 
     # When out of loop - we are at the exit...
-    with np.printoptions(threshold=sys.maxsize, linewidth=265):
-        print(f"Final room:\n{a_room.map.view()}")
+    print(f"Final room:\n{a_room.map}")
 
-    # We need the number of fields which have been visited (unique)
-    # result = len(a_room.find_all([FieldType.VISITED]))
-    result = len(a_room.find_all([FieldType.GUARD_UP, FieldType.GUARD_DOWN, FieldType.GUARD_LEFT, FieldType.GUARD_RIGHT,
-                                  FieldType.CROSSING_UP_RIGHT, FieldType.CROSSING_RIGHT_DOWN, FieldType.CROSSING_DOWN_LEFT, FieldType.CROSSING_LEFT_UP,
-                                  FieldType.TURN_UL, FieldType.TURN_UR, FieldType.TURN_LR, FieldType.TURN_LL]))
+    # We need the number of fields which have been visited (unique) - every one of them holds the guard's direction
+    result = a_room.map.count(bytes(guard_codes))
 
     return result
 
 
-def __determine_guard_direction(offset_pos):
-    if offset_pos[0] == 0 and offset_pos[1] == 1:
-        return FieldType.GUARD_RIGHT
-    elif offset_pos[0] == 0 and offset_pos[1] == -1:
-        return FieldType.GUARD_LEFT
-    elif offset_pos[0] == 1 and offset_pos[1] == 0:
-        return FieldType.GUARD_DOWN
-    elif offset_pos[0] == -1 and offset_pos[1] == 0:
-        return FieldType.GUARD_UP
-    else:
-        raise ValueError(f"Unexpected offset position: {offset_pos}")
+def __determine_guard_direction(a_room, offset_pos):
+    try:
+        return guard_codes[a_room.directions.index(offset_pos)]
+    except ValueError:
+        raise ValueError(f"Unexpected offset position: {offset_pos}") from None
 
 
+@timed("loop_check")
 def __is_in_loop(b_room, new_position, current_visited_indexes, current_visited_directions):
+    if __debug__:
+        counters.count("loop_check")
+
     new_position_index = -1
     # print(f"Entering __is_in_loop for {new_position}, current_visited_indexes: {current_visited_indexes}, current_visited_directions: {current_visited_directions}")
     try:
         while (new_position_index := current_visited_indexes.index(new_position, new_position_index + 1)) != -1:
             # print(f"new_position existing index: {new_position_index}")
             existing_direction = current_visited_directions[new_position_index]
-            # print(f"existing_direction: {existing_direction}, new_position's direction: {b_room.map[new_position].value}")
-            if existing_direction == b_room.map[new_position].value:
+            # print(f"existing_direction: {existing_direction}, new_position's direction: {b_room.map[new_position]}")
+            if existing_direction == b_room.map[new_position]:
                 return True
     except ValueError:
         # print("ValueError...")
@@ -348,41 +251,43 @@ def find_solution_b(a_room:Room):
         is_successful = False
 
         # Set artificial obstacle, perform steps, if hit the current position - it's a loop
-        b_room.map = a_room.map.copy()
-        b_room.map[to_pos] = Field(FieldType.ARTIFICIAL_OBSTACLE)
+        with span("copy_map"):
+            b_room.map = a_room.map.copy()
+        b_room.map[to_pos] = artificial_obstacle_code
         b_room.current_position = from_pos
 
         offset_pos = (to_pos[0] - from_pos[0], to_pos[1] - from_pos[1])
-        b_room.map[from_pos] = Field(__determine_guard_direction(offset_pos))
+        b_room.map[from_pos] = __determine_guard_direction(b_room, offset_pos)
 
         current_visited_indexes: list[tuple[int, int]] = [from_pos]
-        current_visited_directions: list[FieldType] = [b_room.map[from_pos].value]
-
-        while new_position := b_room.make_step():
-            # print(f"current_visited_indexes: {current_visited_indexes}")
-            # print(f"current_visited_directions: {current_visited_directions}")
-            # print(f"new_position: {new_position} {b_room.map[new_position].value}")
-            if new_position in current_visited_indexes:
-                # Are we in a loop?
-                # print(f"We met it before - check the positions")
-
-                if __is_in_loop(b_room, new_position, current_visited_indexes, current_visited_directions):
-                    # We are in a loop
-                    # print(f"Same position - we should be in loop")
-                    b_room.possible_artificial_obstacles.append(to_pos)
-                    is_successful = True
-                    break
+        current_visited_directions: list[int] = [int(b_room.map[from_pos])]
+
+        with span("simulate"):
+            while new_position := b_room.make_step():
+                # print(f"current_visited_indexes: {current_visited_indexes}")
+                # print(f"current_visited_directions: {current_visited_directions}")
+                # print(f"new_position: {new_position} {b_room.map.char(new_position)}")
+                if new_position in current_visited_indexes:
+                    # Are we in a loop?
+                    # print(f"We met it before - check the positions")
+
+                    if __is_in_loop(b_room, new_position, current_visited_indexes, current_visited_directions):
+                        # We are in a loop
+                        # print(f"Same position - we should be in loop")
+                        b_room.possible_artificial_obstacles.append(to_pos)
+                        is_successful = True
+                        break
+                    else:
+                        # Not in a loop
+                        # print(f"Different position - save it")
+                        current_visited_indexes.append(new_position)
+                        current_visited_directions.append(int(b_room.map[new_position]))
+
                 else:
                     # Not in a loop
-                    # print(f"Different position - save it")
+                    # print(f"Never met it before - save it")
                     current_visited_indexes.append(new_position)
-                    current_visited_directions.append(b_room.map[new_position].value)
-
-            else:
-                # Not in a loop
-                # print(f"Never met it before - save it")
-                current_visited_indexes.append(new_position)
-                current_visited_directions.append(b_room.map[new_position].value)
+                    current_visited_directions.append(int(b_room.map[new_position]))
 
         if not is_successful:
             unsuccessful_candidates.add(to_pos)
@@ -400,19 +305,16 @@ def find_solution_b(a_room:Room):
 
     # Fill-in the artificial obstacles
     for position in candidates_set:
-        b_room.map[position] = Field(FieldType.ARTIFICIAL_OBSTACLE)
+        b_room.map[position] = artificial_obstacle_code
 
-    with np.printoptions(threshold=sys.maxsize, linewidth=265):
-        print(f"Room B with artificial obstacles:\n{b_room.map.view()}")
+    print(f"Room B with artificial obstacles:\n{b_room.map}")
 
     # Show also the vanilla room with artificial obstacles
-    vanilla_data = [[Field(FieldType(char)) for char in line] for line in input_data]
-    vanilla_room = Room(vanilla_data)
+    vanilla_room = Room(a_room.vanilla_map.copy())
     for position in candidates_set:
-        vanilla_room.map[position] = Field(FieldType.ARTIFICIAL_OBSTACLE)
+        vanilla_room.map[position] = artificial_obstacle_code
 
-    with np.printoptions(threshold=sys.maxsize, linewidth=265):
-        print(f"Vanilla room with artificial obstacles:\n{vanilla_room.map.view()}")
+    print(f"Vanilla room with artificial obstacles:\n{vanilla_room.map}")
 
 
     result = len(candidates_set)
@@ -420,38 +322,13 @@ def find_solution_b(a_room:Room):
     return result
 
 
+solver = Solver(day_nr, parse_input, find_solution_a, find_solution_b, ParsedCodec(2, dump_parsed, load_parsed),
+                complexity={"parse": 1, "part_a": 1, "part_b": 1.5})
+
+
 # MAIN
 def do_main():
-    show_elapsed_time()
-
-    # print("read input")
-    controlled_input_read()
-
-    show_elapsed_time()
-    # print("len input_data:", len(input_data))
-    # print("    input_data:", input_data)
-
-    # Set the data for Room and Map (as 2-dimensional array), using Field classes...
-    my_data = [[Field(FieldType(char)) for char in line] for line in input_data]
-    my_room = Room(my_data)
-    # my_room.map = np.array(my_data, dtype=Field)
-    # print(f"shape: {my_room.map.shape}")
-    # print(f"nr dimensions: {my_room.map.ndim}")
-    # print(f"my_room:\n{my_room.map.view()}")
-    with np.printoptions(threshold=sys.maxsize, linewidth=265):
-        print(f"Initial room:\n{my_room.map.view()}")
-    # print(f"my_room[6][4]: {my_room.map[6][4]}")
-    # print(f"my_room[6,4]: {my_room.map[6,4]}")
-    # empty_room = Room()
-    # print(f"empty_room.map: {empty_room.map.view()}")
-
-    result_a = find_solution_a(my_room)
-    print(f"result_a: {result_a}")
-    show_elapsed_time()
-
-    result_b = find_solution_b(my_room)
-    print(f"result_b: {result_b}")
-    show_elapsed_time()
+    run_solver(solver)
 
 
 if __name__ == "__main__":
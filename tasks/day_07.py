@@ -1,61 +1,31 @@
 #!/usr/bin/env python3
 import itertools
 import os
-import re
-import sys
-import time
-from threading import Thread
-from typing import Optional
+from typing import Iterable
 
-import more_itertools as mit
+from aoc_runtime import ParsedCodec, Solver, counters, run_solver
+from aoc_runtime.codec import dump_int_rows, load_int_rows
 
 # GLOBALS
-input_data = []
-prev_time = time.process_time()
-input_timeout = 5
 
-filename = os.path.basename(__file__)
-day_token = re.search(r"\d+", filename)
-day_nr = day_token.group() if day_token else "unknown"
-print(f"day_nr: {day_nr}")
-
-
-# MISC
-
-def show_elapsed_time(operation: Optional[str] = None):
-    global prev_time
-    cur_time = time.process_time()
-    diff = cur_time - prev_time
-    prev_time = cur_time
-    print(" ".join(elem for elem in [f"[{cur_time}]", operation, f"took: {diff:.7f} sec."] if elem))
+day_nr = os.path.splitext(os.path.basename(__file__))[0].removeprefix("day_")
 
 
 # READ INPUT
-def read_input():
-    global input_data
-
-    # print("reading input... START")
+def parse_input(lines: Iterable[str]) -> list[list[int]]:
+    """Each equation as [desired_result, operand_1, operand_2, ...]"""
+    # imported here, not at the top - a parse cache hit does not need it at all
+    import more_itertools as mit
 
-    cnt = 0
-    for line in sys.stdin:
-        cnt += 1
-        # print(f"[{cnt}] {line}")
+    input_data = []
 
+    for line in lines:
         val = line.strip()
         # if len(val) > 0:
-        val = list(mit.flatten([elem.strip().split(" ") for elem in val.split(":")]))
+        val = list(map(int, mit.flatten([elem.strip().split(" ") for elem in val.split(":")])))
         input_data.append(val)
 
-    # print("reading input... END")
-
-
-def controlled_input_read():
-    read_input_thread = Thread(target=read_input, daemon=True, )
-    read_input_thread.start()
-    read_input_thread.join(timeout=input_timeout)
-    if read_input_thread.is_alive():
-        print(f"Timeout limit ({input_timeout} sec.) reached - exiting")
-        sys.exit(1)
+    return input_data
 
 
 # SOLUTIONS
@@ -89,6 +59,9 @@ def __has_solution(operands: list[int], desired_result: int, possible_operators:
 
     nr_solutions = 0
     for operation_sequence in operation_sequences:
+        if __debug__:
+            counters.count("operator_sequences")
+
         answer = __compute(operation_sequence, operands)
         if answer == desired_result:
             nr_solutions += 1
@@ -98,59 +71,48 @@ def __has_solution(operands: list[int], desired_result: int, possible_operators:
 
     return nr_solutions > 0
 
-def solve_equations(possible_operators):
+def solve_equations(input_data: list[list[int]], possible_operators):
     solvable_equations_results = []
     for equation in input_data:
-        desired_result = int(equation[0])
-        operands = list(map(int, equation[1:]))
+        desired_result = equation[0]
+        operands = equation[1:]
         # print(f"operands: {operands} - desired_result: {desired_result}")
         if __has_solution(operands, desired_result, possible_operators):
             solvable_equations_results.append(desired_result)
 
     return solvable_equations_results
 
-def find_solution_a():
+def find_solution_a(input_data: list[list[int]]):
     """
     Determine which equations could possibly be true. What is their total calibration result?
     """
     possible_operators = ['+', '*']
-    equations_results = solve_equations(possible_operators)
+    equations_results = solve_equations(input_data, possible_operators)
 
     result = sum(equations_results)
 
     return result
 
-def find_solution_b():
+def find_solution_b(input_data: list[list[int]]):
     """
     sing your new knowledge of elephant hiding spots, determine which equations could possibly be true.
     What is their total calibration result?
     """
     possible_operators = ['+', '*', "||"]
-    equations_results = solve_equations(possible_operators)
+    equations_results = solve_equations(input_data, possible_operators)
 
     result = sum(equations_results)
 
     return result
 
 
-# MAIN
-def do_main():
-    show_elapsed_time()
-
-    # print("read input")
-    controlled_input_read()
+solver = Solver(day_nr, parse_input, find_solution_a, find_solution_b, ParsedCodec(1, dump_int_rows, load_int_rows),
+                complexity={"parse": 1, "part_a": 1, "part_b": 1}, independent_parts=True)
 
-    show_elapsed_time()
-    # print("len input_data:", len(input_data))
-    # print("input_data", input_data)
 
-    result_a = find_solution_a()
-    print(f"result_a: {result_a}")
-    show_elapsed_time()
-
-    result_b = find_solution_b()
-    print(f"result_b: {result_b}")
-    show_elapsed_time()
+# MAIN
+def do_main():
+    run_solver(solver)
 
 
 if __name__ == "__main__":
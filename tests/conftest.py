@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# the day modules and aoc_runtime are imported the way the day scripts import them - from tasks/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tasks"))
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+import day_01
+from day_01 import LocationIndex
+
+
+def full_answers(left_list: list[int], right_list: list[int]) -> tuple[int, int]:
+    """Both answers recomputed from scratch - sorted columns and a plain count"""
+    total_distance = sum(abs(left - right) for left, right in zip(sorted(left_list), sorted(right_list)))
+    similarity_score = sum(left * right_list.count(left) for left in left_list)
+
+    return total_distance, similarity_score
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_location_index_updates_match_full_recomputation(seed):
+    rng = random.Random(seed)
+    # a small range, so there are repeated IDs and ranges spanning several blocks, and within one
+    id_range = (rng.randint(0, 50), rng.randint(100, 400))
+    left_list = [rng.randrange(*id_range) for _ in range(rng.randint(0, 30))]
+    right_list = [rng.randrange(*id_range) for _ in left_list]
+    location_index = LocationIndex.from_pairs(left_list, right_list, id_range)
+    assert (location_index.total_distance, location_index.similarity_score) == full_answers(left_list, right_list)
+
+    for _ in range(300):
+        if left_list and rng.random() < 0.4:
+            # any left ID with any right ID - they need not have been inserted as a pair
+            left_elem = left_list.pop(rng.randrange(len(left_list)))
+            right_elem = right_list.pop(rng.randrange(len(right_list)))
+            location_index.delete(left_elem, right_elem)
+        else:
+            left_elem, right_elem = rng.randrange(*id_range), rng.randrange(*id_range)
+            left_list.append(left_elem)
+            right_list.append(right_elem)
+            location_index.insert(left_elem, right_elem)
+
+        assert location_index.nr_pairs == len(left_list)
+        assert (location_index.total_distance, location_index.similarity_score) == full_answers(left_list, right_list)
+
+
+def test_location_index_from_pairs_matches_inserts():
+    rng = random.Random(2024)
+    left_list = [rng.randint(10000, 99999) for _ in range(500)]
+    right_list = [rng.choice(left_list) if rng.random() < 0.25 else rng.randint(10000, 99999) for _ in left_list]
+
+    built = LocationIndex.from_pairs(left_list, right_list)
+    inserted = LocationIndex()
+    for left_elem, right_elem in zip(left_list, right_list):
+        inserted.insert(left_elem, right_elem)
+
+    assert (built.total_distance, built.similarity_score) == full_answers(left_list, right_list)
+    assert (inserted.total_distance, inserted.similarity_score) == full_answers(left_list, right_list)
+
+
+def test_location_index_rejects_ids_out_of_range():
+    location_index = LocationIndex((0, 100))
+    with pytest.raises(ValueError):
+        location_index.insert(5, 100)
+    with pytest.raises(KeyError):
+        location_index.delete(5, 6)
+    # 32 bit IDs would take tables of billions of entries
+    with pytest.raises(ValueError):
+        LocationIndex.from_pairs([1, 2 ** 32 - 1], [2, 3])
+    with pytest.raises(ValueError):
+        LocationIndex((0, LocationIndex.max_id_range + 1))
+
+
+def test_engines_solve_the_example():
+    text = "3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n"
+    for name in day_01.solver.engine_names:
+        engine = day_01.solver.with_engine(name)
+        state = engine.parse(text.splitlines())
+        assert (engine.part_a(state), engine.part_b(state)) == (11, 31), name
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_stream_engine_matches_default(seed, monkeypatch):
+    rng = random.Random(seed)
+    lines = [f"{rng.randint(1, 500)}   {rng.randint(1, 500)}" for _ in range(rng.randint(1, 400))]
+    # many runs per column - more than one merge pass of them
+    monkeypatch.setattr(day_01, "stream_run_size", 3)
+    monkeypatch.setattr("aoc_runtime.external_sort.default_max_fan_in", 4)
+
+    stream_solver = day_01.solver.with_engine("stream")
+    assert stream_solver.solve(lines) == day_01.solver.solve(lines)
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+import day_02
+from aoc_runtime import InputBuffer
+from day_02 import is_safe, is_safe_with_dampener
+
+
+def random_report(rng: random.Random) -> list[int]:
+    """Mostly monotone with small steps - the reports near the safety rules are the interesting ones"""
+    direction = rng.choice((-1, 1))
+    report = [rng.randint(1, 20)]
+    for _ in range(rng.randint(0, 9)):
+        roll = rng.random()
+        if roll < 0.75:
+            step = direction * rng.randint(1, 3)
+        elif roll < 0.85:
+            step = 0
+        elif roll < 0.95:
+            step = -direction * rng.randint(1, 3)
+        else:
+            step = rng.choice((-1, 1)) * rng.randint(4, 6)
+        report.append(report[-1] + step)
+
+    return report
+
+
+def dampener_by_removal(report: list[int]) -> bool:
+    """The dampener by definition - safe if removing any one level (or none) leaves a safe report"""
+    return is_safe(report) or any(is_safe(report[:i] + report[i + 1:]) for i in range(len(report)))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_dampener_matches_removing_each_level(seed):
+    rng = random.Random(seed)
+    for _ in range(2000):
+        report = random_report(rng)
+        assert is_safe_with_dampener(report) == dampener_by_removal(report), report
+
+
+@pytest.mark.parametrize("report, safe", [
+    ([7, 6, 4, 2, 1], True),
+    ([1, 2, 7, 8, 9], False),
+    ([9, 7, 6, 2, 1], False),
+    ([1, 3, 2, 4, 5], True),
+    ([8, 6, 4, 4, 1], True),
+    ([1, 3, 6, 7, 9], True),
+    # the first or the last level is the bad one
+    ([10, 1, 2, 3], True),
+    ([1, 2, 3, 10], True),
+    ([5], True),
+])
+def test_dampener_examples(report, safe):
+    assert is_safe_with_dampener(report) == safe
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_numpy_engine_matches_scalar(seed):
+    rng = random.Random(seed)
+    reports = [random_report(rng) for _ in range(rng.randint(1, 500))]
+    lines = [" ".join(map(str, report)) for report in reports]
+
+    default_engine = day_02.solver
+    numpy_engine = day_02.solver.with_engine("numpy")
+    expected = default_engine.solve(lines)
+    assert numpy_engine.solve(lines) == expected
+    # through the parse cache's binary form too
+    state = numpy_engine.parsed_codec.load(memoryview(numpy_engine.parsed_codec.dump(numpy_engine.parse(lines))))
+    assert (numpy_engine.part_a(state), numpy_engine.part_b(state)) == expected
+
+
+@pytest.mark.parametrize("text", ["", "\n", "  \n\n"])
+def test_engines_on_empty_input(text):
+    for name in day_02.solver.engine_names:
+        assert day_02.solver.with_engine(name).solve(InputBuffer.from_text(text)) == (0, 0), name
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from aoc_runtime.external_sort import RunWriter, merge_runs
+
+
+def write_runs(directory, values: list[int], run_size: int):
+    writer = RunWriter(directory, "values", run_size)
+    for value in values:
+        writer.append(value)
+
+    return writer.close()
+
+
+@pytest.mark.parametrize("nr_values, run_size, max_fan_in", [
+    (0, 4, 2), (1, 4, 2), (100, 7, 128), (1000, 3, 2), (1000, 3, 5), (1000, 10, 10), (1000, 10, 11),
+])
+def test_merge_runs_sorts_every_value(tmp_path, nr_values, run_size, max_fan_in):
+    rng = random.Random(nr_values * run_size * max_fan_in)
+    values = [rng.randint(-1000, 1000) for _ in range(nr_values)]
+    paths = write_runs(tmp_path, values, run_size)
+
+    assert list(merge_runs(paths, chunk_size=4, max_fan_in=max_fan_in)) == sorted(values)
+    # the given runs stay, the intermediate ones are gone
+    assert sorted(tmp_path.iterdir()) == sorted(paths)
+
+
+def test_merge_runs_opens_at_most_max_fan_in_runs(tmp_path, monkeypatch):
+    import builtins
+
+    values = list(range(500, 0, -1))
+    paths = write_runs(tmp_path, values, 5)
+    open_files = []
+    max_open = 0
+    real_open = builtins.open
+
+    def counting_open(*args, **kwargs):
+        nonlocal max_open
+        file = real_open(*args, **kwargs)
+        open_files.append(file)
+        max_open = max(max_open, sum(not open_file.closed for open_file in open_files))
+        return file
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    assert list(merge_runs(paths, chunk_size=8, max_fan_in=4)) == sorted(values)
+    # the runs read, and the run written
+    assert max_open <= 4 + 1
+
+
+def test_merge_runs_rejects_a_fan_in_below_two(tmp_path):
+    with pytest.raises(ValueError):
+        merge_runs(write_runs(tmp_path, [3, 2, 1], 1), max_fan_in=1)
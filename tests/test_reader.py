@@ -0,0 +1,85 @@
+import bz2
+import gzip
+import lzma
+import os
+import threading
+
+import pytest
+
+from aoc_runtime.reader import InputBuffer, read_path, read_stream, stream_input, stream_path
+
+text = "3   4\r\n4   3\n\n2   5\n1   3\r"
+lines = ["3   4", "4   3", "", "2   5", "1   3\r"]
+compressors = {"plain": bytes, "gzip": gzip.compress, "xz": lzma.compress, "bz2": bz2.compress}
+
+
+def pipe_reader(data: bytes):
+    """The read end of a pipe, fed the data from a thread (a pipe's buffer holds less than a big input)"""
+    read_fd, write_fd = os.pipe()
+
+    def feed():
+        with open(write_fd, "wb") as file:
+            file.write(data)
+
+    threading.Thread(target=feed, daemon=True).start()
+
+    return open(read_fd, "rb")
+
+
+def read_as(data: bytes, source: str, tmp_path) -> list[str]:
+    """The lines of the data, read the given way"""
+    if source in ("path", "path stream"):
+        path = tmp_path / "input"
+        path.write_bytes(data)
+        return list(read_path(path) if source == "path" else stream_path(path))
+    with pipe_reader(data) as stream:
+        return list(read_stream(stream) if source == "pipe" else stream_input(stream))
+
+
+sources = ["path", "path stream", "pipe", "pipe stream"]
+
+
+@pytest.mark.parametrize("source", sources)
+@pytest.mark.parametrize("codec", compressors)
+def test_inputs_read_the_same_lines(tmp_path, codec, source):
+    assert read_as(compressors[codec](text.encode()), source, tmp_path) == lines
+
+
+@pytest.mark.parametrize("source", sources)
+@pytest.mark.parametrize("codec", ["gzip", "xz", "bz2"])
+def test_concatenated_streams_are_read_through(tmp_path, codec, source):
+    compress = compressors[codec]
+    data = compress(b"1   2\n3   4\n") + compress(b"5   6\n")
+
+    assert read_as(data, source, tmp_path) == ["1   2", "3   4", "5   6"]
+
+
+@pytest.mark.parametrize("source", sources)
+@pytest.mark.parametrize("codec", ["gzip", "xz", "bz2"])
+def test_truncated_streams_are_rejected(tmp_path, codec, source):
+    data = compressors[codec](os.urandom(5000).hex().encode())
+    with pytest.raises(EOFError):
+        read_as(data[:len(data) // 2], source, tmp_path)
+    # the second stream cut off, the first one complete
+    with pytest.raises(EOFError):
+        read_as(compressors[codec](b"1   2\n") + data[:len(data) // 2], source, tmp_path)
+
+
+@pytest.mark.parametrize("source", sources)
+def test_large_inputs_span_chunks(tmp_path, source, monkeypatch):
+    monkeypatch.setattr("aoc_runtime.reader.read_chunk_size", 1000)
+    big_lines = [f"{nr}   {nr * 7}" for nr in range(5000)]
+    data = gzip.compress("\n".join(big_lines).encode())
+
+    assert read_as(data, source, tmp_path) == big_lines
+
+
+@pytest.mark.parametrize("source", sources)
+def test_empty_inputs_have_no_lines(tmp_path, source):
+    assert read_as(b"", source, tmp_path) == []
+
+
+def test_stream_lines_match_iteration():
+    buffer = InputBuffer.from_text(text)
+    assert list(buffer.stream_lines()) == list(buffer) == lines
+    assert buffer.nbytes == len(text)
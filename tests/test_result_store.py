@@ -0,0 +1,26 @@
+from aoc_runtime import result_store
+
+
+def test_results_file_is_created_once_and_never_overwritten(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_store, "results_dir", tmp_path)
+    results_path = tmp_path / "day_04.txt"
+
+    assert result_store.write_results_file("04", 2603, 1965)
+    reference = results_path.read_text()
+    assert result_store.read_results_file("04") == {"a": "2603", "b": "1965"}
+    assert result_store.results_file_mismatches("04", 2603, 1965) == []
+
+    # a wrong answer gets reported, the reference stays
+    assert not result_store.write_results_file("04", 2604, 1965)
+    assert results_path.read_text() == reference
+    assert result_store.results_file_mismatches("04", 2604, 1965) == ["result_a: 2604 (recorded: 2603)"]
+
+
+def test_results_file_keeps_its_other_content(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_store, "results_dir", tmp_path)
+    reference = "day_nr: 04\n[0.03125] took: 0.0000000 sec.\nresult_a: 2603\nresult_b: 1965\n"
+    (tmp_path / "day_04.txt").write_text(reference)
+
+    assert not result_store.write_results_file("04", 2603, 1966)
+    assert (tmp_path / "day_04.txt").read_text() == reference
+    assert result_store.results_file_mismatches("04", 2603, 1966) == ["result_b: 1966 (recorded: 1965)"]
@@ -0,0 +1,38 @@
+import day_01
+from aoc_runtime.runner import run_solver
+from aoc_runtime.solver import Solver
+
+
+def parse_numbers(lines) -> list[int]:
+    return [int(line) for line in lines]
+
+
+def sum_and_clear(numbers: list[int]) -> int:
+    """A part a that leaves nothing of the state behind for part b"""
+    total = sum(numbers)
+    numbers.clear()
+
+    return total
+
+
+def count_numbers(numbers: list[int]) -> int:
+    return len(numbers)
+
+
+def test_parallel_parts_get_the_state_as_parsed(tmp_path):
+    solver = Solver("00", parse_numbers, sum_and_clear, count_numbers, independent_parts=True)
+    input_path = tmp_path / "numbers.txt"
+    input_path.write_text("".join(f"{nr}\n" for nr in range(1000)))
+
+    for _ in range(5):
+        assert run_solver(solver, argv=[str(input_path), "--parts", "parallel", "--no-cache"]) == (499500, 1000)
+
+
+def test_parallel_parts_match_sequential(tmp_path):
+    input_path = tmp_path / "day_01.txt"
+    input_path.write_text("3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n")
+
+    for engine in day_01.solver.engine_names:
+        argv = [str(input_path), "--no-cache", "--engine", engine]
+        assert run_solver(day_01.solver, argv=argv + ["--parts", "parallel"]) == (11, 31), engine
+        assert run_solver(day_01.solver, argv=argv + ["--parts", "sequential"]) == (11, 31), engine